@@ -0,0 +1,370 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+import config
+from parser import parse_document
+from taxonomy import TaxonomyHits, call_with_taxonomy, get_taxonomy, scan_text, taxonomy_for
+from skill_extractor import get_skill_gap, job_skill_weights
+from ats_scorer import calculate_ats_score, compile_jd_keywords
+from semantic_skills import semantic_skills, with_semantic_skills
+from metrics import timed
+
+
+class JobProfile(NamedTuple):
+    """
+    Everything derived from a job description alone —
+    computed once and reused for every resume scored against it
+    """
+    text: str
+    hits: TaxonomyHits
+    skills: frozenset
+    keywords: list  # (keyword, compiled pattern) pairs
+    semantic: dict = None  # semantic skill matches, when SEMANTIC_SKILLS is on
+    skill_weights: object = None  # category weight per taxonomy skill the JD requires (ndarray)
+    taxonomy_version: str = None  # the taxonomy hits / skill_weights come from
+
+
+def prepare_job(job_description: str) -> JobProfile:
+    """
+    Scan the JD once and precompile its keyword patterns
+    """
+    taxonomy = get_taxonomy()  # one version for the whole profile
+    with timed("prepare_job"):
+        hits = taxonomy.scan(job_description)
+        keywords = compile_jd_keywords(job_description, hits)
+
+    semantic = None
+    if config.SEMANTIC_SKILLS:
+        with timed("semantic_skills"):
+            semantic = semantic_skills(job_description, hits)
+        hits = with_semantic_skills(hits, semantic)
+
+    return JobProfile(
+        text=job_description,
+        hits=hits,
+        skills=frozenset(hits.skills),
+        keywords=keywords,
+        semantic=semantic,
+        skill_weights=job_skill_weights(hits.skills, taxonomy),
+        taxonomy_version=taxonomy.version,
+    )
+
+
+def analyze_skills(resume_text: str, job: JobProfile) -> dict:
+    """
+    Stage 1 — skill gap (plus semantic skill matches when enabled)
+    Runs on the taxonomy the job was prepared with while this process
+    still has it; otherwise the JD's weights are redone for the live one
+    """
+    taxonomy = taxonomy_for(job.taxonomy_version)
+    job_weights = job.skill_weights
+    if taxonomy.version != job.taxonomy_version or job_weights is None:
+        job_weights = job_skill_weights(job.skills, taxonomy)
+
+    with timed("taxonomy_scan"):
+        resume_hits = taxonomy.scan(resume_text)
+
+    resume_semantic = None
+    if config.SEMANTIC_SKILLS:
+        with timed("semantic_skills"):
+            resume_semantic = semantic_skills(resume_text, resume_hits)
+        resume_hits = with_semantic_skills(resume_hits, resume_semantic)
+
+    with timed("skill_gap"):
+        skill_results = get_skill_gap(
+            resume_text,
+            job.text,
+            resume_hits,
+            job.hits,
+            job_weights,
+            taxonomy
+        )
+    skill_results["taxonomy_version"] = taxonomy.version
+
+    if config.SEMANTIC_SKILLS:
+        skill_results["semantic"] = {"resume": resume_semantic, "job": job.semantic}
+    return skill_results
+
+
+def analyze_ats(resume_text: str, job: JobProfile, skill_results: dict) -> dict:
+    """
+    Stage 2 — ATS score, which builds on the skill match percentage
+    (category-weighted when WEIGHTED_SKILL_SCORE is on)
+    """
+    skill_percent = skill_results[
+        "weighted_skill_match_percent" if config.WEIGHTED_SKILL_SCORE else "skill_match_percent"
+    ]
+    return calculate_ats_score(
+        resume_text,
+        job.text,
+        skill_percent,
+        job.hits,
+        job.keywords
+    )
+
+
+def analyze_text(resume_text: str, job: JobProfile) -> dict:
+    """
+    Skill gap + ATS score for one resume text against a prepared JD
+    """
+    skill_results = analyze_skills(resume_text, job)
+    ats_results = analyze_ats(resume_text, job, skill_results)
+    return {"skills": skill_results, "ats": ats_results}
+
+
+def score_resume(resume_text: str, job_description: str) -> dict:
+    """
+    analyze_text for a raw JD — one self-contained executor job
+    """
+    return analyze_text(resume_text, prepare_job(job_description))
+
+
+def semantic_sections(resume_text: str, job_description: str) -> dict:
+    """
+    Embedding-based match score and most / least relevant resume sections
+    (needs the embedding model)
+    """
+    from embedder import embed_resume_and_job
+    from scorer import analyze_match
+
+    return analyze_match(embed_resume_and_job(resume_text, job_description))
+
+
+# -----------------------------
+# Response sections — /analyze returns all of them at once,
+# /analyze/stream sends each as soon as its stage finishes
+# -----------------------------
+def parse_section(parse_result: dict) -> dict:
+    return {
+        "word_count": parse_result["word_count"],
+        "pages_truncated": parse_result["pages_truncated"],
+    }
+
+
+def skills_section(skill_results: dict) -> dict:
+    section = {
+        "matched_skills": skill_results["matched_skills"],
+        "missing_skills": skill_results["missing_skills"],
+        "extra_skills": skill_results["extra_skills"],
+        "skill_match_percent": skill_results["skill_match_percent"],
+        "weighted_skill_match_percent": skill_results["weighted_skill_match_percent"],
+        "total_job_skills": skill_results["total_job_skills"],
+        "total_matched": skill_results["total_matched"],
+        "total_missing": skill_results["total_missing"],
+    }
+    if "semantic" in skill_results:
+        # skills found by phrase similarity, with the phrase and its score
+        section["semantic_skills"] = skill_results["semantic"]
+    return section
+
+
+def ats_section(ats_results: dict) -> dict:
+    return {
+        "ats_score": ats_results["ats_score"],
+        "ats_label": ats_results["ats_label"],
+        "ats_breakdown": ats_results["breakdown"],
+        "matched_keywords": ats_results["matched_keywords"],
+        "missing_keywords": ats_results["missing_keywords"],
+    }
+
+
+def build_response(parse_result: dict, results: dict) -> dict:
+    """
+    Shape pipeline results into the /analyze response body
+    """
+    return {
+        "success": True,
+        **ats_section(results["ats"]),
+        **skills_section(results["skills"]),
+        **parse_section(parse_result),
+        "taxonomy_version": results["skills"].get("taxonomy_version", get_taxonomy().version),
+    }
+
+
+def result_key(resume_key: str, job_description: str) -> str:
+    """
+    Cache key for a full analysis — the response is fully determined by
+    the resume (content hash), the JD and the taxonomy version, so a
+    taxonomy change automatically misses every older entry
+    """
+    jd_hash = hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+    key = f"{resume_key}|{jd_hash}|{get_taxonomy().version}"
+    if config.SEMANTIC_SKILLS:
+        key += f"|semantic:{config.SEMANTIC_SKILL_THRESHOLD}"
+    if config.WEIGHTED_SKILL_SCORE:
+        key += "|weighted"
+    return key
+
+
+def parse_upload(file_bytes: bytes, filename: str) -> dict:
+    """
+    parse_document with the configured page / character budgets and PDF backend
+    """
+    with timed("parse_document"):
+        return parse_document(
+            file_bytes,
+            filename,
+            config.PARSE_MAX_PAGES,
+            config.PARSE_MAX_CHARS,
+            config.PDF_BACKEND
+        )
+
+
+def analyze_document(file_bytes: bytes, filename: str, job: JobProfile) -> dict:
+    """
+    Parse one resume file and score it against a prepared JD
+    Returns the /analyze response body, or {"success": False, "error": ...,
+    "retryable": ...} when the file couldn't be parsed
+    """
+    parse_result = parse_upload(file_bytes, filename)
+    if not parse_result["success"]:
+        return {"success": False, "error": parse_result["error"],
+                "retryable": parse_result.get("retryable", False)}
+
+    results = analyze_text(parse_result["clean_text"], job)
+    return build_response(parse_result, results)
+
+
+def resume_skills(resume_text: str) -> list:
+    """
+    Canonical skills in a resume — the resume_skills of get_skill_gap,
+    without needing a JD
+    """
+    with timed("taxonomy_scan"):
+        hits = scan_text(resume_text)
+    if config.SEMANTIC_SKILLS:
+        with timed("semantic_skills"):
+            hits = with_semantic_skills(hits, semantic_skills(resume_text, hits))
+    return sorted(hits.skills)
+
+
+def index_document(file_bytes: bytes, filename: str) -> dict:
+    """
+    Parse one resume file for the candidate index
+    Returns {"success", "skills", "word_count"}, or {"success": False, "error": ...}
+    """
+    parse_result = parse_upload(file_bytes, filename)
+    if not parse_result["success"]:
+        return {"success": False, "error": parse_result["error"]}
+    return {
+        "success": True,
+        "skills": resume_skills(parse_result["clean_text"]),
+        "word_count": parse_result["word_count"],
+    }
+
+
+# -----------------------------
+# Batch scoring (one JD, many resumes)
+# -----------------------------
+
+# set by init_batch_worker, and only inside dedicated pool processes
+# (bulk_rank) — never in a process that serves requests
+_worker_job = None
+
+
+def init_batch_worker(job: JobProfile):
+    """
+    ProcessPoolExecutor initializer: ship the JD to each worker once
+    """
+    global _worker_job
+    _worker_job = job
+
+
+def analyze_batch_item(item: tuple, job: JobProfile = None) -> dict:
+    """
+    Score one (filename, file_bytes) — against `job`, or the JD set by
+    init_batch_worker in this pool process. Failures come back as
+    {"success": False, ...} rather than raising.
+    """
+    filename, file_bytes = item
+    try:
+        result = analyze_document(file_bytes, filename, job if job is not None else _worker_job)
+    except Exception as e:
+        result = {"success": False, "error": f"Analysis failed: {str(e)}"}
+    result["filename"] = filename
+    return result
+
+
+def analyze_batch_chunk(job: JobProfile, items: list) -> list:
+    # one pool task: the JD is pickled once per chunk, not per resume
+    return [analyze_batch_item(item, job) for item in items]
+
+
+# shared by every analyze_batch call — created on first use
+_batch_pool = None
+_batch_pool_lock = threading.Lock()
+
+
+def get_batch_pool() -> ProcessPoolExecutor:
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _batch_pool
+
+
+def rank_results(results: list) -> dict:
+    """
+    Split batch results into ranked successes (by ats_score) and failures
+    """
+    ranked = sorted(
+        (r for r in results if r["success"]),
+        key=lambda r: r["ats_score"],
+        reverse=True
+    )
+    for position, result in enumerate(ranked, start=1):
+        result["rank"] = position
+
+    failed = [
+        {"filename": r["filename"], "error": r["error"]}
+        for r in results if not r["success"]
+    ]
+
+    return {
+        "success": True,
+        "total": len(results),
+        "total_ranked": len(ranked),
+        "total_failed": len(failed),
+        "ranked": ranked,
+        "failed": failed,
+    }
+
+
+def analyze_batch(
+    job_description: str,
+    files: list,
+    max_workers: int = None
+) -> dict:
+    """
+    Main batch function — score many resumes against one job description
+    files — list of (filename, file_bytes)
+    The JD is prepared once and shipped with each chunk of resumes to a
+    shared process pool; resumes are scored in parallel and ranked by ats_score
+    """
+    job = prepare_job(job_description)
+    workers = min(max_workers or os.cpu_count() or 1, len(files))
+
+    if workers <= 1:
+        results = [analyze_batch_item(item, job) for item in files]
+    else:
+        # a few chunks per worker keeps IPC overhead low while still
+        # balancing uneven file sizes; at most `workers` run at once
+        size = max(1, len(files) // (workers * 4))
+        chunks = [files[i:i + size] for i in range(0, len(files), size)]
+        pool = get_batch_pool()
+        futures = {}
+        pending = set()
+        for index, chunk in enumerate(chunks):
+            if len(pending) >= workers:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+            future = pool.submit(call_with_taxonomy, job.taxonomy_version, analyze_batch_chunk, job, chunk)
+            futures[future] = index
+            pending.add(future)
+        wait(pending)
+        ordered = sorted(futures, key=futures.get)
+        results = [result for future in ordered for result in future.result()]
+
+    return rank_results(results)
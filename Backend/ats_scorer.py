@@ -1,19 +1,8 @@
-import json
-import os
 import re
+from typing import NamedTuple
 
-
-# Load skills dictionary once at module level (same source as skill_extractor.py)
-_SKILLS_PATH = os.path.join(os.path.dirname(__file__), 'skills.json')
-with open(_SKILLS_PATH, 'r') as _f:
-    _SKILLS_DATA = json.load(_f)
-
-# Flat list of all canonical skill names + aliases (original casing preserved)
-_SKILL_PATTERNS: list = []
-for _cat in _SKILLS_DATA["technical_skills_taxonomy"].values():
-    for _skill in _cat["skills"]:
-        _SKILL_PATTERNS.append(_skill["name"])
-        _SKILL_PATTERNS.extend(_skill.get("aliases", []))
+from metrics import timed
+from taxonomy import TaxonomyHits, scan_text
 
 
 _BLACKLIST = {
@@ -36,7 +25,7 @@ _BLACKLIST = {
 }
 
 
-def extract_keywords(text: str) -> list:
+def extract_keywords(text: str, hits: TaxonomyHits = None) -> list:
     """
     Extract meaningful technical keywords from JD text.
 
@@ -44,14 +33,14 @@ def extract_keywords(text: str) -> list:
     Rule 2 — supplementary regex for CamelCase tools, tech suffixes, acronyms
     Rule 3 — hard blacklist of non-technical words
     Rule 4 — deduplicate, min 2 chars, no pure numbers, cap at 40
-    """
-    found = []
 
-    # Rule 1: match every known skill / alias against the JD (case-insensitive)
-    for pattern_str in _SKILL_PATTERNS:
-        escaped = re.escape(pattern_str)
-        if re.search(r'\b' + escaped + r'\b', text, re.IGNORECASE):
-            found.append(pattern_str)
+    Pass `hits` from taxonomy.scan_text to reuse an existing scan of the JD
+    """
+    # Rule 1: every known skill / alias found in the JD (case-insensitive),
+    # from the single taxonomy scan
+    if hits is None:
+        hits = scan_text(text)
+    found = list(hits.keywords)
 
     # Rule 2a: CamelCase words (e.g. SQLAlchemy, FastAPI)
     found.extend(re.findall(r'\b(?:[A-Z][a-z]+){2,}\w*\b', text))
@@ -82,21 +71,148 @@ def extract_keywords(text: str) -> list:
     return result
 
 
-def keyword_match_score(resume_text: str, jd_text: str) -> dict:
+def compile_jd_keywords(jd_text: str, jd_hits: TaxonomyHits = None) -> list:
+    """
+    Extract the JD keywords and compile their search patterns.
+    Returns list of (keyword, compiled pattern) — build once per JD and
+    pass to keyword_match_score when scoring many resumes.
+    """
+    return [
+        (keyword, re.compile(re.escape(keyword), re.IGNORECASE))
+        for keyword in extract_keywords(jd_text, jd_hits)
+    ]
+
+
+# -----------------------------
+# Single-pass resume scan
+# -----------------------------
+ACTION_WORDS = (
+    'improved', 'achieved', 'reduced', 'increased',
+    'built', 'designed', 'developed', 'deployed',
+)
+
+# section structure: each group found scores 25
+SECTION_GROUPS = (
+    ('experience', 'project', 'projects'),
+    ('education',),
+    ('skill', 'skills'),
+    ('summary', 'objective', 'career'),
+)
+_SECTION_OF = {word: group for group, words in enumerate(SECTION_GROUPS) for word in words}
+
+# quantified achievements: "40%", "12.5 %", "3 services"
+_PERCENT = re.compile(r'\d+\.?\d*\s*%')
+_COUNTED = re.compile(r'\b\d+\s+[a-zA-Z]+')
+
+# one scan of the lowercased resume finds every action / section word and
+# the start of every digit run; the metric patterns are then only tried
+# where a digit run starts
+_RESUME_TOKENS = re.compile(
+    r'\b(' + '|'.join(ACTION_WORDS + tuple(_SECTION_OF)) + r')\b|\d+'
+)
+
+# İ ı ſ — the only characters that match ASCII letters case-insensitively
+# without lowercasing to one. Text containing them is scanned with the
+# per-component regexes so results never depend on which path ran.
+_CASE_FOLD_ODD = re.compile('[\u0130\u0131\u017f]')
+
+_ACTION_PATTERNS = [re.compile(r'\b' + word + r'\b', re.IGNORECASE) for word in ACTION_WORDS]
+_SECTION_PATTERNS = [
+    re.compile(r'\b(' + '|'.join(words) + r')\b') for words in SECTION_GROUPS
+]
+
+
+class ResumeScan(NamedTuple):
+    """
+    Everything the ATS components need from a resume, from one pass
+    """
+    lowered: str          # resume_text.lower(), for keyword membership
+    action_words: int     # ACTION_WORDS occurrences (whole words, any case)
+    metrics: int          # percentages + counted quantities
+    sections: frozenset   # indexes into SECTION_GROUPS that were found
+    case_safe: bool       # lowercase comparisons agree with re.IGNORECASE
+
+
+def _scan_resume_regex(resume_text: str, lowered: str) -> ResumeScan:
+    # reference path: one regex per component
+    return ResumeScan(
+        lowered=lowered,
+        action_words=sum(len(pattern.findall(resume_text)) for pattern in _ACTION_PATTERNS),
+        metrics=len(_PERCENT.findall(resume_text)) + len(_COUNTED.findall(resume_text)),
+        sections=frozenset(
+            group for group, pattern in enumerate(_SECTION_PATTERNS) if pattern.search(lowered)
+        ),
+        case_safe=False,
+    )
+
+
+def scan_resume(resume_text: str) -> ResumeScan:
+    """
+    Tokenize the resume once for the keyword, section and achievement
+    components — same counts as running each component's regexes
+    """
+    lowered = resume_text.lower()
+    if _CASE_FOLD_ODD.search(resume_text):
+        return _scan_resume_regex(resume_text, lowered)
+
+    action_words = 0
+    metrics = 0
+    sections = set()
+    percent_end = 0  # a percentage like "1.5%" also covers the digit run "5"
+    for match in _RESUME_TOKENS.finditer(lowered):
+        word = match.group(1)
+        if word is not None:
+            if word in _SECTION_OF:
+                sections.add(_SECTION_OF[word])
+            else:
+                action_words += 1
+            continue
+
+        # lowercasing kept every offset, so the original text lines up
+        start = match.start()
+        if start >= percent_end:
+            percent = _PERCENT.match(resume_text, start)
+            if percent:
+                metrics += 1
+                percent_end = percent.end()
+        if _COUNTED.match(resume_text, start):
+            metrics += 1
+
+    return ResumeScan(lowered, action_words, metrics, frozenset(sections), True)
+
+
+def keyword_match_score(
+    resume_text: str,
+    jd_text: str,
+    jd_hits: TaxonomyHits = None,
+    jd_keywords: list = None,
+    scan: ResumeScan = None
+) -> dict:
     """
     Component 1 — Keyword Match Score (40% weight).
+    Pass `scan` from scan_resume to reuse the lowercased resume.
     """
-    jd_keywords = extract_keywords(jd_text)
+    if jd_keywords is None:
+        jd_keywords = compile_jd_keywords(jd_text, jd_hits)
 
     if not jd_keywords:
         return {"score": 0.0, "matched": [], "missing": []}
 
+    if scan is not None:
+        lowered, case_safe = scan.lowered, scan.case_safe
+    else:
+        lowered, case_safe = resume_text.lower(), not _CASE_FOLD_ODD.search(resume_text)
+
     matched = []
     missing = []
 
-    for keyword in jd_keywords:
-        pattern = re.escape(keyword)
-        if re.search(pattern, resume_text, re.IGNORECASE):
+    for keyword, pattern in jd_keywords:
+        # plain substring test where it is equivalent to the IGNORECASE search
+        if case_safe and keyword.isascii():
+            found = keyword.lower() in lowered
+        else:
+            found = pattern.search(resume_text) is not None
+        if found:
             matched.append(keyword)
         else:
             missing.append(keyword)
@@ -105,41 +221,22 @@ def keyword_match_score(resume_text: str, jd_text: str) -> dict:
     return {"score": score, "matched": matched, "missing": missing}
 
 
-def section_structure_score(resume_text: str) -> float:
+def section_structure_score(resume_text: str, scan: ResumeScan = None) -> float:
     """
     Component 3 — Section Structure Score (15% weight).
     """
-    text_lower = resume_text.lower()
-    total = 0
+    if scan is None:
+        scan = scan_resume(resume_text)
+    return float(25 * len(scan.sections))
 
-    if re.search(r'\b(experience|projects?)\b', text_lower):
-        total += 25
-    if re.search(r'\beducation\b', text_lower):
-        total += 25
-    if re.search(r'\bskills?\b', text_lower):
-        total += 25
-    if re.search(r'\b(summary|objective|career)\b', text_lower):
-        total += 25
 
-    return float(total)
-
-
-def achievement_score(resume_text: str) -> float:
+def achievement_score(resume_text: str, scan: ResumeScan = None) -> float:
     """
     Component 4 — Achievement Score (15% weight).
     """
-    count = 0
-
-    count += len(re.findall(r'\d+\.?\d*\s*%', resume_text))
-    count += len(re.findall(r'\b\d+\s+[a-zA-Z]+', resume_text))
-
-    action_words = [
-        'improved', 'achieved', 'reduced', 'increased',
-        'built', 'designed', 'developed', 'deployed',
-    ]
-    for word in action_words:
-        count += len(re.findall(r'\b' + word + r'\b', resume_text, re.IGNORECASE))
-
+    if scan is None:
+        scan = scan_resume(resume_text)
+    count = scan.metrics + scan.action_words
     return min(count * 10, 100.0)
 
 
@@ -159,23 +256,38 @@ def get_ats_label(score: float) -> str:
 def calculate_ats_score(
     resume_text: str,
     job_description: str,
-    skill_match_percent: float
+    skill_match_percent: float,
+    job_hits: TaxonomyHits = None,
+    job_keywords: list = None
 ) -> dict:
     """
     Main function — calculates weighted ATS score from 4 components.
+    Pass `job_hits` from taxonomy.scan_text to reuse an existing JD scan,
+    or `job_keywords` from compile_jd_keywords to skip JD keyword extraction.
     """
+    # one pass over the resume feeds components 1, 3 and 4
+    with timed("resume_scan"):
+        scan = scan_resume(resume_text)
+
     # Component 1: Keyword Match (40%)
-    kw_result = keyword_match_score(resume_text, job_description)
+    with timed("keyword_match"):
+        kw_result = keyword_match_score(
+            resume_text,
+            job_description,
+            job_hits,
+            job_keywords,
+            scan
+        )
     keyword_score = kw_result["score"]
 
     # Component 2: Skill Coverage (30%)
     skill_score = round(skill_match_percent, 2)
 
     # Component 3: Section Structure (15%)
-    section_score = section_structure_score(resume_text)
+    section_score = section_structure_score(resume_text, scan)
 
     # Component 4: Achievements (15%)
-    ach_score = achievement_score(resume_text)
+    ach_score = achievement_score(resume_text, scan)
 
     # Weighted final score
     ats_score = round(
@@ -0,0 +1,167 @@
+import bisect
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+# upper bounds of the batch-size histogram buckets (last one catches the rest)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, float("inf"))
+
+
+class EmbeddingBatcher:
+    """
+    Dynamic micro-batching in front of an encode function.
+
+    Callers from any thread submit lists of texts and get a Future back.
+    A single worker thread takes the first waiting request, keeps
+    collecting more for up to max_wait_ms or until max_batch_size texts
+    are queued, runs ONE encode over all of them and hands each caller
+    its own rows. Concurrent requests therefore share a forward pass.
+    No batch exceeds max_batch_size texts: a request that doesn't fit
+    starts the next batch, and one larger than max_batch_size is split
+    into max_batch_size pieces whose rows are joined back together.
+    """
+
+    def __init__(self, encode_fn, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        self._encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue = queue.Queue()
+        self._held = None  # request that didn't fit the last batch
+        self._worker = None
+        self._start_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._batch_sizes = [0] * len(BATCH_SIZE_BUCKETS)
+        self._batches = 0
+        self._texts = 0
+        self._queue_latency = deque(maxlen=1000)  # seconds, most recent requests
+
+    def _ensure_worker(self):
+        if self._worker is None:
+            with self._start_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name="embedding-batcher", daemon=True
+                    )
+                    self._worker.start()
+
+    def submit(self, texts: list) -> Future:
+        """
+        Queue texts for encoding — the Future resolves to an
+        array of shape (len(texts), dim)
+        """
+        future = Future()
+        if not texts:
+            future.set_result(np.empty((0, 0), dtype=np.float32))
+            return future
+
+        self._ensure_worker()
+        texts = list(texts)
+        enqueued = time.perf_counter()
+        if len(texts) <= self.max_batch_size:
+            self._queue.put((texts, future, enqueued))
+            return future
+
+        pieces = [Future() for _ in range(0, len(texts), self.max_batch_size)]
+
+        def join(_):
+            # runs on the worker thread as each piece finishes
+            if future.done() or not all(piece.done() for piece in pieces):
+                return
+            errors = [piece.exception() for piece in pieces if piece.exception() is not None]
+            if errors:
+                future.set_exception(errors[0])
+            else:
+                future.set_result(np.concatenate([piece.result() for piece in pieces]))
+
+        for i, piece in enumerate(pieces):
+            piece.add_done_callback(join)
+            start = i * self.max_batch_size
+            self._queue.put((texts[start:start + self.max_batch_size], piece, enqueued))
+        return future
+
+    def encode(self, texts: list) -> np.ndarray:
+        return self.submit(texts).result()
+
+    def _collect(self) -> list:
+        # block for the first request, then fill the batch until it is
+        # full or the wait window closes; a request that would overflow
+        # it is held over to start the next batch
+        if self._held is not None:
+            first, self._held = self._held, None
+        else:
+            first = self._queue.get()
+        requests = [first]
+        size = len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if size + len(request[0]) > self.max_batch_size:
+                self._held = request
+                break
+            requests.append(request)
+            size += len(request[0])
+
+        return requests
+
+    def _run(self):
+        while True:
+            requests = self._collect()
+            started = time.perf_counter()
+            texts = [text for request in requests for text in request[0]]
+
+            with self._stats_lock:
+                self._batches += 1
+                self._texts += len(texts)
+                self._batch_sizes[bisect.bisect_left(BATCH_SIZE_BUCKETS, len(texts))] += 1
+                self._queue_latency.extend(started - request[2] for request in requests)
+
+            try:
+                embeddings = np.asarray(self._encode_fn(texts))
+            except Exception as e:
+                for _, future, _ in requests:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_texts, future, _ in requests:
+                future.set_result(embeddings[offset:offset + len(request_texts)])
+                offset += len(request_texts)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            latency = sorted(self._queue_latency)
+            histogram = {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(BATCH_SIZE_BUCKETS, self._batch_sizes)
+            }
+            batches = self._batches
+            texts = self._texts
+
+        def pct(p: float) -> float:
+            if not latency:
+                return 0.0
+            return round(latency[min(len(latency) - 1, int(p / 100 * len(latency)))] * 1000, 3)
+
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batches": batches,
+            "texts": texts,
+            "mean_batch_size": round(texts / batches, 2) if batches else 0.0,
+            "batch_size_histogram": histogram,
+            "queue_latency_ms": {"p50": pct(50), "p95": pct(95), "max": pct(100)},
+            "queue_depth": self._queue.qsize(),
+        }
@@ -0,0 +1,406 @@
+import argparse
+import csv
+import hashlib
+import heapq
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import config
+from analysis import analyze_batch_item, init_batch_worker, prepare_job
+
+# Offline screening: rank a directory (or .zip / .tar[.gz] archive) of
+# resumes against one JD without running the API.
+#
+#   python bulk_rank.py resumes/ --jd job.txt --output results.jsonl
+#   python bulk_rank.py resumes.zip --jd job.txt --output results.csv --workers 8
+#
+# Files are read lazily and at most `workers * 2` are in flight, so memory
+# stays flat however large the input. Each result is appended to the
+# output as soon as it's ready; rerunning with the same output skips
+# files already in it, so an interrupted run picks up where it stopped
+# (--restart to start over). A sidecar `<output>.jd` holds the JD's hash so
+# a rerun with a different JD can't mix two rankings in one file.
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+# flat columns for --output *.csv (JSONL keeps the full /analyze result)
+CSV_FIELDS = (
+    "filename", "success", "ats_score", "ats_label", "skill_match_percent",
+    "matched_skills", "missing_skills", "matched_keywords", "missing_keywords",
+    "word_count", "error",
+)
+
+
+# -----------------------------
+# Input: directory or archive
+# -----------------------------
+def _is_resume(name: str) -> bool:
+    return name.lower().endswith(SUPPORTED_EXTENSIONS)
+
+
+def iter_documents(source: str):
+    """
+    Yield (name, size, read) for every resume under `source` — a directory
+    (walked recursively), a .zip or a .tar / .tar.gz / .tgz archive.
+    read() returns the file bytes; nothing is loaded until it's called.
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for filename in sorted(files):
+                if _is_resume(filename):
+                    path = os.path.join(root, filename)
+                    name = os.path.relpath(path, source).replace(os.sep, "/")
+                    yield name, os.path.getsize(path), lambda p=path: _read_file(p)
+
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and _is_resume(info.filename):
+                    yield info.filename, info.file_size, lambda i=info: archive.read(i)
+
+    elif tarfile.is_tarfile(source):
+        # streamed in order, so .tar.gz is never decompressed twice
+        with tarfile.open(source, "r|*") as archive:
+            for member in archive:
+                if member.isfile() and _is_resume(member.name):
+                    # only readable until the stream moves to the next member
+                    yield member.name, member.size, lambda m=member: archive.extractfile(m).read()
+
+    else:
+        raise ValueError(f"{source} is not a directory, .zip or .tar archive")
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def count_documents(source: str) -> int:
+    """
+    Number of resumes in `source`, or None when it can't be known cheaply
+    (compressed tar archives have to be read in full)
+    """
+    if os.path.isdir(source):
+        return sum(1 for _, _, files in os.walk(source) for f in files if _is_resume(f))
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return sum(1 for info in archive.infolist() if not info.is_dir() and _is_resume(info.filename))
+    return None
+
+
+# -----------------------------
+# Output: JSONL / CSV, appended as results arrive
+# -----------------------------
+def output_format(path: str) -> str:
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def _csv_row(result: dict) -> dict:
+    row = {}
+    for field in CSV_FIELDS:
+        value = result.get(field, "")
+        if isinstance(value, list):
+            value = "; ".join(value)
+        elif isinstance(value, str):
+            value = value.replace("\r", " ").replace("\n", " ")  # one line per record
+        row[field] = value
+    return row
+
+
+def _truncate_partial_line(path: str):
+    # a run killed mid-write can leave half a record at the end
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def iter_results(path: str):
+    """
+    Stream the records already written to an output file
+    (JSONL dicts or CSV rows), one at a time
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        if output_format(path) == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.endswith("\n") and line.strip():
+                    yield json.loads(line)
+
+
+def load_results(path: str) -> list:
+    """
+    Every record in an output file — fine for small outputs; large runs
+    should stream with iter_results
+    """
+    return list(iter_results(path))
+
+
+def finished_files(path: str) -> set:
+    """
+    Filenames already in an output file — only the names are kept
+    """
+    return {record["filename"] for record in iter_results(path)}
+
+
+def jd_hash(job_description: str) -> str:
+    return hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+
+
+def _jd_path(output: str) -> str:
+    return output + ".jd"
+
+
+def check_job_description(output: str, digest: str):
+    """
+    Refuse to resume an output written for another JD (or with no record
+    of its JD) — the scores wouldn't be comparable
+    """
+    if not os.path.exists(output) or os.path.getsize(output) == 0:
+        return
+    try:
+        with open(_jd_path(output), encoding="utf-8") as f:
+            recorded = f.read().strip()
+    except FileNotFoundError:
+        recorded = None
+    if recorded != digest:
+        reason = "a different job description" if recorded else "an unknown job description"
+        raise ValueError(
+            f"{output} holds results for {reason}; "
+            "use --restart to overwrite it or choose another --output"
+        )
+
+
+class ResultWriter:
+    """
+    Appends one record per result and flushes it, so whatever has been
+    written survives an interruption
+    """
+
+    def __init__(self, path: str, restart: bool = False):
+        self.path = path
+        self.format = output_format(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        if restart and os.path.exists(path):
+            os.remove(path)
+        if os.path.exists(path):
+            _truncate_partial_line(path)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        self._csv = None
+        if self.format == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=CSV_FIELDS)
+            if new_file:
+                self._csv.writeheader()
+
+    def write(self, result: dict):
+        if self._csv is not None:
+            self._csv.writerow(_csv_row(result))
+        else:
+            self._file.write(json.dumps(result) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+# -----------------------------
+# Ranking run
+# -----------------------------
+class Progress:
+    """
+    Throughput line on stderr, refreshed at most every `interval` seconds
+    """
+
+    def __init__(self, total: int = None, interval: float = 1.0, stream=sys.stderr):
+        self.total = total
+        self.interval = interval
+        self.stream = stream
+        self.done = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self._last = 0.0
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def update(self, result: dict, force: bool = False):
+        if result is not None:
+            self.done += 1
+            self.failed += not result["success"]
+        now = time.perf_counter()
+        if force or now - self._last >= self.interval:
+            self._last = now
+            of_total = f"/{self.total}" if self.total is not None else ""
+            self.stream.write(
+                f"\r[{self.done}{of_total}] {self.rate:.1f} docs/s, {self.failed} failed"
+            )
+            self.stream.flush()
+
+
+def rank_documents(
+    source: str,
+    job_description: str,
+    output: str,
+    workers: int = None,
+    restart: bool = False,
+    limit: int = None,
+    max_tasks_per_child: int = None,
+    progress: Progress = None
+) -> dict:
+    """
+    Score every resume in `source` against the JD, appending results to
+    `output`. Files already in `output` are skipped unless restart=True.
+    `limit` caps how many new files are processed in this run.
+    Raises ValueError when `output` was written for a different JD.
+    Returns {"processed", "skipped", "failed", "seconds", "docs_per_sec"}
+    """
+    digest = jd_hash(job_description)
+    if not restart:
+        check_job_description(output, digest)
+    writer = ResultWriter(output, restart=restart)
+    with open(_jd_path(output), "w", encoding="utf-8") as f:
+        f.write(digest + "\n")
+    done = finished_files(output)
+    workers = max(1, workers or os.cpu_count() or 1)
+    window = workers * 2
+
+    total = count_documents(source)
+    if progress is None:
+        progress = Progress(None if total is None else total - len(done))
+    elif progress.total is None and total is not None:
+        progress.total = total - len(done)
+
+    job = prepare_job(job_description)
+    pool_options = {"max_workers": workers, "initializer": init_batch_worker, "initargs": (job,)}
+    if max_tasks_per_child:
+        pool_options["max_tasks_per_child"] = max_tasks_per_child  # recycle leaky parsers
+
+    skipped = 0
+    submitted = 0
+    pending = set()
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(**pool_options)
+
+    def finish(futures):
+        for future in futures:
+            result = future.result()
+            writer.write(result)
+            progress.update(result)
+
+    try:
+        for name, size, read in iter_documents(source):
+            if name in done:
+                skipped += 1
+                continue
+            if limit is not None and submitted >= limit:
+                break
+
+            if size > config.MAX_UPLOAD_BYTES:
+                result = {
+                    "success": False, "filename": name,
+                    "error": f"File is larger than {config.MAX_UPLOAD_BYTES // (1024 * 1024)} MB",
+                }
+                writer.write(result)
+                progress.update(result)
+            else:
+                pending.add(pool.submit(analyze_batch_item, (name, read())))
+            submitted += 1
+
+            if len(pending) >= window:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                finish(finished)
+
+        finished, pending = wait(pending)
+        finish(finished)
+    except BaseException:
+        # Ctrl-C: keep what's written, drop what hasn't started
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        pool.shutdown()
+    finally:
+        writer.close()
+        progress.update(None, force=True)
+        progress.stream.write("\n")
+
+    seconds = time.perf_counter() - start
+    return {
+        "processed": progress.done,
+        "skipped": skipped,
+        "failed": progress.failed,
+        "seconds": round(seconds, 2),
+        "docs_per_sec": round(progress.done / seconds, 2) if seconds else 0.0,
+    }
+
+
+def top_results(output: str, n: int = 10) -> list:
+    """
+    The n best-scoring successful records in an output file
+    """
+    scored = (
+        (float(record["ats_score"]), record["filename"], record.get("ats_label", ""))
+        for record in iter_results(output)
+        if str(record.get("success")) in ("True", "true")
+    )
+    # streamed, keeping only the best n; ties by filename, for a stable order
+    return heapq.nsmallest(n, scored, key=lambda item: (-item[0], item[1]))
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Rank a directory or archive of resumes against a JD")
+    parser.add_argument("source", help="directory, .zip or .tar[.gz] of PDF / DOCX resumes")
+    jd = parser.add_mutually_exclusive_group(required=True)
+    jd.add_argument("--jd", help="file containing the job description")
+    jd.add_argument("--jd-text", help="the job description itself")
+    parser.add_argument("--output", required=True, help="results file (.jsonl or .csv)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--restart", action="store_true", help="discard an existing output instead of resuming")
+    parser.add_argument("--limit", type=int, help="process at most this many new files")
+    parser.add_argument("--max-tasks-per-child", type=int, default=500,
+                        help="replace each worker after this many files (0 = never)")
+    parser.add_argument("--top", type=int, default=10, help="print the best N when done")
+    args = parser.parse_args(argv)
+
+    if args.jd:
+        with open(args.jd, encoding="utf-8") as f:
+            job_description = f.read()
+    else:
+        job_description = args.jd_text
+    if len(job_description.strip()) < 20:
+        parser.error("please provide a valid job description")  # same rule as /analyze
+
+    try:
+        summary = rank_documents(
+            args.source, job_description, args.output,
+            workers=args.workers, restart=args.restart, limit=args.limit,
+            max_tasks_per_child=args.max_tasks_per_child or None,
+        )
+    except KeyboardInterrupt:
+        print(f"Interrupted — run again with --output {args.output} to resume", file=sys.stderr)
+        sys.exit(130)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"[OK] {summary['processed']} processed ({summary['failed']} failed), "
+          f"{summary['skipped']} already done, {summary['docs_per_sec']} docs/s -> {args.output}")
+    for position, (score, filename, label) in enumerate(top_results(args.output, args.top), start=1):
+        print(f"{position:>4}. {score:>6.2f}  {label:<14} {filename}")
+
+
+if __name__ == "__main__":
+    main()
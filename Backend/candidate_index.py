@@ -0,0 +1,533 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from taxonomy import get_taxonomy
+
+# Persistent inverted index of candidates' skills for "who has X and Y but
+# not Z" searches without re-parsing any resume.
+#
+# On disk (one directory):
+#   candidates.db  — SQLite: candidate id -> row, skills, metadata;
+#                    skill name -> slot
+#   postings.u64   — memory-mapped bitsets, one per skill slot: bit r is
+#                    set when the candidate in row r has that skill.
+#                    Slot 0 marks the rows in use (needed for NOT).
+#   postings.stamp — the SQLite generation / row count / layout the
+#                    bitsets were last flushed at. Removed before the
+#                    first change after a flush, so a missing or stale
+#                    stamp on open means the bitsets get rebuilt.
+#
+# Boolean queries are word-wise AND / OR / NOT over the bitsets; ranking
+# by a JD's skills unpacks just those skills' bitsets and sums their
+# weights, so both stay in the milliseconds at a million candidates.
+# Removed candidates free their row for reuse.
+
+_LIVE = 0  # slot of the rows-in-use bitset
+
+
+def _popcount(bits: np.ndarray) -> int:
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(bits).sum())
+    return int(np.unpackbits(bits.view(np.uint8)).sum())
+
+
+def _unpack(bits: np.ndarray, n: int) -> np.ndarray:
+    # bit r of the bitset -> element r (words are little-endian on disk)
+    return np.unpackbits(bits.view(np.uint8), count=n, bitorder="little").view(bool)
+
+
+# -----------------------------
+# skill names and queries
+# -----------------------------
+_resolver = (None, {})
+
+
+def resolve_skill(name: str) -> str:
+    """
+    Canonical taxonomy name for a skill name or alias (any case)
+    Raises ValueError for names the taxonomy doesn't know
+    """
+    global _resolver
+    taxonomy = get_taxonomy()
+    version, lookup = _resolver
+    if version != taxonomy.version:
+        lookup = {
+            pattern.lower(): skill.name
+            for skill in taxonomy.skills
+            for pattern in (skill.name,) + skill.aliases
+        }
+        _resolver = (taxonomy.version, lookup)
+    canonical = lookup.get(" ".join(name.split()).lower())
+    if canonical is None:
+        raise ValueError(f"Unknown skill: {name}")
+    return canonical
+
+
+_QUERY_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_OPERATORS = {"and", "or", "not"}
+
+
+def parse_query(query: str) -> tuple:
+    """
+    Parse a boolean skill query into a tree of ("and" | "or", [children]),
+    ("not", child) and ("skill", canonical name) nodes.
+
+        Kubernetes AND PyTorch AND NOT Java
+        (React OR Vue) AND NOT "Machine Learning"
+
+    Operators are case-insensitive; NOT binds tightest, then AND, then OR.
+    Unquoted words next to each other form one skill name.
+    """
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _QUERY_TOKEN.match(query, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid query near: {query[position:]!r}")
+        position = match.end()
+        opening, closing, quoted, word = match.groups()
+        if opening:
+            tokens.append(("(", None))
+        elif closing:
+            tokens.append((")", None))
+        elif quoted is not None:
+            tokens.append(("quoted", quoted))
+        elif word.lower() in _OPERATORS:
+            tokens.append((word.lower(), word))
+        elif tokens and tokens[-1][0] == "name":
+            tokens[-1] = ("name", f"{tokens[-1][1]} {word}")  # multi-word name
+        else:
+            tokens.append(("name", word))
+    if not tokens:
+        raise ValueError("Empty query")
+
+    index = 0
+
+    def peek():
+        return tokens[index][0] if index < len(tokens) else None
+
+    def describe(position: int) -> str:
+        if position >= len(tokens):
+            return "end of query"
+        kind, text = tokens[position]
+        return repr(text if text is not None else kind)
+
+    def take(*kinds: str):
+        nonlocal index
+        if peek() not in kinds:
+            raise ValueError(f"Expected {' or '.join(kinds)} but found {describe(index)}")
+        index += 1
+        return tokens[index - 1][1]
+
+    def expression():
+        children = [conjunction()]
+        while peek() == "or":
+            take("or")
+            children.append(conjunction())
+        return children[0] if len(children) == 1 else ("or", children)
+
+    def conjunction():
+        children = [factor()]
+        while peek() == "and":
+            take("and")
+            children.append(factor())
+        return children[0] if len(children) == 1 else ("and", children)
+
+    def factor():
+        if peek() == "not":
+            take("not")
+            return ("not", factor())
+        if peek() == "(":
+            take("(")
+            node = expression()
+            take(")")
+            return node
+        return ("skill", resolve_skill(take("name", "quoted")))
+
+    tree = expression()
+    if index != len(tokens):
+        raise ValueError(f"Unexpected {describe(index)} in query")
+    return tree
+
+
+def query_skills(tree: tuple) -> set:
+    """
+    Every skill a parsed query mentions
+    """
+    kind, value = tree
+    if kind == "skill":
+        return {value}
+    if kind == "not":
+        return query_skills(value)
+    return set().union(*(query_skills(child) for child in value))
+
+
+# -----------------------------
+# the index
+# -----------------------------
+class CandidateIndex:
+    """
+    Candidates' canonical skills in SQLite plus one memory-mapped bitset
+    per skill. Adding, replacing or removing a candidate flips a few bits
+    in place; the bitsets only get rewritten when the row capacity doubles.
+
+    SQLite is committed on every change, the bitsets are written back by
+    flush() — an index reopened after a crash without one rebuilds its
+    bitsets from SQLite.
+    """
+
+    def __init__(self, directory: str, initial_capacity: int = 1024, initial_skills: int = 128):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._postings_path = os.path.join(directory, "postings.u64")
+        self._stamp_path = os.path.join(directory, "postings.stamp")
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(os.path.join(directory, "candidates.db"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS candidates ("
+            " candidate_id TEXT PRIMARY KEY, row INTEGER NOT NULL UNIQUE,"
+            " skills TEXT NOT NULL, metadata TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS skills (name TEXT PRIMARY KEY, slot INTEGER NOT NULL UNIQUE)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn.commit()
+
+        state = dict(self._conn.execute("SELECT key, value FROM state").fetchall())
+        self._capacity = state.get("capacity", max(64, -(-initial_capacity // 64) * 64))
+        self._skill_capacity = state.get("skill_capacity", initial_skills)
+        self._high_water = state.get("high_water", 0)
+        self._generation = state.get("generation", 0)
+        self._slots = dict(self._conn.execute("SELECT name, slot FROM skills").fetchall())
+        self._count = self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+        expected_size = self._skill_capacity * (self._capacity // 64) * 8
+        intact = (
+            os.path.exists(self._postings_path)
+            and os.path.getsize(self._postings_path) == expected_size
+            and self._read_stamp() == self._stamp()
+        )
+        self._clean = intact
+        self._bits = self._open_postings(create=not intact)
+        if not intact:
+            # postings lost, unflushed or from another layout — SQLite is the source of truth
+            self.rebuild()
+        self._free = self._find_free_rows()
+
+    # -----------------------------
+    # storage
+    # -----------------------------
+    def _open_postings(self, create: bool = False) -> np.memmap:
+        shape = (self._skill_capacity, self._capacity // 64)
+        return np.memmap(self._postings_path, dtype="<u8", mode="w+" if create else "r+", shape=shape)
+
+    def _save_state(self):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+            [("capacity", self._capacity), ("skill_capacity", self._skill_capacity),
+             ("high_water", self._high_water), ("generation", self._generation)]
+        )
+
+    def _stamp(self) -> dict:
+        return {
+            "generation": self._generation,
+            "candidates": self._count,
+            "capacity": self._capacity,
+            "skill_capacity": self._skill_capacity,
+        }
+
+    def _read_stamp(self) -> dict:
+        try:
+            with open(self._stamp_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _modifying(self):
+        # called before any bit changes: from here until the next flush the
+        # file on disk may hold a mix of old and new bits
+        if self._clean:
+            try:
+                os.remove(self._stamp_path)
+            except FileNotFoundError:
+                pass
+            self._clean = False
+        self._generation += 1
+
+    def _find_free_rows(self) -> list:
+        live = _unpack(self._bits[_LIVE], self._capacity)[:self._high_water]
+        return np.flatnonzero(~live)[::-1].tolist()  # pop() hands out the lowest row first
+
+    def _resize(self, capacity: int, skill_capacity: int):
+        # rewrite the bitsets with more rows and / or more skill slots
+        self._modifying()
+        old = np.array(self._bits)
+        self._bits.flush()
+        del self._bits
+        self._capacity, self._skill_capacity = capacity, skill_capacity
+        tmp_path = self._postings_path + ".tmp"
+        grown = np.memmap(tmp_path, dtype="<u8", mode="w+",
+                          shape=(skill_capacity, capacity // 64))
+        grown[:old.shape[0], :old.shape[1]] = old
+        grown.flush()
+        del grown
+        os.replace(tmp_path, self._postings_path)
+        self._bits = self._open_postings()
+        self._save_state()
+
+    def _slot(self, skill: str) -> int:
+        slot = self._slots.get(skill)
+        if slot is None:
+            slot = len(self._slots) + 1  # slot 0 is the live bitset
+            if slot >= self._skill_capacity:
+                self._resize(self._capacity, self._skill_capacity * 2)
+            self._slots[skill] = slot
+            self._conn.execute("INSERT INTO skills (name, slot) VALUES (?, ?)", (skill, slot))
+        return slot
+
+    def _take_row(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._high_water >= self._capacity:
+            self._resize(self._capacity * 2, self._skill_capacity)
+        self._high_water += 1
+        return self._high_water - 1
+
+    def _set_bits(self, rows: np.ndarray, slots: np.ndarray, value: bool):
+        words = rows >> 6
+        masks = np.left_shift(np.uint64(1), (rows & 63).astype(np.uint64))
+        if value:
+            np.bitwise_or.at(self._bits, (slots, words), masks)
+        else:
+            np.bitwise_and.at(self._bits, (slots, words), ~masks)
+
+    def flush(self):
+        """
+        Write the bitsets back and stamp them with the SQLite state they match
+        """
+        with self._lock:
+            self._save_state()
+            self._conn.commit()
+            self._bits.flush()
+            tmp_path = self._stamp_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._stamp(), f)
+            os.replace(tmp_path, self._stamp_path)
+            self._clean = True
+
+    def rebuild(self):
+        """
+        Recompute every bitset from the candidates table
+        """
+        with self._lock:
+            self._modifying()
+            self._bits[:] = 0
+            rows, slots = [], []
+            for row, skills in self._conn.execute("SELECT row, skills FROM candidates"):
+                for slot in [_LIVE] + [self._slot(skill) for skill in json.loads(skills)]:
+                    rows.append(row)
+                    slots.append(slot)
+            if rows:
+                self._set_bits(np.array(rows, dtype=np.int64), np.array(slots, dtype=np.int64), True)
+            self.flush()
+
+    # -----------------------------
+    # add / remove
+    # -----------------------------
+    def add(self, candidate_id: str, skills, metadata: dict = None):
+        """
+        Insert or replace a candidate with its canonical skill names
+        """
+        self.add_many([(candidate_id, skills, metadata)])
+
+    def add_many(self, candidates: list):
+        """
+        Insert or replace many (candidate_id, skills, metadata) at once —
+        one transaction and one vectorized bit update. An id listed more
+        than once keeps its last entry.
+        """
+        # all clears are applied before all sets, so each id may only
+        # contribute one of each
+        latest = {candidate_id: (skills, metadata) for candidate_id, skills, metadata in candidates}
+        now = time.time()
+        with self._lock:
+            self._modifying()
+            set_rows, set_slots, clear_rows, clear_slots, records = [], [], [], [], []
+            for candidate_id, (skills, metadata) in latest.items():
+                skills = sorted(set(skills))
+                existing = self._conn.execute(
+                    "SELECT row, skills FROM candidates WHERE candidate_id = ?", (candidate_id,)
+                ).fetchone()
+                if existing is None:
+                    row, previous = self._take_row(), []
+                    self._count += 1
+                else:
+                    row, previous = existing[0], json.loads(existing[1])
+                for skill in previous:
+                    clear_rows.append(row)
+                    clear_slots.append(self._slots[skill])
+                for slot in [_LIVE] + [self._slot(skill) for skill in skills]:
+                    set_rows.append(row)
+                    set_slots.append(slot)
+                records.append((candidate_id, row, json.dumps(skills), json.dumps(metadata or {}), now))
+
+            if clear_rows:
+                self._set_bits(np.array(clear_rows, dtype=np.int64), np.array(clear_slots, dtype=np.int64), False)
+            self._set_bits(np.array(set_rows, dtype=np.int64), np.array(set_slots, dtype=np.int64), True)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO candidates (candidate_id, row, skills, metadata, updated_at)"
+                " VALUES (?, ?, ?, ?, ?)", records
+            )
+            self._save_state()
+            self._conn.commit()
+
+    def remove(self, candidate_id: str) -> bool:
+        with self._lock:
+            existing = self._conn.execute(
+                "SELECT row, skills FROM candidates WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone()
+            if existing is None:
+                return False
+            row, skills = existing[0], json.loads(existing[1])
+            slots = [_LIVE] + [self._slots[skill] for skill in skills]
+            self._modifying()
+            self._set_bits(np.full(len(slots), row, dtype=np.int64), np.array(slots, dtype=np.int64), False)
+            self._conn.execute("DELETE FROM candidates WHERE candidate_id = ?", (candidate_id,))
+            self._save_state()
+            self._conn.commit()
+            self._free.append(row)
+            self._count -= 1
+            return True
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return self.get(candidate_id) is not None
+
+    def get(self, candidate_id: str) -> dict:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT candidate_id, skills, metadata, updated_at FROM candidates WHERE candidate_id = ?",
+                (candidate_id,)
+            ).fetchone()
+        return None if row is None else self._record(row)
+
+    @staticmethod
+    def _record(row: tuple) -> dict:
+        candidate_id, skills, metadata, updated_at = row
+        return {
+            "candidate_id": candidate_id,
+            "skills": json.loads(skills),
+            "metadata": json.loads(metadata),
+            "updated_at": updated_at,
+        }
+
+    def _records_for_rows(self, rows: list) -> dict:
+        # row -> record, a few hundred ids per statement
+        records = {}
+        for start in range(0, len(rows), 500):
+            batch = [int(row) for row in rows[start:start + 500]]
+            for found in self._conn.execute(
+                "SELECT row, candidate_id, skills, metadata, updated_at FROM candidates"
+                f" WHERE row IN ({', '.join('?' * len(batch))})", batch
+            ):
+                records[found[0]] = self._record(found[1:])
+        return records
+
+    def stats(self) -> dict:
+        return {
+            "candidates": self._count,
+            "skills": len(self._slots),
+            "capacity": self._capacity,
+            "postings_bytes": self._bits.nbytes,
+        }
+
+    # -----------------------------
+    # queries
+    # -----------------------------
+    def _evaluate(self, tree: tuple) -> np.ndarray:
+        kind, value = tree
+        if kind == "skill":
+            slot = self._slots.get(value)
+            # a taxonomy skill nobody has yet matches no one
+            return np.array(self._bits[slot]) if slot is not None else np.zeros(self._capacity // 64, dtype="<u8")
+        if kind == "not":
+            return np.bitwise_and(self._bits[_LIVE], np.invert(self._evaluate(value)))
+        combine = np.bitwise_and if kind == "and" else np.bitwise_or
+        result = self._evaluate(value[0])
+        for child in value[1:]:
+            combine(result, self._evaluate(child), out=result)
+        return result
+
+    def filter_bits(self, query) -> np.ndarray:
+        """
+        Bitset of the candidates matching a query string or parsed tree
+        """
+        tree = parse_query(query) if isinstance(query, str) else query
+        with self._lock:
+            return np.bitwise_and(self._evaluate(tree), self._bits[_LIVE])
+
+    def search(self, query, limit: int = 50, offset: int = 0) -> dict:
+        """
+        Candidates matching a boolean skill query, in insertion-row order
+        Returns {"total", "candidates": [record, ...]} for one page
+        """
+        with self._lock:
+            bits = self.filter_bits(query)
+            total = _popcount(bits)
+            rows = np.flatnonzero(_unpack(bits, self._capacity))[offset:offset + limit].tolist()
+            records = self._records_for_rows(rows)
+        return {"total": total, "candidates": [records[row] for row in rows if row in records]}
+
+    def rank(self, weights: dict, query=None, k: int = 20) -> dict:
+        """
+        Candidates ranked by weighted coverage of a skill set
+        weights — {canonical skill name: weight}, normally
+        skill_extractor.skill_weights of a JD's skills. coverage = weight of the skills a
+        candidate has / total weight (as a percentage). `query` optionally
+        restricts ranking to the candidates matching a boolean query.
+        Returns {"total" (candidates with any coverage), "candidates": [...]}
+        """
+        total_weight = float(sum(weights.values()))
+        if not weights or total_weight <= 0:
+            return {"total": 0, "candidates": []}
+
+        with self._lock:
+            scores = np.zeros(self._capacity, dtype=np.float32)
+            for skill, weight in weights.items():
+                slot = self._slots.get(skill)
+                if slot is not None and weight:
+                    scores += _unpack(self._bits[slot], self._capacity) * np.float32(weight)
+
+            allowed = self.filter_bits(query) if query is not None else self._bits[_LIVE]
+            scores[~_unpack(np.asarray(allowed), self._capacity)] = 0.0
+
+            eligible = np.flatnonzero(scores > 0)
+            k = min(k, len(eligible))
+            if k <= 0:
+                return {"total": 0, "candidates": []}
+            top = eligible[np.argpartition(-scores[eligible], k - 1)[:k]]
+            top = top[np.lexsort((top, -scores[top]))]  # best first, ties by row
+            records = self._records_for_rows(top.tolist())
+
+        ranked = []
+        for row in top.tolist():
+            record = records[row]
+            has = set(record["skills"])
+            record["coverage"] = round(float(scores[row]) / total_weight * 100, 2)
+            record["matched_skills"] = sorted(skill for skill in weights if skill in has)
+            record["missing_skills"] = sorted(skill for skill in weights if skill not in has)
+            ranked.append(record)
+        return {"total": len(eligible), "candidates": ranked}
+
@@ -0,0 +1,125 @@
+import re
+from typing import NamedTuple
+
+import numpy as np
+
+# Section- and sentence-aware chunking of resume text.
+#
+# Parsed text arrives as one whitespace-collapsed line (parser.clean_text),
+# so sections are found by their headings inline: a known heading written
+# in CAPS anywhere, or in Title Case when it is not followed by a lowercase
+# word ("Experience Senior Engineer ..." starts a section, "Experience with
+# Python" does not). Each section is split into sentences, and sentences
+# are packed into chunks of at most max_words words. A chunk never crosses
+# a section boundary.
+
+SECTION_HEADINGS = [
+    "professional summary", "summary", "objective", "career objective", "profile",
+    "work experience", "professional experience", "experience", "employment history",
+    "projects", "personal projects", "education", "skills", "technical skills",
+    "certifications", "achievements", "awards", "publications", "languages",
+    "interests", "volunteer experience", "leadership",
+]
+
+
+def _heading_pattern(case) -> str:
+    # longest first so "Work Experience" wins over "Experience"
+    return "|".join(
+        r"\s+".join(re.escape(case(word)) for word in heading.split())
+        for heading in sorted(SECTION_HEADINGS, key=len, reverse=True)
+    )
+
+
+_CAPS_HEADING = re.compile(rf"\b({_heading_pattern(str.upper)})\b:?")
+_TITLE_HEADING = re.compile(rf"\b({_heading_pattern(str.title)})\b:?(?!\s+[a-z])")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9])")
+
+MIN_CHUNK_CHARS = 20  # shorter chunks are skipped, as before
+
+
+class Chunk(NamedTuple):
+    text: str
+    section: str   # lowercased heading, or "" before the first heading
+    words: int
+
+
+def find_sections(text: str) -> list:
+    """
+    Split text at section headings
+    Returns [(section name, section body)] in document order
+    """
+    matches = sorted(
+        list(_CAPS_HEADING.finditer(text)) + list(_TITLE_HEADING.finditer(text)),
+        key=lambda m: m.start()
+    )
+
+    sections = []
+    name, start = "", 0
+    for match in matches:
+        if match.start() < start:
+            continue  # overlaps the heading just taken
+        sections.append((name, text[start:match.start()]))
+        name = " ".join(match.group(1).lower().split())
+        start = match.end()
+    sections.append((name, text[start:]))
+
+    return [(name, body.strip()) for name, body in sections if body.strip()]
+
+
+def split_sentences(text: str) -> list:
+    return [s for s in _SENTENCE_END.split(text) if s.strip()]
+
+
+def _split_words(sentence: str, max_words: int) -> list:
+    # fixed windows for a "sentence" longer than a whole chunk
+    words = sentence.split()
+    return [" ".join(words[i:i + max_words]) for i in range(0, len(words), max_words)]
+
+
+def chunk_text(text: str, max_words: int = 100, overlap_sentences: int = 0) -> list:
+    """
+    Split text into section- and sentence-aligned chunks of <= max_words words
+    overlap_sentences — trailing sentences repeated at the start of the
+    next chunk in the same section (0 = no overlap)
+    Returns list of Chunk
+    """
+    chunks = []
+
+    for section, body in find_sections(text):
+        sentences = []
+        for sentence in split_sentences(body):
+            sentences.extend(_split_words(sentence, max_words))
+        lengths = [len(s.split()) for s in sentences]
+
+        current, size = [], 0
+        for sentence, length in zip(sentences, lengths):
+            if current and size + length > max_words:
+                chunks.append(Chunk(" ".join(s for s, _ in current), section, size))
+                # carry the tail over, as long as it leaves room for this sentence
+                carried = current[-overlap_sentences:] if overlap_sentences else []
+                while carried and sum(n for _, n in carried) + length > max_words:
+                    carried = carried[1:]
+                current, size = carried, sum(n for _, n in carried)
+            current.append((sentence, length))
+            size += length
+        if current:
+            chunks.append(Chunk(" ".join(s for s, _ in current), section, size))
+
+    return [chunk for chunk in chunks if len(chunk.text.strip()) > MIN_CHUNK_CHARS]
+
+
+def pool_embeddings(chunk_embeddings: np.ndarray, weights: list = None) -> np.ndarray:
+    """
+    Whole-document embedding from its chunk embeddings —
+    weighted mean of the normalized chunk vectors, re-normalized
+    (weights are typically chunk word counts)
+    """
+    matrix = np.asarray(chunk_embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    weights = np.ones(len(matrix), dtype=np.float32) if weights is None \
+        else np.asarray(weights, dtype=np.float32)
+
+    pooled = (weights[:, None] * (matrix / norms)).sum(axis=0)
+    norm = np.linalg.norm(pooled)
+    return pooled / norm if norm > 0 else pooled
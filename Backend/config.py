@@ -0,0 +1,166 @@
+import os
+
+# Runtime settings, read once from environment variables
+# (all optional — defaults suit a single small container)
+
+
+def _int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+def _float(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+
+# -----------------------------
+# Logging and metrics
+# -----------------------------
+LOG_LEVEL = os.getenv("RESUMEIQ_LOG_LEVEL", "info")
+# "text" (human readable) or "json" (one object per line)
+LOG_FORMAT = os.getenv("RESUMEIQ_LOG_FORMAT", "text")
+# per-request stage timings in a Server-Timing response header
+SERVER_TIMING = os.getenv("RESUMEIQ_SERVER_TIMING", "1").lower() in ("1", "true", "yes")
+# fraction of requests run under the sampling profiler (0 = off)
+PROFILE_SAMPLE_RATE = _float("RESUMEIQ_PROFILE_SAMPLE_RATE", 0.0)
+# profiled requests slower than this are logged and kept for /metrics/slow
+PROFILE_SLOW_MS = _float("RESUMEIQ_PROFILE_SLOW_MS", 1000.0)
+
+# -----------------------------
+# Executor (parsing + scoring off the event loop)
+# -----------------------------
+# "process" for real parallelism, "thread" for low-memory deployments
+EXECUTOR_KIND = os.getenv("RESUMEIQ_EXECUTOR", "process")
+EXECUTOR_WORKERS = _int("RESUMEIQ_EXECUTOR_WORKERS", os.cpu_count() or 1)
+# jobs allowed to wait for a worker before requests get 429
+EXECUTOR_QUEUE_SIZE = _int("RESUMEIQ_EXECUTOR_QUEUE_SIZE", 32)
+# seconds a single parse / scoring job may take before 504
+EXECUTOR_TIMEOUT = _float("RESUMEIQ_EXECUTOR_TIMEOUT", 30.0)
+
+# -----------------------------
+# Parse cache (keyed by a hash of the uploaded file)
+# -----------------------------
+# in-memory budget for cached parse results
+PARSE_CACHE_MAX_BYTES = _int("RESUMEIQ_PARSE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+# SQLite file for the on-disk tier — empty disables it
+PARSE_CACHE_PATH = os.getenv("RESUMEIQ_PARSE_CACHE_PATH", "")
+PARSE_CACHE_DISK_MAX_BYTES = _int("RESUMEIQ_PARSE_CACHE_DISK_MAX_BYTES", 512 * 1024 * 1024)
+
+# -----------------------------
+# Result cache (full /analyze responses)
+# -----------------------------
+RESULT_CACHE_MAX_ENTRIES = _int("RESUMEIQ_RESULT_CACHE_MAX_ENTRIES", 1024)
+# seconds a cached response stays valid
+RESULT_CACHE_TTL = _float("RESUMEIQ_RESULT_CACHE_TTL", 3600.0)
+
+# -----------------------------
+# Upload / parsing limits
+# -----------------------------
+# uploads larger than this are rejected with 413
+MAX_UPLOAD_BYTES = _int("RESUMEIQ_MAX_UPLOAD_BYTES", 10 * 1024 * 1024)
+UPLOAD_CHUNK_BYTES = 64 * 1024
+# extraction stops after this many pages / characters
+PARSE_MAX_PAGES = _int("RESUMEIQ_PARSE_MAX_PAGES", 50)
+PARSE_MAX_CHARS = _int("RESUMEIQ_PARSE_MAX_CHARS", 200_000)
+# "auto" = fast pdfium path with pdfplumber fallback; or "fast" / "pdfplumber"
+PDF_BACKEND = os.getenv("RESUMEIQ_PDF_BACKEND", "auto")
+
+# -----------------------------
+# Asynchronous jobs (POST /jobs, GET /jobs/{id})
+# -----------------------------
+# "memory" (lost on restart) or "sqlite" (unfinished jobs resume after a restart)
+JOB_STORE = os.getenv("RESUMEIQ_JOB_STORE", "memory")
+JOB_STORE_PATH = os.getenv(
+    "RESUMEIQ_JOB_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "jobs.sqlite")
+)
+# jobs processed at once, and resumes analyzed at once within a job
+JOB_CONCURRENCY = _int("RESUMEIQ_JOB_CONCURRENCY", 2)
+JOB_ITEM_WORKERS = _int("RESUMEIQ_JOB_ITEM_WORKERS", EXECUTOR_WORKERS)
+# extra attempts for a resume whose analysis raises, times out or hits a transient
+# parse failure, with exponential backoff (unparseable files are not retried)
+JOB_MAX_RETRIES = _int("RESUMEIQ_JOB_MAX_RETRIES", 2)
+JOB_RETRY_BACKOFF = _float("RESUMEIQ_JOB_RETRY_BACKOFF", 0.5)
+# seconds a finished job's result is kept
+JOB_RESULT_TTL = _float("RESUMEIQ_JOB_RESULT_TTL", 3600.0)
+
+# -----------------------------
+# Embedding model
+# -----------------------------
+# load the sentence transformer in the background at startup
+# (otherwise it loads on the first request that needs embeddings)
+WARM_EMBEDDER = os.getenv("RESUMEIQ_WARM_EMBEDDER", "0").lower() in ("1", "true", "yes")
+# "torch" (SentenceTransformer) or "onnx" (ONNX Runtime export, see onnx_embedder.py)
+EMBED_BACKEND = os.getenv("RESUMEIQ_EMBED_BACKEND", "torch")
+EMBED_ONNX_DIR = os.getenv(
+    "RESUMEIQ_EMBED_ONNX_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "onnx")
+)
+# int8 dynamically quantized ONNX model (smaller, faster, slightly less exact) — opt in
+EMBED_ONNX_QUANTIZED = os.getenv("RESUMEIQ_EMBED_ONNX_QUANTIZED", "0").lower() in ("1", "true", "yes")
+EMBED_ONNX_THREADS = _int("RESUMEIQ_EMBED_ONNX_THREADS", 0)  # 0 = onnxruntime default
+# share forward passes between concurrent requests
+EMBED_BATCHING = os.getenv("RESUMEIQ_EMBED_BATCHING", "1").lower() in ("1", "true", "yes")
+EMBED_MAX_BATCH_SIZE = _int("RESUMEIQ_EMBED_MAX_BATCH_SIZE", 64)
+# how long the batcher waits for more requests before encoding
+EMBED_MAX_WAIT_MS = _float("RESUMEIQ_EMBED_MAX_WAIT_MS", 5.0)
+# resume chunks: max words each, and sentences repeated between neighbours
+CHUNK_MAX_WORDS = _int("RESUMEIQ_CHUNK_MAX_WORDS", 100)
+CHUNK_OVERLAP_SENTENCES = _int("RESUMEIQ_CHUNK_OVERLAP_SENTENCES", 0)
+
+# -----------------------------
+# Embedding cache (keyed by normalized text hash + model id)
+# -----------------------------
+# in-memory budget (float16 vectors, ~1KB each with overhead) — 0 disables
+EMBED_CACHE_MAX_BYTES = _int("RESUMEIQ_EMBED_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+# SQLite file for the on-disk tier — empty disables it
+EMBED_CACHE_PATH = os.getenv("RESUMEIQ_EMBED_CACHE_PATH", "")
+EMBED_CACHE_DISK_MAX_BYTES = _int("RESUMEIQ_EMBED_CACHE_DISK_MAX_BYTES", 256 * 1024 * 1024)
+
+# -----------------------------
+# Taxonomy hot reload
+# -----------------------------
+# seconds between checks of skills.json for changes (0 = no watcher;
+# POST /admin/taxonomy/reload still works)
+TAXONOMY_WATCH_INTERVAL = _float("RESUMEIQ_TAXONOMY_WATCH_INTERVAL", 0.0)
+# when set, admin endpoints require it in the X-Admin-Token header
+ADMIN_TOKEN = os.getenv("RESUMEIQ_ADMIN_TOKEN", "")
+
+# -----------------------------
+# Skill coverage
+# -----------------------------
+# ATS skill component uses category-weighted coverage (skills.json weights)
+# instead of the flat matched / required ratio
+WEIGHTED_SKILL_SCORE = os.getenv("RESUMEIQ_WEIGHTED_SKILL_SCORE", "0").lower() in ("1", "true", "yes")
+
+# -----------------------------
+# Semantic skill matching (optional stage after the exact taxonomy scan)
+# -----------------------------
+# needs the embedding model — with the process executor each worker loads its own
+SEMANTIC_SKILLS = os.getenv("RESUMEIQ_SEMANTIC_SKILLS", "0").lower() in ("1", "true", "yes")
+# minimum cosine between a phrase and a skill name / alias
+SEMANTIC_SKILL_THRESHOLD = _float("RESUMEIQ_SEMANTIC_SKILL_THRESHOLD", 0.7)
+# candidate phrases embedded per document
+SEMANTIC_MAX_PHRASES = _int("RESUMEIQ_SEMANTIC_MAX_PHRASES", 256)
+# precomputed taxonomy embeddings, one file per taxonomy version and model
+SKILL_EMBEDDINGS_DIR = os.getenv(
+    "RESUMEIQ_SKILL_EMBEDDINGS_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skill_embeddings")
+)
+
+# -----------------------------
+# Job posting store (resume -> best matching jobs)
+# -----------------------------
+POSTING_STORE_DIR = os.getenv(
+    "RESUMEIQ_POSTING_STORE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "postings")
+)
+# clusters probed per query when the approximate index is used
+POSTING_INDEX_NPROBE = _int("RESUMEIQ_POSTING_INDEX_NPROBE", 8)
+
+# -----------------------------
+# Candidate skill index (boolean / weighted skill search over stored resumes)
+# -----------------------------
+CANDIDATE_INDEX_DIR = os.getenv(
+    "RESUMEIQ_CANDIDATE_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "candidates")
+)
@@ -1,11 +1,199 @@
-from sentence_transformers import SentenceTransformer
+import threading
+import time
+
 import numpy as np
 
-# load model once when file is imported
-# downloads ~80MB first time, then cached locally
-print("Loading sentence transformer model...")
-model = SentenceTransformer('all-MiniLM-L6-v2')
-print("[OK] Model loaded successfully")
+import config
+from batcher import EmbeddingBatcher
+from chunker import chunk_text, pool_embeddings
+from embedding_cache import create_embedding_cache, embedding_key, to_stored
+from logs import get_logger
+from metrics import timed
+
+logger = get_logger(__name__)
+
+MODEL_NAME = 'all-MiniLM-L6-v2'
+EMBEDDING_DIM = 384
+
+# the model is loaded on first use (or by warm_up_in_background),
+# not at import — importing sentence_transformers alone pulls in torch
+_model = None
+_model_lock = threading.Lock()
+_model_status = "not_loaded"  # not_loaded / loading / loaded / failed
+_model_error = None
+
+
+def load_model(backend: str = None):
+    """
+    Build the encoder for the configured backend —
+    "torch": SentenceTransformer (downloads ~80MB first time, then cached)
+    "onnx": ONNX Runtime export, fp32 or int8 (see onnx_embedder.py)
+    Both expose encode(texts, convert_to_numpy=True)
+    """
+    backend = backend or config.EMBED_BACKEND
+    if backend == "onnx":
+        from onnx_embedder import OnnxEncoder
+        return OnnxEncoder(
+            config.EMBED_ONNX_DIR,
+            quantized=config.EMBED_ONNX_QUANTIZED,
+            threads=config.EMBED_ONNX_THREADS or None
+        )
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(MODEL_NAME)
+    raise ValueError(f"Unknown embedding backend: {backend}")
+
+
+def get_model():
+    """
+    Return the shared encoder, loading it on first call
+    """
+    global _model, _model_status, _model_error
+
+    if _model is not None:
+        return _model
+
+    with _model_lock:
+        if _model is None:
+            _model_status = "loading"
+            logger.info("Loading embedding model", extra={"model": MODEL_NAME, "backend": config.EMBED_BACKEND})
+            started = time.perf_counter()
+            try:
+                _model = load_model()
+            except Exception as e:
+                _model_status = "failed"
+                _model_error = str(e)
+                logger.error("Embedding model failed to load", extra={"error": str(e)})
+                raise
+            _model_status = "loaded"
+            _model_error = None
+            logger.info("Embedding model loaded",
+                        extra={"backend": config.EMBED_BACKEND,
+                               "seconds": round(time.perf_counter() - started, 2)})
+
+    return _model
+
+
+def model_status() -> dict:
+    return {"status": _model_status, "error": _model_error, "backend": config.EMBED_BACKEND}
+
+
+def is_model_loaded() -> bool:
+    return _model is not None
+
+
+def _model_encode(texts: list) -> np.ndarray:
+    return get_model().encode(texts, convert_to_numpy=True)
+
+
+# micro-batcher shared by all requests in this process (created on first use)
+_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def get_batcher() -> EmbeddingBatcher:
+    global _batcher
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                _batcher = EmbeddingBatcher(
+                    _model_encode,
+                    max_batch_size=config.EMBED_MAX_BATCH_SIZE,
+                    max_wait_ms=config.EMBED_MAX_WAIT_MS
+                )
+    return _batcher
+
+
+def batcher_stats() -> dict:
+    return _batcher.stats() if _batcher is not None else None
+
+
+def model_id() -> str:
+    """
+    Identifies the vectors the configured backend produces (cache keys)
+    """
+    if config.EMBED_BACKEND == "onnx":
+        return f"{MODEL_NAME}:onnx:{'int8' if config.EMBED_ONNX_QUANTIZED else 'fp32'}"
+    return f"{MODEL_NAME}:{config.EMBED_BACKEND}"
+
+
+def _encode_uncached(texts: list) -> np.ndarray:
+    with timed("embedding"):
+        if config.EMBED_BATCHING:
+            return get_batcher().encode(texts)
+        return _model_encode(texts)
+
+
+# embedding cache shared by all requests in this process (created on first use)
+_cache = None
+_cache_created = False
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache():
+    """
+    The process-wide embedding cache, or None when disabled
+    """
+    global _cache, _cache_created
+    if not _cache_created:
+        with _cache_lock:
+            if not _cache_created:
+                _cache = create_embedding_cache()
+                _cache_created = True
+    return _cache
+
+
+def cache_stats() -> dict:
+    cache = get_embedding_cache()
+    return cache.stats() if cache is not None else None
+
+
+def encode_texts(texts: list) -> np.ndarray:
+    """
+    Embed many texts in one forward pass — through the shared micro-batcher
+    when enabled, so concurrent requests also share forward passes
+    Cached texts are not re-encoded; vectors come back float16-rounded
+    whether cached or not, so results don't depend on the cache state
+    Returns array of shape (len(texts), 384)
+    """
+    cache = get_embedding_cache()
+    if cache is None:
+        return _encode_uncached(texts)
+    if not texts:
+        return np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+
+    current_model = model_id()
+    keys = [embedding_key(text, current_model) for text in texts]
+    vectors = {}
+    for key in dict.fromkeys(keys):
+        vector = cache.get(key)
+        if vector is not None:
+            vectors[key] = vector
+
+    # encode each missing text once, even if it repeats in this call
+    missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+    if missing:
+        fresh = _encode_uncached(list(missing.values()))
+        for key, vector in zip(missing, fresh):
+            vectors[key] = to_stored(vector)
+            cache.put(key, vectors[key])
+
+    return np.array([vectors[key] for key in keys], dtype=np.float32)
+
+
+def warm_up_in_background() -> threading.Thread:
+    """
+    Load the model in a daemon thread so startup isn't blocked
+    """
+    def _warm_up():
+        try:
+            get_model()
+        except Exception:
+            pass  # recorded in model_status()
+
+    thread = threading.Thread(target=_warm_up, name="embedder-warmup", daemon=True)
+    thread.start()
+    return thread
 
 
 def generate_embedding(text: str) -> np.ndarray:
@@ -13,58 +201,84 @@ def generate_embedding(text: str) -> np.ndarray:
     Convert a single text into a 384-dimensional vector
     Used for full resume and full job description
     """
-    embedding = model.encode(text, convert_to_numpy=True)
+    embedding = encode_texts([text])[0]
     return embedding
 
 
-def generate_chunk_embeddings(text: str, chunk_size: int = 100) -> list:
+def _as_matrix(embeddings: np.ndarray, dim: int) -> np.ndarray:
+    # one contiguous float32 (n_chunks, dim) block, even when empty
+    if len(embeddings) == 0:
+        return np.zeros((0, dim), dtype=np.float32)
+    return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+
+def split_into_chunks(text: str) -> list:
     """
-    Split text into chunks and embed each one separately
-    Used for section-level matching (most/least relevant parts)
-    Returns list of dicts with chunk text and its embedding
+    Section- and sentence-aligned chunks (see chunker.py),
+    sized by CHUNK_MAX_WORDS / CHUNK_OVERLAP_SENTENCES
     """
-    words = text.split()
-    chunks = []
+    return chunk_text(
+        text,
+        max_words=config.CHUNK_MAX_WORDS,
+        overlap_sentences=config.CHUNK_OVERLAP_SENTENCES
+    )
 
-    # split text into chunks of chunk_size words
-    for i in range(0, len(words), chunk_size):
-        chunk_text = " ".join(words[i:i + chunk_size])
-        if len(chunk_text.strip()) > 20:  # skip very short chunks
-            chunks.append(chunk_text)
 
+def generate_chunk_embeddings(text: str) -> tuple:
+    """
+    Split text into chunks and embed each one separately
+    Used for section-level matching (most/least relevant parts)
+    Returns (list of Chunk, contiguous (n_chunks, 384) embedding matrix)
+    """
+    chunks = split_into_chunks(text)
     if not chunks:
-        return []
+        return [], _as_matrix([], EMBEDDING_DIM)
 
     # embed all chunks at once (faster than one by one)
-    embeddings = model.encode(chunks, convert_to_numpy=True)
+    embeddings = encode_texts([chunk.text for chunk in chunks])
+    return chunks, _as_matrix(embeddings, EMBEDDING_DIM)
 
-    # pair each chunk with its embedding
-    result = []
-    for i, chunk in enumerate(chunks):
-        result.append({
-            "chunk_text": chunk,
-            "embedding": embeddings[i]
-        })
 
-    return result
+def embed_document(text: str) -> dict:
+    """
+    Chunk embeddings plus a whole-document embedding pooled from them,
+    so the document is only encoded once
+    """
+    chunks, chunk_embeddings = generate_chunk_embeddings(text)
+    if chunks:
+        embedding = pool_embeddings(chunk_embeddings, [chunk.words for chunk in chunks])
+    else:
+        embedding = generate_embedding(text)  # too short to chunk
+
+    return {"embedding": embedding, "chunks": chunks, "chunk_embeddings": chunk_embeddings}
 
 
 def embed_resume_and_job(resume_text: str, job_text: str) -> dict:
     """
     Main function — call this from scorer.py
     Takes both texts, returns all embeddings needed
+    The resume embedding is pooled from its chunk embeddings
+    instead of encoding the full resume a second time
     """
-    
-    print("Generating embeddings...")
 
-    resume_embedding = generate_embedding(resume_text)
-    job_embedding = generate_embedding(job_text)
-    chunk_embeddings = generate_chunk_embeddings(resume_text)
+    # JD and every resume chunk in a single encode call
+    chunks = split_into_chunks(resume_text)
+    texts = [chunk.text for chunk in chunks] if chunks else [resume_text]
+    embeddings = encode_texts([job_text] + texts)
+
+    job_embedding = embeddings[0]
+    chunk_embeddings = _as_matrix(embeddings[1:] if chunks else [], EMBEDDING_DIM)
+    if chunks:
+        resume_embedding = pool_embeddings(chunk_embeddings, [chunk.words for chunk in chunks])
+    else:
+        resume_embedding = embeddings[1]
 
-    print(f"[OK] Generated embeddings for {len(chunk_embeddings)} resume chunks")
+    logger.debug("Generated embeddings", extra={"chunks": len(chunks)})
 
     return {
         "resume_embedding": resume_embedding,
         "job_embedding": job_embedding,
+        "chunk_texts": [chunk.text for chunk in chunks],
+        "chunk_sections": [chunk.section for chunk in chunks],
         "chunk_embeddings": chunk_embeddings
-    }
\ No newline at end of file
+    }
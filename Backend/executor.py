@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import config
+
+
+class ExecutorSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+
+
+class BoundedExecutor:
+    """
+    Runs CPU-bound work (parsing, scoring) outside the asyncio event loop.
+
+    Wraps a process or thread pool with a bounded queue: at most
+    `max_workers + max_queue` jobs are in flight, anything beyond that is
+    rejected straight away with ExecutorSaturated so callers can answer 429
+    instead of piling up. Each job gets a timeout; a job that times out is
+    cancelled if it hasn't started, otherwise it keeps its slot until the
+    worker actually finishes so the bound stays honest.
+    """
+
+    def __init__(
+        self,
+        kind: str = "process",
+        max_workers: int = 1,
+        max_queue: int = 0,
+        timeout: float = None
+    ):
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_queue
+        self.timeout = timeout
+
+        self._pool = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._rejected = 0
+        self._timed_out = 0
+
+    def _get_pool(self):
+        # created on first use so importing main doesn't fork workers
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn, *args, timeout: float = None):
+        """
+        Run fn(*args) in the pool and await its result
+        Raises ExecutorSaturated when full, asyncio.TimeoutError on timeout
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise ExecutorSaturated(
+                    f"{self._in_flight} jobs in flight (capacity {self.capacity})"
+                )
+            self._in_flight += 1
+
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout if timeout is not None else self.timeout
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            future.cancel()
+            raise
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+            }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+def create_executor() -> BoundedExecutor:
+    """
+    Build the executor described by config.py / environment variables
+    """
+    return BoundedExecutor(
+        kind=config.EXECUTOR_KIND,
+        max_workers=config.EXECUTOR_WORKERS,
+        max_queue=config.EXECUTOR_QUEUE_SIZE,
+        timeout=config.EXECUTOR_TIMEOUT,
+    )
@@ -0,0 +1,355 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+import config
+from analysis import analyze_document, prepare_job, rank_results
+from executor import ExecutorSaturated
+from logs import get_logger
+
+# Asynchronous analysis jobs: POST /jobs stores the uploads and returns an
+# id straight away, a pool of worker tasks analyzes them in the background
+# and GET /jobs/{id} polls for status and result.
+#
+# Job records live in a JobStore — MemoryJobStore for development,
+# SQLiteJobStore to survive restarts (unfinished jobs are picked up
+# again at startup). Uploaded files are kept only until the job finishes;
+# finished jobs expire after a TTL.
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+logger = get_logger(__name__)
+
+
+def _new_record(job_id: str, total: int) -> dict:
+    now = time.time()
+    return {
+        "job_id": job_id,
+        "status": QUEUED,
+        "created_at": now,
+        "updated_at": now,
+        "attempts": 0,
+        "completed": 0,
+        "total": total,
+        "result": None,
+        "error": None,
+    }
+
+
+class MemoryJobStore:
+    """
+    Job records and uploads in process memory — lost on restart
+    """
+
+    def __init__(self):
+        self._records = {}
+        self._payloads = {}  # job id -> (job_description, [(filename, bytes)])
+        self._lock = threading.Lock()
+
+    def create(self, job_description: str, files: list) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._records[job_id] = _new_record(job_id, len(files))
+            self._payloads[job_id] = (job_description, list(files))
+        return job_id
+
+    def get(self, job_id: str) -> dict:
+        with self._lock:
+            record = self._records.get(job_id)
+            return dict(record) if record is not None else None
+
+    def get_payload(self, job_id: str) -> tuple:
+        with self._lock:
+            return self._payloads.get(job_id)
+
+    def update(self, job_id: str, **fields):
+        with self._lock:
+            record = self._records.get(job_id)
+            if record is not None:
+                record.update(fields, updated_at=time.time())
+                if record["status"] in (DONE, FAILED):
+                    self._payloads.pop(job_id, None)
+
+    def unfinished(self) -> list:
+        return []  # nothing survives a restart
+
+    def purge(self, older_than: float) -> int:
+        """
+        Delete finished jobs last updated before `older_than` (epoch seconds)
+        """
+        with self._lock:
+            expired = [
+                job_id for job_id, record in self._records.items()
+                if record["status"] in (DONE, FAILED) and record["updated_at"] < older_than
+            ]
+            for job_id in expired:
+                del self._records[job_id]
+        return len(expired)
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = {}
+            for record in self._records.values():
+                counts[record["status"]] = counts.get(record["status"], 0) + 1
+        return {"backend": "memory", "jobs": counts}
+
+
+class SQLiteJobStore:
+    """
+    Job records and uploads in a SQLite file — survives restarts
+    """
+
+    _FIELDS = ("job_id", "status", "created_at", "updated_at", "attempts",
+               "completed", "total", "result", "error")
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job_id TEXT PRIMARY KEY, status TEXT NOT NULL,"
+            " created_at REAL NOT NULL, updated_at REAL NOT NULL,"
+            " attempts INTEGER NOT NULL, completed INTEGER NOT NULL, total INTEGER NOT NULL,"
+            " result TEXT, error TEXT, job_description TEXT)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_files ("
+            " job_id TEXT NOT NULL, position INTEGER NOT NULL,"
+            " filename TEXT NOT NULL, data BLOB NOT NULL,"
+            " PRIMARY KEY (job_id, position))"
+        )
+        self._conn.commit()
+
+    def create(self, job_description: str, files: list) -> str:
+        job_id = uuid.uuid4().hex
+        record = _new_record(job_id, len(files))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, status, created_at, updated_at, attempts,"
+                " completed, total, result, error, job_description)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, NULL, NULL, ?)",
+                (job_id, record["status"], record["created_at"], record["updated_at"],
+                 0, 0, len(files), job_description)
+            )
+            self._conn.executemany(
+                "INSERT INTO job_files (job_id, position, filename, data) VALUES (?, ?, ?, ?)",
+                [(job_id, i, filename, data) for i, (filename, data) in enumerate(files)]
+            )
+            self._conn.commit()
+        return job_id
+
+    def get(self, job_id: str) -> dict:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self._FIELDS)} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        record = dict(zip(self._FIELDS, row))
+        if record["result"] is not None:
+            record["result"] = json.loads(record["result"])
+        return record
+
+    def get_payload(self, job_id: str) -> tuple:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_description FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None or row[0] is None:
+                return None
+            files = self._conn.execute(
+                "SELECT filename, data FROM job_files WHERE job_id = ? ORDER BY position", (job_id,)
+            ).fetchall()
+        return row[0], [(filename, bytes(data)) for filename, data in files]
+
+    def update(self, job_id: str, **fields):
+        if "result" in fields:
+            fields["result"] = json.dumps(fields["result"])
+        fields["updated_at"] = time.time()
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {', '.join(f'{name} = ?' for name in fields)} WHERE job_id = ?",
+                (*fields.values(), job_id)
+            )
+            if fields.get("status") in (DONE, FAILED):
+                # uploads are only needed until the job finishes
+                self._conn.execute("DELETE FROM job_files WHERE job_id = ?", (job_id,))
+                self._conn.execute(
+                    "UPDATE jobs SET job_description = NULL WHERE job_id = ?", (job_id,)
+                )
+            self._conn.commit()
+
+    def unfinished(self) -> list:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                (QUEUED, RUNNING)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (DONE, FAILED, older_than)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        return {"backend": "sqlite", "path": self.path, "jobs": dict(rows)}
+
+
+class JobQueue:
+    """
+    Background workers that run queued jobs.
+
+    `concurrency` jobs run at a time; within a job, up to `item_workers`
+    resumes are analyzed at once through `run` (the BoundedExecutor's
+    run). A resume whose analysis raises, times out or hits a transient
+    parse failure (I/O error, parser timeout, out of memory) is retried up
+    to `max_retries` times with exponential backoff; a file that can't be
+    parsed (invalid, corrupt, no text) fails the same way every time, so
+    it fails the item straight away. A full executor is simply waited out. Finished jobs are purged after `ttl`
+    seconds.
+    """
+
+    def __init__(
+        self,
+        store,
+        run,
+        concurrency: int = 2,
+        item_workers: int = 1,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        ttl: float = 3600.0
+    ):
+        self.store = store
+        self._run = run
+        self.concurrency = concurrency
+        self.item_workers = item_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.ttl = ttl
+
+        self._queue = None
+        self._tasks = []
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        for job_id in self.store.unfinished():
+            self._queue.put_nowait(job_id)  # picked up again after a restart
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._expire()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, job_description: str, files: list) -> str:
+        # the store write (SQLite, uploads) stays off the event loop
+        job_id = await asyncio.to_thread(self.store.create, job_description, files)
+        self._queue.put_nowait(job_id)
+        return job_id
+
+    def stats(self) -> dict:
+        return {
+            **self.store.stats(),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "concurrency": self.concurrency,
+        }
+
+    async def _update(self, job_id: str, **fields):
+        await asyncio.to_thread(self.store.update, job_id, **fields)
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            except Exception as e:
+                logger.exception("Job failed", extra={"job_id": job_id})
+                await self._update(job_id, status=FAILED, error=f"Job failed: {str(e)}")
+
+    async def _expire(self):
+        while True:
+            await asyncio.sleep(min(60.0, self.ttl))
+            await asyncio.to_thread(self.store.purge, time.time() - self.ttl)
+
+    async def _call(self, fn, *args):
+        # a saturated executor is not the job's fault — wait for room
+        while True:
+            try:
+                return await self._run(fn, *args)
+            except ExecutorSaturated:
+                await asyncio.sleep(0.1)
+
+    async def _process(self, job_id: str):
+        payload = await asyncio.to_thread(self.store.get_payload, job_id)
+        if payload is None:
+            return  # purged or already finished
+        job_description, files = payload
+        await self._update(job_id, status=RUNNING, completed=0)
+
+        job = await self._call(prepare_job, job_description)
+        results = [None] * len(files)
+        attempts = 0
+        completed = 0
+        slots = asyncio.Semaphore(self.item_workers)
+
+        async def analyze_item(index: int, filename: str, file_bytes: bytes):
+            nonlocal attempts, completed
+            async with slots:
+                for attempt in range(self.max_retries + 1):
+                    attempts += 1
+                    try:
+                        result = await self._call(analyze_document, file_bytes, filename, job)
+                        if result["success"] or not result.pop("retryable", False):
+                            break
+                    except asyncio.TimeoutError:
+                        result = {"success": False, "error": "Analysis timed out"}
+                    except Exception as e:
+                        result = {"success": False, "error": f"Analysis failed: {str(e)}"}
+                    if attempt < self.max_retries:
+                        await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+                result["filename"] = filename
+                results[index] = result
+                completed += 1
+                await self._update(job_id, completed=completed, attempts=attempts)
+
+        await asyncio.gather(*(
+            analyze_item(i, filename, file_bytes) for i, (filename, file_bytes) in enumerate(files)
+        ))
+
+        if len(results) > 1:
+            # same shape as /analyze/batch
+            await self._update(job_id, status=DONE, result=rank_results(results), attempts=attempts)
+        elif results[0]["success"]:
+            # same shape as /analyze
+            await self._update(job_id, status=DONE, result=results[0], attempts=attempts)
+        else:
+            await self._update(job_id, status=FAILED, error=results[0]["error"], attempts=attempts)
+
+
+def create_job_store():
+    """
+    Build the job store described by config.py / environment variables
+    """
+    if config.JOB_STORE == "sqlite":
+        return SQLiteJobStore(config.JOB_STORE_PATH)
+    if config.JOB_STORE == "memory":
+        return MemoryJobStore()
+    raise ValueError(f"Unknown job store: {config.JOB_STORE}")
@@ -1,10 +1,114 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+import asyncio
+import json
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import List
+
+from fastapi import FastAPI, File, UploadFile, Form, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+import config
+import embedder
+import metrics
+from logs import get_logger
+from taxonomy import call_with_taxonomy, get_taxonomy, get_taxonomy_manager, taxonomy_for
+from analysis import (
+    parse_upload, score_resume, build_response, analyze_batch_item, rank_results, result_key,
+    JobProfile, prepare_job, analyze_skills, analyze_ats, semantic_sections,
+    parse_section, skills_section, ats_section, index_document
+)
+from cache import LRUCache
+from candidate_index import CandidateIndex
+from executor import ExecutorSaturated, create_executor
+from jobs import JobQueue, create_job_store
+from parse_cache import create_parse_cache, file_key
+from posting_store import PostingStore
+from skill_extractor import skill_weights
+
+logger = get_logger(__name__)
+
+# upper bound on resumes per /analyze/batch request
+MAX_BATCH_FILES = 500
+
+# parsing and scoring run here, never on the event loop
+executor = create_executor()
+
+# parsed resumes by content hash — re-uploads skip pdfplumber entirely
+parse_cache = create_parse_cache()
+
+# full responses by (resume hash, JD hash, taxonomy version)
+result_cache = LRUCache(config.RESULT_CACHE_MAX_ENTRIES, ttl=config.RESULT_CACHE_TTL)
+
+
+async def run_timed(fn, *args):
+    """
+    executor.run that also brings back the stage timings recorded in the
+    worker (process workers can't update this process's histograms) and
+    keeps the worker on this process's taxonomy version — or, for a stage
+    given a prepared JobProfile, on the version the job was prepared with
+    """
+    version = next(
+        (arg.taxonomy_version for arg in args if isinstance(arg, JobProfile)),
+        get_taxonomy().version
+    )
+    result, timings = await executor.run(
+        call_with_taxonomy, version, metrics.call_with_timings, fn, *args
+    )
+    metrics.record_stages(timings)
+    return result
+
+
+# background analysis jobs (POST /jobs), run through the same executor
+job_queue = JobQueue(
+    create_job_store(),
+    run_timed,
+    concurrency=config.JOB_CONCURRENCY,
+    item_workers=config.JOB_ITEM_WORKERS,
+    max_retries=config.JOB_MAX_RETRIES,
+    retry_backoff=config.JOB_RETRY_BACKOFF,
+    ttl=config.JOB_RESULT_TTL
+)
+
+# job postings for resume -> jobs matching (opened on first use)
+_posting_store = None
+
+
+def get_posting_store() -> PostingStore:
+    global _posting_store
+    if _posting_store is None:
+        _posting_store = PostingStore(config.POSTING_STORE_DIR)
+    return _posting_store
+
+
+# candidates' skills for boolean / ranked skill search (opened on first use)
+_candidate_index = None
+
+
+def get_candidate_index() -> CandidateIndex:
+    global _candidate_index
+    if _candidate_index is None:
+        _candidate_index = CandidateIndex(config.CANDIDATE_INDEX_DIR)
+    return _candidate_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # keyword / ATS scoring never waits for this — only embedding features do
+    if config.WARM_EMBEDDER:
+        embedder.warm_up_in_background()
+    if config.TAXONOMY_WATCH_INTERVAL > 0:
+        get_taxonomy_manager().start_watching(config.TAXONOMY_WATCH_INTERVAL)
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    get_taxonomy_manager().stop_watching()
+    executor.shutdown()
+    if parse_cache.disk is not None:
+        parse_cache.disk.flush()  # buffered access times
 
-from parser import parse_document
-from skill_extractor import get_skill_gap
-from ats_scorer import calculate_ats_score
 
 # -----------------------------
 # Initialize FastAPI app
@@ -12,7 +116,8 @@ from ats_scorer import calculate_ats_score
 app = FastAPI(
     title="ResumeIQ API",
     description="AI powered resume job matching and skill gap analyzer",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # -----------------------------
@@ -24,8 +129,57 @@ app.add_middleware(
     allow_credentials=False,      # MUST be False when using "*"
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+
+# -----------------------------
+# Request instrumentation
+# -----------------------------
+@app.middleware("http")
+async def instrument_request(request: Request, call_next):
+    # stage timings for this request, request latency by route,
+    # and (sampled, opt-in) a stack profile of slow requests
+    timings = metrics.start_request()
+    profiler = None
+    if config.PROFILE_SAMPLE_RATE > 0 and random.random() < config.PROFILE_SAMPLE_RATE:
+        profiler = metrics.SamplingProfiler()
+        profiler.start()
+
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        # streaming responses are timed until their headers are sent
+        elapsed = time.perf_counter() - start
+        route = request.scope.get("route")
+        route_name = f"{request.method} {route.path if route else 'unmatched'}"
+        metrics.REQUEST_SECONDS.observe(route_name, elapsed)
+        if profiler is not None:
+            profiler.stop()
+            if elapsed * 1000 >= config.PROFILE_SLOW_MS:
+                stages = metrics.stage_totals(timings)
+                profile = {
+                    "route": route_name,
+                    "duration_ms": round(elapsed * 1000, 2),
+                    "at": time.time(),
+                    "samples": profiler.samples,
+                    "stages_ms": {stage: round(seconds * 1000, 2) for stage, seconds in stages.items()},
+                    "top_stacks": profiler.top(),
+                }
+                metrics.SLOW_PROFILES.append(profile)
+                logger.warning("Slow request profiled", extra={
+                    "route": route_name, "duration_ms": profile["duration_ms"],
+                    "samples": profiler.samples,
+                })
+
+    if config.SERVER_TIMING and timings:
+        response.headers["Server-Timing"] = metrics.server_timing_header(
+            timings + [("total", elapsed)]
+        )
+    return response
+
+
 # -----------------------------
 # Health Check
 # -----------------------------
@@ -35,8 +189,193 @@ async def root():
 
 @app.get("/health")
 async def health_check():
+    # liveness — the process is up and serving requests
     return {"status": "healthy"}
 
+@app.get("/health/ready")
+async def readiness_check(require_model: bool = False):
+    # readiness — /analyze only needs the compiled taxonomy;
+    # pass require_model=true to also wait for the embedding model
+    taxonomy = get_taxonomy()
+    model = embedder.model_status()
+
+    ready = taxonomy is not None and (not require_model or model["status"] == "loaded")
+    body = {
+        "status": "ready" if ready else "not_ready",
+        "taxonomy_compiled": taxonomy is not None,
+        "taxonomy_skills": len(taxonomy) if taxonomy is not None else 0,
+        "taxonomy_version": taxonomy.version if taxonomy is not None else None,
+        "model_loaded": model["status"] == "loaded",
+        "model_status": model["status"],
+        "model_error": model["error"],
+    }
+    return JSONResponse(status_code=200 if ready else 503, content=body)
+
+@app.get("/embedder/stats")
+async def embedder_stats():
+    return {
+        "model": embedder.model_status(),
+        "batcher": embedder.batcher_stats(),
+        "cache": embedder.cache_stats(),
+    }
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return {
+        "parse": await run_in_threadpool(parse_cache.stats),
+        "results": result_cache.stats(),
+        "embeddings": embedder.cache_stats(),
+    }
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    # stage / request latency histograms plus a few live gauges, Prometheus text format
+    executor_stats = executor.stats()
+    taxonomy = get_taxonomy_manager().stats()
+    caches = {"parse": parse_cache.memory.stats(), "results": result_cache.stats()}
+    embedding_cache = embedder.get_embedding_cache()
+    if embedding_cache is not None:
+        caches["embeddings"] = embedding_cache.memory.stats()
+
+    extra = (
+        metrics.gauge_lines("resumeiq_executor_in_flight", "Jobs running or queued on the executor",
+                            {None: executor_stats["in_flight"]})
+        + metrics.gauge_lines("resumeiq_executor_rejected_total", "Jobs rejected with 429",
+                              {None: executor_stats["rejected"]}, kind="counter")
+        + metrics.gauge_lines("resumeiq_executor_timed_out_total", "Jobs that hit the executor timeout",
+                              {None: executor_stats["timed_out"]}, kind="counter")
+        + metrics.gauge_lines("resumeiq_cache_hits_total", "In-memory cache hits",
+                              {name: s["hits"] for name, s in caches.items()}, "cache", kind="counter")
+        + metrics.gauge_lines("resumeiq_cache_misses_total", "In-memory cache misses",
+                              {name: s["misses"] for name, s in caches.items()}, "cache", kind="counter")
+        + metrics.gauge_lines("resumeiq_cache_bytes", "In-memory cache size (bytes, or entries for results)",
+                              {name: s["size"] for name, s in caches.items()}, "cache")
+        + metrics.gauge_lines("resumeiq_model_loaded", "1 once the embedding model is loaded",
+                              {None: int(embedder.is_model_loaded())})
+        + metrics.gauge_lines("resumeiq_taxonomy_info", "Loaded taxonomy version",
+                              {taxonomy["version"]: 1}, "version")
+        + metrics.gauge_lines("resumeiq_taxonomy_reloads_total", "Taxonomy versions swapped in since start",
+                              {None: taxonomy["reloads"]}, kind="counter")
+        + metrics.gauge_lines("resumeiq_taxonomy_matcher_bytes", "Approximate size of the compiled taxonomy",
+                              {None: taxonomy["matcher_bytes"]})
+    )
+    return PlainTextResponse(metrics.render(extra), media_type="text/plain; version=0.0.4")
+
+@app.get("/metrics/slow")
+async def slow_request_profiles():
+    # most recent profiled slow requests (RESUMEIQ_PROFILE_SAMPLE_RATE > 0)
+    return {"profiles": list(metrics.SLOW_PROFILES)}
+
+# -----------------------------
+# Taxonomy (hot reload)
+# -----------------------------
+@app.get("/taxonomy")
+async def taxonomy_stats():
+    # live version, compiled size and the last reload's report
+    return get_taxonomy_manager().stats()
+
+
+@app.post("/admin/taxonomy/reload")
+async def reload_taxonomy(x_admin_token: str = Header(None)):
+    # recompile skills.json off the event loop and swap it in;
+    # requests already running finish on the version they started with
+    if config.ADMIN_TOKEN and x_admin_token != config.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    try:
+        report = await run_in_threadpool(get_taxonomy_manager().reload)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"success": True, **report}
+
+
+# -----------------------------
+# Executor helper
+# -----------------------------
+async def run_job(fn, *args):
+    """
+    Run CPU-bound work on the executor, mapping saturation to 429
+    and timeouts to 504
+    """
+    try:
+        return await run_timed(fn, *args)
+    except ExecutorSaturated:
+        raise HTTPException(
+            status_code=429,
+            detail="Server is busy, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail="Analysis timed out"
+        )
+
+
+async def read_upload(upload: UploadFile) -> bytes:
+    """
+    Read an upload in chunks, refusing anything over MAX_UPLOAD_BYTES
+    """
+    data = bytearray()
+    with metrics.timed("upload_read"):
+        while True:
+            chunk = await upload.read(config.UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                return bytes(data)
+            data.extend(chunk)
+            if len(data) > config.MAX_UPLOAD_BYTES:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"{upload.filename} is larger than "
+                           f"{config.MAX_UPLOAD_BYTES // (1024 * 1024)} MB"
+                )
+
+
+# -----------------------------
+# Shared /analyze steps
+# -----------------------------
+def validate_analyze_request(resume: UploadFile, job_description: str):
+    # 1️⃣ Validate file type
+    filename = resume.filename.lower()
+    if not filename.endswith((".pdf", ".docx")):
+        raise HTTPException(
+            status_code=400,
+            detail="Only PDF and DOCX files are supported"
+        )
+
+    # 2️⃣ Validate job description
+    if not job_description or len(job_description.strip()) < 20:
+        raise HTTPException(
+            status_code=400,
+            detail="Please provide a valid job description"
+        )
+
+
+async def get_parse_result(file_bytes: bytes, filename: str, parse_key: str) -> dict:
+    """
+    Parsed resume from the parse cache, or parsed on the executor (400 on failure)
+    The disk tier (SQLite) is only touched from the threadpool, never the event loop
+    """
+    if parse_cache.disk is None:
+        parse_result = parse_cache.get(parse_key)
+    else:
+        parse_result = await run_in_threadpool(parse_cache.get, parse_key)
+
+    if parse_result is None:
+        parse_result = await run_job(parse_upload, file_bytes, filename)
+        if parse_result["success"]:
+            if parse_cache.disk is None:
+                parse_cache.put(parse_key, parse_result)
+            else:
+                await run_in_threadpool(parse_cache.put, parse_key, parse_result)
+
+    if not parse_result["success"]:
+        raise HTTPException(
+            status_code=400,
+            detail=parse_result["error"]
+        )
+    return parse_result
+
+
 # -----------------------------
 # Main Analysis Endpoint
 # -----------------------------
@@ -45,13 +384,133 @@ async def analyze_resume(
     resume: UploadFile = File(...),
     job_description: str = Form(...)
 ):
+    validate_analyze_request(resume, job_description)
 
-    # 1️⃣ Validate file type
-    filename = resume.filename.lower()
-    if not filename.endswith((".pdf", ".docx")):
+    try:
+        # 3️⃣ Extract text
+        file_bytes = await read_upload(resume)
+        parse_key = file_key(file_bytes, resume.filename)
+
+        # retries / reloads of the same analysis are served from memory
+        analysis_key = result_key(parse_key, job_description)
+        cached = result_cache.get(analysis_key)
+        if cached is not None:
+            return cached
+
+        parse_result = await get_parse_result(file_bytes, resume.filename, parse_key)
+        resume_text = parse_result["clean_text"]
+
+        # 4️⃣ Skill Gap Analysis + 5️⃣ ATS Score Calculation
+        results = await run_job(score_resume, resume_text, job_description)
+
+        # 6️⃣ Return final response
+        response = build_response(parse_result, results)
+        result_cache.put(analysis_key, response)
+        return response
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Analysis failed: {str(e)}"
+        )
+
+
+# -----------------------------
+# Streaming Analysis Endpoint (Server-Sent Events)
+# -----------------------------
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/analyze/stream")
+async def analyze_resume_stream(
+    resume: UploadFile = File(...),
+    job_description: str = Form(...),
+    include_semantic: bool = Form(False)
+):
+    """
+    /analyze as a stream of events, each sent as soon as its stage is done:
+    parse → skills → ats → (semantic) → result (the full /analyze body) → done
+    Request errors (bad file, unparseable resume, ...) are still plain HTTP
+    errors; a stage failing mid-stream sends an "error" event and ends it
+    """
+    validate_analyze_request(resume, job_description)
+
+    file_bytes = await read_upload(resume)
+    parse_key = file_key(file_bytes, resume.filename)
+    analysis_key = result_key(parse_key, job_description)
+    cached = result_cache.get(analysis_key)
+
+    parse_result = None
+    if cached is None or include_semantic:
+        parse_result = await get_parse_result(file_bytes, resume.filename, parse_key)
+
+    async def events():
+        try:
+            response = cached
+            if response is None:
+                resume_text = parse_result["clean_text"]
+                yield sse_event("parse", {
+                    **parse_section(parse_result),
+                    "page_count": parse_result["page_count"],
+                    "file_type": parse_result["file_type"],
+                })
+
+                job = await run_job(prepare_job, job_description)
+                skill_results = await run_job(analyze_skills, resume_text, job)
+                yield sse_event("skills", skills_section(skill_results))
+
+                ats_results = await run_job(analyze_ats, resume_text, job, skill_results)
+                yield sse_event("ats", ats_section(ats_results))
+
+                response = build_response(parse_result, {"skills": skill_results, "ats": ats_results})
+                result_cache.put(analysis_key, response)
+
+            if include_semantic:
+                # the embedding model may be missing or still loading —
+                # report it, the rest of the analysis still stands
+                try:
+                    semantic = await run_in_threadpool(
+                        semantic_sections, parse_result["clean_text"], job_description
+                    )
+                    yield sse_event("semantic", semantic)
+                except Exception as e:
+                    yield sse_event("semantic", {"error": f"Semantic analysis unavailable: {str(e)}"})
+
+            # the full /analyze body — a cache hit skips straight to this
+            yield sse_event("result", response)
+            yield sse_event("done", {})
+
+        except HTTPException as e:
+            yield sse_event("error", {"status_code": e.status_code, "detail": e.detail})
+        except Exception as e:
+            yield sse_event("error", {"status_code": 500, "detail": f"Analysis failed: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # no caching / proxy buffering, so each event reaches the client as it is sent
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# -----------------------------
+# Batch Analysis Endpoint
+# -----------------------------
+@app.post("/analyze/batch")
+async def analyze_resume_batch(
+    resumes: List[UploadFile] = File(...),
+    job_description: str = Form(...)
+):
+
+    # 1️⃣ Validate batch size
+    if len(resumes) > MAX_BATCH_FILES:
         raise HTTPException(
             status_code=400,
-            detail="Only PDF and DOCX files are supported"
+            detail=f"At most {MAX_BATCH_FILES} resumes per batch"
         )
 
     # 2️⃣ Validate job description
@@ -61,49 +520,272 @@ async def analyze_resume(
             detail="Please provide a valid job description"
         )
 
+    # 3️⃣ Read files — unsupported types are reported, not fatal
+    files = []
+    rejected = []
+    for resume in resumes:
+        if not resume.filename.lower().endswith((".pdf", ".docx")):
+            rejected.append({
+                "filename": resume.filename,
+                "error": "Only PDF and DOCX files are supported"
+            })
+            continue
+        try:
+            files.append((resume.filename, await read_upload(resume)))
+        except HTTPException as e:
+            rejected.append({"filename": resume.filename, "error": e.detail})
+
     try:
-        # 3️⃣ Extract text
-        file_bytes = await resume.read()
-        parse_result = parse_document(file_bytes, resume.filename)
+        # 4️⃣ Score in parallel on the shared executor (JD prepared once),
+        # ranked by ats_score — same capacity / timeout rules as /analyze
+        job = await run_job(prepare_job, job_description)
+        slots = asyncio.Semaphore(config.EXECUTOR_WORKERS)
+
+        async def analyze_item(item: tuple) -> dict:
+            async with slots:
+                # a busy or slow item is reported like a parse error —
+                # the rest of the batch still stands
+                try:
+                    return await run_job(analyze_batch_item, item, job)
+                except HTTPException as e:
+                    return {"success": False, "error": e.detail, "filename": item[0]}
+
+        tasks = [asyncio.ensure_future(analyze_item(item)) for item in files]
+        try:
+            result = rank_results(list(await asyncio.gather(*tasks)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
-        if not parse_result["success"]:
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch analysis failed: {str(e)}"
+        )
+
+    result["failed"].extend(rejected)
+    result["total"] += len(rejected)
+    result["total_failed"] += len(rejected)
+    return result
+
+
+# -----------------------------
+# Asynchronous Job Endpoints
+# -----------------------------
+@app.post("/jobs", status_code=202)
+async def submit_job(
+    resumes: List[UploadFile] = File(...),
+    job_description: str = Form(...)
+):
+    """
+    Queue an analysis and return its id at once — poll GET /jobs/{id}
+    One resume gives an /analyze-style result, several a ranked
+    /analyze/batch-style result
+    """
+    if len(resumes) > MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_FILES} resumes per job"
+        )
+
+    if not job_description or len(job_description.strip()) < 20:
+        raise HTTPException(
+            status_code=400,
+            detail="Please provide a valid job description"
+        )
+
+    files = []
+    for resume in resumes:
+        if not resume.filename.lower().endswith((".pdf", ".docx")):
             raise HTTPException(
                 status_code=400,
-                detail=parse_result["error"]
+                detail=f"{resume.filename}: only PDF and DOCX files are supported"
             )
+        files.append((resume.filename, await read_upload(resume)))
 
-        resume_text = parse_result["clean_text"]
+    job_id = await job_queue.submit(job_description, files)
+    return {"job_id": job_id, "status": "queued", "status_url": f"/jobs/{job_id}"}
 
-        # 4️⃣ Skill Gap Analysis
-        skill_results = get_skill_gap(resume_text, job_description)
 
-        # 5️⃣ ATS Score Calculation
-        ats_results = calculate_ats_score(
-            resume_text,
-            job_description,
-            skill_results["skill_match_percent"]
+@app.get("/jobs/stats")
+async def job_stats():
+    return job_queue.stats()
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    # status is queued / running / done / failed; result is set once done
+    job = await run_in_threadpool(job_queue.store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found (or expired)")
+    return job
+
+
+# -----------------------------
+# Job Posting Store Endpoints
+# -----------------------------
+async def document_embedding(text: str):
+    """
+    Whole-document embedding pooled from chunk embeddings, so a long text
+    counts in full, not just the model's first few hundred tokens —
+    postings and the resumes matched against them are embedded the same way
+    """
+    document = await run_in_threadpool(embedder.embed_document, text)
+    return document["embedding"]
+
+
+@app.post("/postings")
+async def add_posting(
+    posting_id: str = Form(...),
+    job_description: str = Form(...),
+    title: str = Form("")
+):
+    if len(job_description.strip()) < 20:
+        raise HTTPException(
+            status_code=400,
+            detail="Please provide a valid job description"
         )
 
-        # 6️⃣ Return final response
-        return {
-            "success": True,
-            "ats_score": ats_results["ats_score"],
-            "ats_label": ats_results["ats_label"],
-            "ats_breakdown": ats_results["breakdown"],
-            "matched_keywords": ats_results["matched_keywords"],
-            "missing_keywords": ats_results["missing_keywords"],
-            "matched_skills": skill_results["matched_skills"],
-            "missing_skills": skill_results["missing_skills"],
-            "extra_skills": skill_results["extra_skills"],
-            "skill_match_percent": skill_results["skill_match_percent"],
-            "total_job_skills": skill_results["total_job_skills"],
-            "total_matched": skill_results["total_matched"],
-            "total_missing": skill_results["total_missing"],
-            "word_count": parse_result["word_count"],
-        }
+    embedding = await document_embedding(job_description)
+    store = get_posting_store()
+    store.add(posting_id, embedding, {"title": title})
+    await run_in_threadpool(store.flush)
+    return {"success": True, "posting_id": posting_id, "total_postings": len(store)}
 
-    except Exception as e:
+
+@app.delete("/postings/{posting_id}")
+async def remove_posting(posting_id: str):
+    store = get_posting_store()
+    if not store.remove(posting_id):
+        raise HTTPException(status_code=404, detail="Posting not found")
+    await run_in_threadpool(store.flush)
+    return {"success": True, "posting_id": posting_id, "total_postings": len(store)}
+
+
+@app.post("/postings/index")
+async def build_posting_index():
+    # (re)cluster postings for approximate search — worth it for very large stores
+    store = get_posting_store()
+    await run_in_threadpool(store.build_index)
+    await run_in_threadpool(store.flush)
+    return {"success": True, "total_postings": len(store), "approximate": store.has_index}
+
+
+@app.post("/postings/match")
+async def match_postings(
+    resume: UploadFile = File(...),
+    top_k: int = Form(10)
+):
+    if not resume.filename.lower().endswith((".pdf", ".docx")):
         raise HTTPException(
-            status_code=500,
-            detail=f"Analysis failed: {str(e)}"
-        )
\ No newline at end of file
+            status_code=400,
+            detail="Only PDF and DOCX files are supported"
+        )
+
+    file_bytes = await read_upload(resume)
+    parse_result = await run_job(parse_upload, file_bytes, resume.filename)
+    if not parse_result["success"]:
+        raise HTTPException(status_code=400, detail=parse_result["error"])
+
+    embedding = await document_embedding(parse_result["clean_text"])
+    store = get_posting_store()
+    matches = store.search(embedding, top_k, nprobe=config.POSTING_INDEX_NPROBE)
+    return {
+        "success": True,
+        "total_postings": len(store),
+        "approximate": store.has_index,
+        "matches": matches,
+    }
+
+
+# -----------------------------
+# Candidate Skill Index Endpoints
+# -----------------------------
+@app.post("/candidates")
+async def add_candidate(
+    candidate_id: str = Form(...),
+    resume: UploadFile = File(...),
+    name: str = Form("")
+):
+    if not resume.filename.lower().endswith((".pdf", ".docx")):
+        raise HTTPException(
+            status_code=400,
+            detail="Only PDF and DOCX files are supported"
+        )
+
+    file_bytes = await read_upload(resume)
+    result = await run_job(index_document, file_bytes, resume.filename)
+    if not result["success"]:
+        raise HTTPException(status_code=400, detail=result["error"])
+
+    index = get_candidate_index()
+    metadata = {"name": name, "filename": resume.filename, "word_count": result["word_count"]}
+    await run_in_threadpool(index.add, candidate_id, result["skills"], metadata)
+    await run_in_threadpool(index.flush)
+    return {
+        "success": True,
+        "candidate_id": candidate_id,
+        "skills": result["skills"],
+        "total_candidates": len(index),
+    }
+
+
+@app.get("/candidates/search")
+async def search_candidates(q: str, limit: int = 50, offset: int = 0):
+    # e.g. q=Kubernetes AND PyTorch AND NOT Java
+    index = get_candidate_index()
+    try:
+        found = await run_in_threadpool(index.search, q, max(0, min(limit, 1000)), max(0, offset))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"success": True, "query": q, **found}
+
+
+@app.post("/candidates/rank")
+async def rank_candidates(
+    job_description: str = Form(...),
+    query: str = Form(None),
+    top_k: int = Form(20)
+):
+    # candidates by weighted coverage of the JD's skills, optionally
+    # restricted to a boolean query
+    if len(job_description.strip()) < 20:
+        raise HTTPException(
+            status_code=400,
+            detail="Please provide a valid job description"
+        )
+
+    job = await run_job(prepare_job, job_description)
+    weights = skill_weights(job.skills, taxonomy_for(job.taxonomy_version))
+    index = get_candidate_index()
+    try:
+        ranked = await run_in_threadpool(index.rank, weights, query or None, max(1, min(top_k, 1000)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"success": True, "job_skills": sorted(weights), **ranked}
+
+
+@app.get("/candidates/stats")
+async def candidate_stats():
+    return get_candidate_index().stats()
+
+
+@app.get("/candidates/{candidate_id}")
+async def get_candidate(candidate_id: str):
+    candidate = await run_in_threadpool(get_candidate_index().get, candidate_id)
+    if candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    return candidate
+
+
+@app.delete("/candidates/{candidate_id}")
+async def remove_candidate(candidate_id: str):
+    index = get_candidate_index()
+    if not await run_in_threadpool(index.remove, candidate_id):
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    await run_in_threadpool(index.flush)
+    return {"success": True, "candidate_id": candidate_id, "total_candidates": len(index)}
@@ -0,0 +1,114 @@
+import re
+from functools import lru_cache
+
+# a maximal run of word characters — every alias that starts with a word
+# character can only match where one of these runs starts
+_WORD_RUN = re.compile(r'\w+')
+
+# characters that re.IGNORECASE treats as equal to an ASCII letter but that
+# str.lower() leaves alone (dotless i, long s, the combining dot left behind
+# by lowering "İ"). Only used to bucket tokens — every hit is still confirmed
+# by the real compiled pattern, so folding too much is harmless.
+_EXTRA_FOLDS = str.maketrans({'ı': 'i', 'ſ': 's', '̇': None})
+
+
+def _fold(token: str) -> str:
+    token = token.lower()
+    if not token.isascii():
+        token = token.translate(_EXTRA_FOLDS)
+    return token
+
+
+@lru_cache(maxsize=None)
+def compile_skill_pattern(pattern: str) -> re.Pattern:
+    """
+    Build the regex used to find one skill name / alias in text
+    Single word skills use word boundaries,
+    multi-word skills allow flexible whitespace between words
+    """
+    escaped = re.escape(pattern)
+
+    if " " in pattern:
+        flexible = r'\s+'.join(escaped.split(r'\ '))
+        regex = r'(?i)(?<!\w)' + flexible + r'(?!\w)'
+    else:
+        regex = r'(?i)\b' + escaped + r'\b'
+
+    return re.compile(regex)
+
+
+@lru_cache(maxsize=None)
+def compile_keyword_pattern(pattern: str) -> re.Pattern:
+    """
+    Build the regex ats_scorer uses to find a skill name / alias as a JD
+    keyword — word boundaries on both ends, whitespace matched literally
+    """
+    return re.compile(r'\b' + re.escape(pattern) + r'\b', re.IGNORECASE)
+
+
+class TaxonomyMatcher:
+    """
+    Finds every skill name / alias of the taxonomy in one pass over the text.
+
+    Aliases are bucketed by their leading word (lowercased). The text is
+    walked once, word by word, and only aliases whose leading word equals the
+    current word are tried — anchored at that position with the same
+    precompiled patterns the per-alias searches used, so results are
+    identical. The few aliases that start with a symbol (e.g. ".NET") can't
+    be anchored on a word and are searched directly.
+
+    Each alias is checked two ways in the same pass: as a skill (flexible
+    whitespace, see `compile_skill_pattern`) and as a JD keyword (see
+    `compile_keyword_pattern`).
+    """
+
+    def __init__(self, aliases: list):
+        """
+        aliases — list of (skill_index, alias) pairs; the position of a pair
+        in this list is the alias index reported by `scan`
+        """
+        self._by_lead = {}
+        self._unanchored = []
+
+        for alias_index, (skill_index, alias) in enumerate(aliases):
+            if not alias:
+                continue
+            entry = (
+                skill_index,
+                alias_index,
+                compile_skill_pattern(alias),
+                compile_keyword_pattern(alias),
+            )
+            lead = _WORD_RUN.match(alias)
+            if lead:
+                self._by_lead.setdefault(_fold(lead.group()), []).append(entry)
+            else:
+                self._unanchored.append(entry)
+
+    def scan(self, text: str) -> tuple:
+        """
+        Return (skill indices, alias indices) found in text —
+        skills matched by any alias, aliases matched as keywords
+        """
+        skills = set()
+        keywords = set()
+        by_lead = self._by_lead
+
+        for word in _WORD_RUN.finditer(text):
+            candidates = by_lead.get(_fold(word.group()))
+            if not candidates:
+                continue
+            start = word.start()
+            for skill_index, alias_index, skill_regex, keyword_regex in candidates:
+                if skill_index not in skills and skill_regex.match(text, start):
+                    skills.add(skill_index)
+                if alias_index not in keywords and keyword_regex.match(text, start):
+                    keywords.add(alias_index)
+
+        for skill_index, alias_index, skill_regex, keyword_regex in self._unanchored:
+            if skill_index not in skills and skill_regex.search(text):
+                skills.add(skill_index)
+            if alias_index not in keywords and keyword_regex.search(text):
+                keywords.add(alias_index)
+
+        return skills, keywords
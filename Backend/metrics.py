@@ -0,0 +1,229 @@
+import bisect
+import contextvars
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+# Lightweight pipeline instrumentation:
+#   timed(stage)        — time a block; recorded into the stage histogram
+#   call_with_timings   — run a function in an executor worker and bring its
+#                         stage timings back (process pools have their own
+#                         memory, so workers can't record directly)
+#   render()            — every histogram in Prometheus text format
+#   SamplingProfiler    — opt-in stack sampler for slow requests
+
+# seconds; Prometheus-style cumulative buckets (+Inf added on output)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Thread-safe latency histogram, one series per label value
+    """
+
+    def __init__(self, name: str, help_text: str, label: str, buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.label = label
+        self.buckets = tuple(buckets)
+        self._series = {}  # label value -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, label_value: str, seconds: float):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            series[index] += 1
+            series[-2] += seconds
+            series[-1] += 1
+
+    def snapshot(self) -> dict:
+        """
+        {label value: {"count", "sum", "mean_ms"}} — for JSON stats
+        """
+        with self._lock:
+            return {
+                value: {
+                    "count": series[-1],
+                    "sum": round(series[-2], 6),
+                    "mean_ms": round(series[-2] / series[-1] * 1000, 3) if series[-1] else 0.0,
+                }
+                for value, series in self._series.items()
+            }
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series_items = sorted((value, list(series)) for value, series in self._series.items())
+        for value, series in series_items:
+            label = f'{self.label}="{_escape(value)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label},le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label}}} {series[-2]}")
+            lines.append(f"{self.name}_count{{{label}}} {series[-1]}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+STAGE_SECONDS = Histogram(
+    "resumeiq_stage_seconds", "Time spent in each analysis pipeline stage", "stage"
+)
+REQUEST_SECONDS = Histogram(
+    "resumeiq_request_seconds", "HTTP request latency by route", "route"
+)
+
+
+# -----------------------------
+# stage timing
+# -----------------------------
+# set inside executor workers — timings are shipped back with the result
+_worker_timings = contextvars.ContextVar("worker_timings", default=None)
+# set per HTTP request — stage timings for the Server-Timing header
+_request_timings = contextvars.ContextVar("request_timings", default=None)
+
+
+def observe_stage(stage: str, seconds: float):
+    worker = _worker_timings.get()
+    if worker is not None:
+        worker.append((stage, seconds))
+        return
+    STAGE_SECONDS.observe(stage, seconds)
+    request = _request_timings.get()
+    if request is not None:
+        request.append((stage, seconds))
+
+
+def record_stages(timings: list):
+    """
+    Record timings a worker brought back (see call_with_timings)
+    """
+    for stage, seconds in timings:
+        observe_stage(stage, seconds)
+
+
+@contextmanager
+def timed(stage: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+def call_with_timings(fn, *args) -> tuple:
+    """
+    Run fn(*args) collecting its stage timings instead of recording them
+    Returns (result, [(stage, seconds)]) — submit this to the executor
+    """
+    timings = []
+    token = _worker_timings.set(timings)
+    try:
+        return fn(*args), timings
+    finally:
+        _worker_timings.reset(token)
+
+
+def start_request() -> list:
+    """
+    Start collecting stage timings for the current request
+    """
+    timings = []
+    _request_timings.set(timings)
+    return timings
+
+
+def stage_totals(timings: list) -> dict:
+    """
+    {stage: total seconds} — repeated stages are summed, first-seen order
+    """
+    totals = {}
+    for stage, seconds in timings:
+        totals[stage] = totals.get(stage, 0.0) + seconds
+    return totals
+
+
+def server_timing_header(timings: list) -> str:
+    return ", ".join(
+        f"{stage};dur={seconds * 1000:.2f}" for stage, seconds in stage_totals(timings).items()
+    )
+
+
+def render(extra_lines: list = ()) -> str:
+    lines = STAGE_SECONDS.render() + REQUEST_SECONDS.render() + list(extra_lines)
+    return "\n".join(lines) + "\n"
+
+
+def gauge_lines(name: str, help_text: str, values: dict, label: str = None, kind: str = "gauge") -> list:
+    """
+    Prometheus lines for a gauge / counter — values is {label value: number},
+    or {None: number} for an unlabeled metric
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for value, number in values.items():
+        labels = f'{{{label}="{_escape(value)}"}}' if label and value is not None else ""
+        lines.append(f"{name}{labels} {number}")
+    return lines
+
+
+# -----------------------------
+# sampling profiler
+# -----------------------------
+class SamplingProfiler:
+    """
+    Samples the stacks of every thread in this process (except its own)
+    every `interval` seconds while running, counting identical stacks.
+
+    Work done inside executor *processes* is not visible here — run with
+    RESUMEIQ_EXECUTOR=thread to profile parsing / scoring.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 30):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self._stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == me:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < self.max_depth:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self._stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._sample, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def top(self, n: int = 10) -> list:
+        """
+        Most frequent stacks, root first — [{"stack", "samples"}]
+        """
+        return [{"stack": stack, "samples": count} for stack, count in self._stacks.most_common(n)]
+
+
+# recent slow-request profiles, newest last
+SLOW_PROFILES = deque(maxlen=20)
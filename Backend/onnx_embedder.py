@@ -0,0 +1,140 @@
+import argparse
+import os
+
+import numpy as np
+
+# ONNX Runtime backend for all-MiniLM-L6-v2 — same outputs as the
+# SentenceTransformer pipeline (mean pooling over tokens, L2-normalized)
+# without torch at serving time. Optional: install the extras in
+# requirements-onnx.txt (onnxruntime, tokenizers), then export the model once with
+#
+#   python onnx_embedder.py --output data/onnx          # fp32 + int8
+#
+# (exporting needs torch and transformers; serving does not).
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+HF_MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
+MAX_SEQ_LENGTH = 256  # the sentence-transformers limit for this model
+EMBEDDING_DIM = 384
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model.int8.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+
+
+class OnnxEncoder:
+    """
+    Drop-in for SentenceTransformer.encode backed by an ONNX export.
+    quantized=True loads the int8 dynamically quantized model instead.
+    """
+
+    def __init__(self, model_dir: str, quantized: bool = False, threads: int = None):
+        if ort is None:
+            raise RuntimeError("onnxruntime is not installed — pip install -r requirements-onnx.txt")
+        from tokenizers import Tokenizer
+
+        model_path = os.path.join(model_dir, QUANTIZED_MODEL_FILE if quantized else MODEL_FILE)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"{model_path} not found — export it with: python onnx_embedder.py --output {model_dir}"
+            )
+
+        self.model_path = model_path
+        self.quantized = quantized
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, TOKENIZER_FILE))
+        self.tokenizer.enable_truncation(MAX_SEQ_LENGTH)
+        self.tokenizer.enable_padding()  # to the longest text in each batch
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(
+            model_path, options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def _encode_batch(self, texts: list) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feed = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feed["token_type_ids"] = np.zeros_like(input_ids)
+        hidden = self.session.run(None, feed)[0]  # (batch, tokens, dim)
+
+        # mean over real tokens, then normalize — as the sentence-transformers pipeline does
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled / np.clip(norms, 1e-12, None)
+
+    def encode(self, texts: list, batch_size: int = 32, convert_to_numpy: bool = True) -> np.ndarray:
+        """
+        Embed texts → float32 array of shape (len(texts), 384)
+        Texts are batched by length so little compute goes to padding
+        """
+        if isinstance(texts, str):
+            return self.encode([texts], batch_size)[0]
+        if not texts:
+            return np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+
+        order = np.argsort([-len(text) for text in texts], kind="stable")
+        embeddings = np.empty((len(texts), EMBEDDING_DIM), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            rows = order[start:start + batch_size]
+            embeddings[rows] = self._encode_batch([texts[i] for i in rows])
+        return embeddings
+
+
+def export_model(output_dir: str, quantize: bool = True) -> list:
+    """
+    Export the Hugging Face model to ONNX (+ int8 dynamic quantization)
+    Returns the files written
+    """
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(HF_MODEL_ID)
+    model = AutoModel.from_pretrained(HF_MODEL_ID).eval()
+    tokenizer.save_pretrained(output_dir)  # writes tokenizer.json
+
+    names = ["input_ids", "attention_mask", "token_type_ids"]
+    sample = tokenizer(["export sample", "a second, longer export sample"],
+                       padding=True, return_tensors="pt")
+    model_path = os.path.join(output_dir, MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in names),
+            model_path,
+            input_names=names,
+            output_names=["last_hidden_state"],
+            dynamic_axes={name: {0: "batch", 1: "tokens"} for name in names + ["last_hidden_state"]},
+            opset_version=14,
+        )
+    written = [model_path, os.path.join(output_dir, TOKENIZER_FILE)]
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantized_path = os.path.join(output_dir, QUANTIZED_MODEL_FILE)
+        quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+        written.append(quantized_path)
+
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export all-MiniLM-L6-v2 to ONNX")
+    parser.add_argument("--output", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "onnx"))
+    parser.add_argument("--no-quantize", action="store_true", help="skip the int8 model")
+    args = parser.parse_args()
+
+    for path in export_model(args.output, quantize=not args.no_quantize):
+        print(f"[OK] Wrote {path}")
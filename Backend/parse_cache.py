@@ -0,0 +1,44 @@
+import hashlib
+import os
+import sys
+
+import config
+from cache import LRUCache, SQLiteStore, TieredCache
+
+
+def file_key(file_bytes: bytes, filename: str) -> str:
+    """
+    Content address of an upload — the same bytes always map to the same
+    key whatever the file is called, but PDF and DOCX are kept apart.
+    The page / character budgets and PDF backend are part of the key
+    since they change what gets extracted.
+    """
+    extension = os.path.splitext(filename.lower())[1]
+    digest = hashlib.sha256(file_bytes).hexdigest()
+    return (
+        f"{extension}:{digest}:{config.PARSE_MAX_PAGES}:"
+        f"{config.PARSE_MAX_CHARS}:{config.PDF_BACKEND}"
+    )
+
+
+def _result_size(parse_result: dict) -> int:
+    # the two text copies dominate; the rest is a few small fields
+    return (
+        sys.getsizeof(parse_result["raw_text"])
+        + sys.getsizeof(parse_result["clean_text"])
+        + 256
+    )
+
+
+def create_parse_cache() -> TieredCache:
+    """
+    Build the parse cache described by config.py / environment variables
+    """
+    disk = None
+    if config.PARSE_CACHE_PATH:
+        disk = SQLiteStore(config.PARSE_CACHE_PATH, config.PARSE_CACHE_DISK_MAX_BYTES)
+
+    return TieredCache(
+        LRUCache(config.PARSE_CACHE_MAX_BYTES, sizeof=_result_size),
+        disk
+    )
@@ -3,23 +3,163 @@ from docx import Document
 import re
 import io
 
+# pdfium (a pdfplumber dependency) extracts page text in C without
+# layout analysis — optional, pdfplumber is used when it's missing
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# below this many characters per page the fast path is assumed to have
+# missed text (odd encodings, unusual content streams) and pdfplumber runs
+FAST_PATH_MIN_CHARS_PER_PAGE = 20
+
+
+class PageBudget:
+    """
+    Stop conditions for page-by-page extraction —
+    after max_pages pages or once max_chars characters are collected
+    (None means unlimited). Records how many pages were skipped.
+    """
+
+    def __init__(self, max_pages: int = None, max_chars: int = None):
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.page_count = 0
+        self.pages_read = 0
+        self.pages_truncated = 0
+        self.chars = 0
+
+    def reset(self):
+        self.page_count = 0
+        self.pages_read = 0
+        self.pages_truncated = 0
+        self.chars = 0
+
+    def exhausted(self) -> bool:
+        return (
+            (self.max_pages is not None and self.pages_read >= self.max_pages)
+            or (self.max_chars is not None and self.chars >= self.max_chars)
+        )
+
+
+# -----------------------------
+# PDF extraction backends
+# -----------------------------
+# Each backend is a generator: (file_bytes, budget) -> page texts, in order,
+# honouring the budget and filling in its page counts.
+
+def iter_pdf_pages(file_bytes: bytes, budget: PageBudget = None):
+    """
+    pdfplumber backend — full character-level layout analysis.
+    Yield the text of each PDF page in order (empty string for pages
+    without text), stopping early once the budget is used up.
+    Each page's cached layout objects are released as soon as it is read.
+    """
+    budget = budget or PageBudget()
 
-def extract_text_from_pdf(file_bytes: bytes) -> str:
-    text = ""
     with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
+        pages = pdf.pages
+        budget.page_count = len(pages)
+
+        for page in pages:
+            if budget.exhausted():
+                break
+            try:
+                page_text = page.extract_text() or ""
+            finally:
+                page.close()
+            budget.pages_read += 1
+            budget.chars += len(page_text)
+            yield page_text
+
+        budget.pages_truncated = budget.page_count - budget.pages_read
+
+
+def iter_pdf_pages_fast(file_bytes: bytes, budget: PageBudget = None):
+    """
+    Fast backend — pdfium decodes each page's content stream straight to
+    text, with no layout analysis. Same contract as iter_pdf_pages.
+    """
+    budget = budget or PageBudget()
+
+    pdf = pdfium.PdfDocument(file_bytes)
+    try:
+        budget.page_count = len(pdf)
+
+        for index in range(budget.page_count):
+            if budget.exhausted():
+                break
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                page_text = textpage.get_text_range().replace("\r\n", "\n")
+            finally:
+                textpage.close()
+                page.close()
+            budget.pages_read += 1
+            budget.chars += len(page_text)
+            yield page_text
+
+        budget.pages_truncated = budget.page_count - budget.pages_read
+    finally:
+        pdf.close()
+
+
+PDF_BACKENDS = {"pdfplumber": iter_pdf_pages}
+if pdfium is not None:
+    PDF_BACKENDS["fast"] = iter_pdf_pages_fast
+
+
+def extract_text_from_pdf(
+    file_bytes: bytes,
+    budget: PageBudget = None,
+    backend: str = "pdfplumber"
+) -> str:
+    parts = []
+    for page_text in PDF_BACKENDS[backend](file_bytes, budget):
+        if page_text:
+            parts.append(page_text + "\n")
+    text = "".join(parts)
+
+    if budget is not None and budget.max_chars is not None:
+        text = text[:budget.max_chars]
     return text
 
 
-def extract_text_from_docx(file_bytes: bytes) -> str:
-    text = ""
+def extract_pdf_text_auto(file_bytes: bytes, budget: PageBudget = None) -> tuple:
+    """
+    Try the fast backend first and fall back to pdfplumber only when it
+    returns too little text. Returns (text, name of the backend used).
+    """
+    budget = budget or PageBudget()
+
+    if "fast" in PDF_BACKENDS:
+        try:
+            text = extract_text_from_pdf(file_bytes, budget, "fast")
+            if len(text.strip()) >= FAST_PATH_MIN_CHARS_PER_PAGE * max(budget.pages_read, 1):
+                return text, "fast"
+        except Exception:
+            pass
+        budget.reset()
+
+    return extract_text_from_pdf(file_bytes, budget, "pdfplumber"), "pdfplumber"
+
+
+def extract_text_from_docx(file_bytes: bytes, budget: PageBudget = None) -> str:
+    budget = budget or PageBudget()
+    parts = []
     doc = Document(io.BytesIO(file_bytes))
     for paragraph in doc.paragraphs:
+        if budget.max_chars is not None and budget.chars >= budget.max_chars:
+            break
         if paragraph.text.strip():
-            text += paragraph.text + "\n"
+            parts.append(paragraph.text + "\n")
+            budget.chars += len(paragraph.text) + 1
+    text = "".join(parts)
+
+    if budget.max_chars is not None:
+        text = text[:budget.max_chars]
     return text
 
 
@@ -31,30 +171,53 @@ def clean_text(text: str) -> str:
     return text
 
 
-def parse_document(file_bytes: bytes, filename: str) -> dict:
+def parse_document(
+    file_bytes: bytes,
+    filename: str,
+    max_pages: int = None,
+    max_chars: int = None,
+    pdf_backend: str = "pdfplumber"
+) -> dict:
+    """
+    Extract and clean resume text
+    max_pages / max_chars bound the work done on very long documents;
+    pages skipped because of them are reported as pages_truncated.
+    pdf_backend is a PDF_BACKENDS name, or "auto" for fast-with-fallback.
+    Failures say whether trying again could help: "retryable" is True only
+    for I/O errors, timeouts and running out of memory — never for the
+    content of the file itself.
+    """
     filename_lower = filename.lower()
+    budget = PageBudget(max_pages, max_chars)
+    extractor = None
 
     try:
         if filename_lower.endswith('.pdf'):
-            raw_text = extract_text_from_pdf(file_bytes)
+            if pdf_backend == "auto":
+                raw_text, extractor = extract_pdf_text_auto(file_bytes, budget)
+            else:
+                raw_text = extract_text_from_pdf(file_bytes, budget, pdf_backend)
+                extractor = pdf_backend
             file_type = "pdf"
 
         elif filename_lower.endswith('.docx'):
-            raw_text = extract_text_from_docx(file_bytes)
+            raw_text = extract_text_from_docx(file_bytes, budget)
             file_type = "docx"
 
         else:
             return {
                 "success": False,
                 "error": "Unsupported file type. Please upload PDF or DOCX only.",
-                "text": None
+                "text": None,
+                "retryable": False
             }
 
         if not raw_text or len(raw_text.strip()) < 50:
             return {
                 "success": False,
                 "error": "Could not extract text. File might be scanned or image-based.",
-                "text": None
+                "text": None,
+                "retryable": False
             }
 
         clean = clean_text(raw_text)
@@ -65,6 +228,9 @@ def parse_document(file_bytes: bytes, filename: str) -> dict:
             "raw_text": raw_text,
             "clean_text": clean,
             "word_count": len(clean.split()),
+            "page_count": budget.page_count,
+            "pages_truncated": budget.pages_truncated,
+            "extractor": extractor,
             "error": None
         }
 
@@ -72,5 +238,6 @@ def parse_document(file_bytes: bytes, filename: str) -> dict:
         return {
             "success": False,
             "error": f"Failed to parse document: {str(e)}",
-            "text": None
+            "text": None,
+            "retryable": isinstance(e, (OSError, TimeoutError, MemoryError))
         }
\ No newline at end of file
@@ -0,0 +1,290 @@
+import json
+import os
+import threading
+
+import numpy as np
+
+# Persistent store of job-posting embeddings for "best matching jobs".
+#
+# On disk (one directory):
+#   vectors.f32  — memory-mapped float32 matrix, one L2-normalized row per slot
+#   meta.json    — posting id -> row, per-posting metadata, free rows
+#   index.npz    — optional IVF index (centroids + row assignments)
+#
+# Removing a posting frees its row for reuse, so add/remove never rebuild
+# the matrix; it only grows (doubling) when every row is in use.
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    # partial selection, then sort only the k winners
+    if k >= len(scores):
+        return np.argsort(-scores)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+class PostingStore:
+    """
+    Memory-mapped matrix of normalized JD embeddings plus metadata.
+
+    search() scores every stored posting with one matrix-vector product
+    (cosine similarity, since rows and query are normalized). For very
+    large stores build_index() adds an IVF index: postings are clustered
+    around k-means centroids and a query only scores the rows of its
+    `nprobe` closest clusters. New postings join their nearest cluster,
+    so the index stays usable without a rebuild.
+    """
+
+    def __init__(self, directory: str, dim: int = 384, initial_capacity: int = 1024):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._vectors_path = os.path.join(directory, "vectors.f32")
+        self._meta_path = os.path.join(directory, "meta.json")
+        self._index_path = os.path.join(directory, "index.npz")
+        self._lock = threading.RLock()
+
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, "r") as f:
+                meta = json.load(f)
+            self.dim = meta["dim"]
+            self._capacity = meta["capacity"]
+            self._high_water = meta["high_water"]
+            self._rows = meta["rows"]            # posting id -> row
+            self._metadata = meta["metadata"]    # posting id -> dict
+            self._free = meta["free"]            # reusable rows
+        else:
+            self.dim = dim
+            self._capacity = initial_capacity
+            self._high_water = 0
+            self._rows = {}
+            self._metadata = {}
+            self._free = []
+
+        self._matrix = self._open_matrix(self._capacity)
+        self._ids = [None] * self._capacity
+        for posting_id, row in self._rows.items():
+            self._ids[row] = posting_id
+
+        self._centroids = None
+        self._assignments = None
+        self._clusters = None
+        if os.path.exists(self._index_path):
+            index = np.load(self._index_path)
+            self._centroids = index["centroids"]
+            self._assignments = np.full(self._capacity, -1, dtype=np.int32)
+            stored = index["assignments"]
+            self._assignments[:len(stored)] = stored
+            self._rebuild_clusters()
+
+    # -----------------------------
+    # storage
+    # -----------------------------
+    def _open_matrix(self, capacity: int) -> np.memmap:
+        size = capacity * self.dim * 4
+        mode = "r+" if os.path.exists(self._vectors_path) else "w+"
+        if mode == "r+" and os.path.getsize(self._vectors_path) < size:
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(size)
+        return np.memmap(self._vectors_path, dtype=np.float32, mode=mode,
+                         shape=(capacity, self.dim))
+
+    def _grow(self):
+        self._matrix.flush()
+        del self._matrix
+        self._capacity *= 2
+        self._matrix = self._open_matrix(self._capacity)
+        self._ids.extend([None] * (self._capacity - len(self._ids)))
+        if self._assignments is not None:
+            grown = np.full(self._capacity, -1, dtype=np.int32)
+            grown[:len(self._assignments)] = self._assignments
+            self._assignments = grown
+
+    def flush(self):
+        """
+        Persist vectors and metadata (metadata written atomically)
+        """
+        with self._lock:
+            self._matrix.flush()
+            meta = {
+                "dim": self.dim,
+                "capacity": self._capacity,
+                "high_water": self._high_water,
+                "rows": self._rows,
+                "metadata": self._metadata,
+                "free": self._free,
+            }
+            tmp_path = self._meta_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, self._meta_path)
+
+            if self._centroids is not None:
+                np.savez(self._index_path + ".tmp.npz",
+                         centroids=self._centroids,
+                         assignments=self._assignments[:self._high_water])
+                os.replace(self._index_path + ".tmp.npz", self._index_path)
+
+    # -----------------------------
+    # add / remove
+    # -----------------------------
+    def add(self, posting_id: str, embedding: np.ndarray, metadata: dict = None):
+        """
+        Insert or replace a posting — no rebuild, just one row written
+        """
+        vector = _normalize(embedding)
+        if vector.shape[0] != self.dim:
+            raise ValueError(f"Expected a {self.dim}-dim embedding, got {vector.shape[0]}")
+
+        with self._lock:
+            if posting_id in self._rows:
+                row = self._rows[posting_id]
+            elif self._free:
+                row = self._free.pop()
+            else:
+                if self._high_water >= self._capacity:
+                    self._grow()
+                row = self._high_water
+                self._high_water += 1
+
+            self._matrix[row] = vector
+            self._rows[posting_id] = row
+            self._ids[row] = posting_id
+            self._metadata[posting_id] = metadata or {}
+
+            if self._centroids is not None:
+                self._assign(row, vector)
+
+    def remove(self, posting_id: str) -> bool:
+        with self._lock:
+            row = self._rows.pop(posting_id, None)
+            if row is None:
+                return False
+            self._metadata.pop(posting_id, None)
+            self._ids[row] = None
+            self._matrix[row] = 0.0
+            self._free.append(row)
+
+            if self._centroids is not None:
+                cluster = self._assignments[row]
+                if cluster >= 0:
+                    self._clusters[cluster].discard(row)
+                self._assignments[row] = -1
+            return True
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, posting_id: str) -> bool:
+        return posting_id in self._rows
+
+    def get_metadata(self, posting_id: str) -> dict:
+        return self._metadata.get(posting_id)
+
+    # -----------------------------
+    # approximate index (IVF)
+    # -----------------------------
+    def build_index(self, n_lists: int = None, iterations: int = 10, seed: int = 0):
+        """
+        Cluster stored postings with spherical k-means for approximate search
+        """
+        with self._lock:
+            rows = np.array(sorted(self._rows.values()), dtype=np.int64)
+            if len(rows) == 0:
+                return
+            vectors = np.asarray(self._matrix[rows])
+            n_lists = n_lists or max(1, int(np.sqrt(len(rows))))
+            n_lists = min(n_lists, len(rows))
+
+            rng = np.random.default_rng(seed)
+            centroids = vectors[rng.choice(len(rows), n_lists, replace=False)].copy()
+            for _ in range(iterations):
+                labels = np.argmax(vectors @ centroids.T, axis=1)
+                for c in range(n_lists):
+                    members = vectors[labels == c]
+                    if len(members):
+                        centroids[c] = _normalize(members.sum(axis=0))
+            labels = np.argmax(vectors @ centroids.T, axis=1)
+
+            self._centroids = centroids.astype(np.float32)
+            self._assignments = np.full(self._capacity, -1, dtype=np.int32)
+            self._assignments[rows] = labels
+            self._rebuild_clusters()
+
+    def drop_index(self):
+        with self._lock:
+            self._centroids = self._assignments = self._clusters = None
+            if os.path.exists(self._index_path):
+                os.remove(self._index_path)
+
+    @property
+    def has_index(self) -> bool:
+        return self._centroids is not None
+
+    def _rebuild_clusters(self):
+        self._clusters = [set() for _ in range(len(self._centroids))]
+        for row in np.flatnonzero(self._assignments >= 0):
+            if self._ids[row] is not None:
+                self._clusters[self._assignments[row]].add(int(row))
+
+    def _assign(self, row: int, vector: np.ndarray):
+        previous = self._assignments[row]
+        if previous >= 0:
+            self._clusters[previous].discard(row)
+        cluster = int(np.argmax(self._centroids @ vector))
+        self._assignments[row] = cluster
+        self._clusters[cluster].add(row)
+
+    # -----------------------------
+    # queries
+    # -----------------------------
+    def search(self, query_embedding: np.ndarray, k: int = 10,
+               approximate: bool = None, nprobe: int = 8) -> list:
+        """
+        Top-k postings by cosine similarity to the query embedding
+        approximate=None uses the IVF index whenever one is built
+        Returns list of {"posting_id", "score", "metadata"}, best first
+        """
+        query = _normalize(query_embedding)
+
+        with self._lock:
+            if not self._rows or k <= 0:
+                return []
+
+            if approximate is None:
+                approximate = self.has_index
+            if approximate and not self.has_index:
+                raise ValueError("No approximate index built — call build_index() first")
+
+            if approximate:
+                probe = _top_k(self._centroids @ query, min(nprobe, len(self._centroids)))
+                rows = np.fromiter(
+                    (row for c in probe for row in self._clusters[c]), dtype=np.int64
+                )
+                if len(rows) == 0:
+                    return []
+                scores = np.asarray(self._matrix[rows]) @ query
+            else:
+                # one matrix-vector product over every slot; free slots are
+                # zero vectors, masked out below
+                scores = np.asarray(self._matrix[:self._high_water]) @ query
+                rows = np.arange(self._high_water)
+                if self._free:
+                    keep = np.ones(self._high_water, dtype=bool)
+                    keep[self._free] = False
+                    rows, scores = rows[keep], scores[keep]
+
+            best = _top_k(scores, min(k, len(scores)))
+            return [
+                {
+                    "posting_id": self._ids[rows[i]],
+                    "score": round(float(scores[i]) * 100, 2),
+                    "metadata": self._metadata[self._ids[rows[i]]],
+                }
+                for i in best
+            ]
@@ -1,5 +1,14 @@
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row (or a single vector) so dot products are cosines
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
 
 
 def calculate_overall_score(resume_embedding: np.ndarray, job_embedding: np.ndarray) -> float:
@@ -7,40 +16,101 @@ def calculate_overall_score(resume_embedding: np.ndarray, job_embedding: np.ndar
     Compare full resume vs full job description
     Returns match percentage 0-100
     """
-    score = cosine_similarity(
-        resume_embedding.reshape(1, -1),
-        job_embedding.reshape(1, -1)
-    )[0][0]
+    score = normalize_rows(resume_embedding) @ normalize_rows(job_embedding)
 
     # convert to percentage and round
     return round(float(score) * 100, 2)
 
 
-def rank_chunks(chunk_embeddings: list, job_embedding: np.ndarray) -> dict:
+def score_chunks(chunk_embeddings: np.ndarray, job_embeddings: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity (0-100) of every chunk against one or many JDs
+    chunk_embeddings — (n_chunks, dim) matrix
+    job_embeddings — (dim,) vector or (n_jobs, dim) matrix
+    Returns (n_chunks,) for one JD, (n_jobs, n_chunks) for many —
+    a single matrix product either way
+    """
+    if len(chunk_embeddings) == 0:
+        return np.zeros((0,) if np.ndim(job_embeddings) == 1 else (len(job_embeddings), 0))
+    cosines = normalize_rows(job_embeddings) @ normalize_rows(chunk_embeddings).T
+    return cosines.astype(np.float64) * 100
+
+
+def _extreme_k(scores: np.ndarray, k: int, highest: bool) -> np.ndarray:
+    # the k chunks a stable sort by score (highest first) puts at the front
+    # (highest) or the back (lowest): ties at the cut go to the earliest
+    # chunks for the top, the latest for the bottom
+    keyed = -scores if highest else scores
+    threshold = np.partition(keyed, k - 1)[k - 1]
+    inside = np.flatnonzero(keyed < threshold)
+    tied = np.flatnonzero(keyed == threshold)
+    needed = k - len(inside)
+    tied = tied[:needed] if highest else tied[len(tied) - needed:]
+    chosen = np.concatenate([inside, tied])
+    return chosen[np.lexsort((chosen, -scores[chosen]))]  # highest first, ties by position
+
+
+def top_bottom_k(scores: np.ndarray, k: int = 2) -> tuple:
+    """
+    Indices of the k highest and k lowest scores, each ordered highest first
+    with ties broken by chunk position — the same picks and order as a full
+    stable sort, but only the 2k winners are sorted
+    """
+    n = len(scores)
+    if n <= k:
+        order = np.argsort(-scores, kind="stable")
+        return order, order
+    return _extreme_k(scores, k, highest=True), _extreme_k(scores, k, highest=False)
+
+
+def rank_chunks(
+    chunk_embeddings: np.ndarray,
+    job_embedding: np.ndarray,
+    chunk_texts: list,
+    k: int = 2,
+    chunk_sections: list = None
+) -> dict:
     """
     Compare each resume chunk against job description
     Returns most and least relevant sections
+    all_chunks is in document order, not sorted by score as it once was
+    (sort it by "score" if you need that); most_relevant / least_relevant
+    are what a stable sort by score gives, ties in document order
     """
-    scored_chunks = []
+    scores = score_chunks(chunk_embeddings, job_embedding)
+    return _chunk_results(scores, chunk_texts, k, chunk_sections)
+
 
-    for chunk in chunk_embeddings:
-        score = cosine_similarity(
-            chunk["embedding"].reshape(1, -1),
-            job_embedding.reshape(1, -1)
-        )[0][0]
+def rank_chunks_many(
+    chunk_embeddings: np.ndarray,
+    job_embeddings: np.ndarray,
+    chunk_texts: list,
+    k: int = 2,
+    chunk_sections: list = None
+) -> list:
+    """
+    rank_chunks for many JDs at once — one matrix product for all of them
+    Returns one rank_chunks-style dict per JD
+    """
+    scores = score_chunks(chunk_embeddings, np.atleast_2d(job_embeddings))
+    return [_chunk_results(row, chunk_texts, k, chunk_sections) for row in scores]
 
-        scored_chunks.append({
-            "text": chunk["chunk_text"],
-            "score": round(float(score) * 100, 2)
-        })
 
-    # sort by score highest to lowest
-    scored_chunks.sort(key=lambda x: x["score"], reverse=True)
+def _chunk_results(scores: np.ndarray, chunk_texts: list, k: int, chunk_sections: list = None) -> dict:
+    rounded = np.round(scores, 2)
+    scored_chunks = [
+        {"text": text, "score": float(score)}
+        for text, score in zip(chunk_texts, rounded)
+    ]
+    if chunk_sections is not None:
+        for chunk, section in zip(scored_chunks, chunk_sections):
+            chunk["section"] = section
+    top, bottom = top_bottom_k(rounded, k)
 
     return {
         "all_chunks": scored_chunks,
-        "most_relevant": scored_chunks[:2],   # top 2
-        "least_relevant": scored_chunks[-2:]  # bottom 2
+        "most_relevant": [scored_chunks[i] for i in top],      # top k
+        "least_relevant": [scored_chunks[i] for i in bottom]   # bottom k
     }
 
 
@@ -72,7 +142,9 @@ def analyze_match(embeddings: dict) -> dict:
 
     chunk_results = rank_chunks(
         embeddings["chunk_embeddings"],
-        embeddings["job_embedding"]
+        embeddings["job_embedding"],
+        embeddings["chunk_texts"],
+        chunk_sections=embeddings.get("chunk_sections")
     )
 
     return {
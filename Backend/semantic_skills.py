@@ -0,0 +1,208 @@
+import os
+import re
+import threading
+
+import numpy as np
+
+import config
+import embedder
+from taxonomy import Taxonomy, TaxonomyHits, get_taxonomy
+
+# Optional semantic stage after the exact taxonomy scan: catches skills
+# written in ways no alias covers ("k8s clusters", "PyTorch Lightning").
+#
+#   1. candidate noun phrases from the text (spaCy noun chunks, or a
+#      regex splitter when spaCy / its model isn't installed)
+#   2. phrases that already contain an exact skill hit are dropped —
+#      the semantic stage only pays for what the regexes missed
+#   3. the rest are embedded in one batch and compared to a precomputed
+#      matrix of skill-name / alias embeddings with one matrix product
+#   4. a phrase maps to its closest skill when the cosine clears the threshold
+
+try:
+    import spacy
+except ImportError:
+    spacy = None
+
+MAX_PHRASE_WORDS = 5
+
+_STOP_WORDS = frozenset("""
+a an the and or with using use used in on of for to at by from as via including
+into over under our your their my we i you they he she it its this that these those
+is are was were be been will can also such other various etc experience experienced
+strong knowledge skills proficient familiar working understanding years year
+""".split())
+
+_SEGMENT_SPLIT = re.compile(r"[,;:()\[\]|•]|\.(?=\s|$)")
+_WORD = re.compile(r"[A-Za-z0-9][\w+#.\-]*")
+
+_nlp = None
+_nlp_lock = threading.Lock()
+
+
+def _get_nlp():
+    # spaCy pipeline for noun chunks, or None to use the regex fallback
+    global _nlp
+    if _nlp is None and spacy is not None:
+        with _nlp_lock:
+            if _nlp is None:
+                try:
+                    _nlp = spacy.load("en_core_web_sm", disable=["ner", "lemmatizer"])
+                except OSError:
+                    _nlp = False  # model not downloaded
+    return _nlp or None
+
+
+def _trim(words: list) -> list:
+    # drop stop words at either end ("the PyTorch framework we" -> "PyTorch framework")
+    start, end = 0, len(words)
+    while start < end and words[start].lower() in _STOP_WORDS:
+        start += 1
+    while end > start and words[end - 1].lower() in _STOP_WORDS:
+        end -= 1
+    return words[start:end]
+
+
+def _regex_phrases(text: str) -> list:
+    phrases = []
+    for segment in _SEGMENT_SPLIT.split(text):
+        current = []
+        for word in _WORD.findall(segment):
+            if word.lower() in _STOP_WORDS:
+                if current:
+                    phrases.append(current)
+                current = []
+            else:
+                current.append(word)
+        if current:
+            phrases.append(current)
+    return phrases
+
+
+def extract_phrases(text: str) -> list:
+    """
+    Candidate skill phrases — noun chunks, deduplicated (case-insensitive),
+    at most MAX_PHRASE_WORDS words each, in order of first appearance
+    """
+    nlp = _get_nlp()
+    if nlp is not None:
+        raw = [[token.text for token in chunk] for chunk in nlp(text).noun_chunks]
+    else:
+        raw = _regex_phrases(text)
+
+    phrases = {}
+    for words in raw:
+        words = _trim(words)
+        if not words or len(words) > MAX_PHRASE_WORDS:
+            continue
+        phrase = " ".join(words)
+        if len(phrase) > 1:
+            phrases.setdefault(phrase.lower(), phrase)
+    return list(phrases.values())
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class SkillEmbeddingIndex:
+    """
+    Normalized embedding of every skill name and alias in a taxonomy,
+    one row per pattern (row i belongs to skill taxonomy.pattern_skills[i]).
+
+    Computed once per taxonomy version and embedding model, and saved
+    under `directory` so restarts and worker processes load it instead
+    of re-encoding.
+    """
+
+    def __init__(self, taxonomy: Taxonomy, directory: str = None):
+        self.taxonomy = taxonomy
+        self.pattern_skills = np.array(taxonomy.pattern_skills, dtype=np.int64)
+
+        path = None
+        if directory:
+            safe_model = re.sub(r"[^\w.-]", "_", embedder.model_id())
+            path = os.path.join(directory, f"{taxonomy.version}-{safe_model}.npy")
+
+        if path and os.path.exists(path):
+            self.matrix = np.load(path)
+        else:
+            self.matrix = _normalize_rows(
+                np.asarray(embedder.encode_texts(list(taxonomy.patterns)), dtype=np.float32)
+            )
+            if path:
+                os.makedirs(directory, exist_ok=True)
+                np.save(path + ".tmp.npy", self.matrix)
+                os.replace(path + ".tmp.npy", path)
+
+    def match(self, phrases: list, threshold: float) -> dict:
+        """
+        Best skill for each phrase, if its cosine >= threshold
+        Returns {skill name: (phrase, score)} keeping the best phrase per skill
+        """
+        if not phrases:
+            return {}
+
+        vectors = _normalize_rows(np.asarray(embedder.encode_texts(phrases), dtype=np.float32))
+        similarity = vectors @ self.matrix.T          # (phrases, patterns)
+        best = similarity.argmax(axis=1)
+        scores = similarity[np.arange(len(phrases)), best]
+
+        matches = {}
+        for i in np.flatnonzero(scores >= threshold):
+            skill = self.taxonomy.skills[self.pattern_skills[best[i]]].name
+            score = float(scores[i])
+            if skill not in matches or score > matches[skill][1]:
+                matches[skill] = (phrases[i], score)
+        return matches
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_skill_index() -> SkillEmbeddingIndex:
+    """
+    Shared index for the current taxonomy (rebuilt when its version changes)
+    """
+    global _index
+    taxonomy = get_taxonomy()
+    if _index is None or _index.taxonomy.version != taxonomy.version:
+        with _index_lock:
+            if _index is None or _index.taxonomy.version != taxonomy.version:
+                _index = SkillEmbeddingIndex(taxonomy, config.SKILL_EMBEDDINGS_DIR)
+    return _index
+
+
+def semantic_skills(text: str, hits: TaxonomyHits, threshold: float = None) -> dict:
+    """
+    Skills found semantically that the exact scan (`hits`) missed
+    Returns {skill name: {"phrase", "score"}}
+    """
+    threshold = config.SEMANTIC_SKILL_THRESHOLD if threshold is None else threshold
+    taxonomy = get_taxonomy()
+
+    # exact hits short-circuit: phrases containing a known skill are skipped
+    phrases = [
+        phrase for phrase in extract_phrases(text)
+        if not taxonomy.scan(phrase).skills
+    ][:config.SEMANTIC_MAX_PHRASES]
+
+    found = set(hits.skills)
+    return {
+        skill: {"phrase": phrase, "score": round(score * 100, 2)}
+        for skill, (phrase, score) in get_skill_index().match(phrases, threshold).items()
+        if skill not in found
+    }
+
+
+def with_semantic_skills(hits: TaxonomyHits, matches: dict) -> TaxonomyHits:
+    """
+    hits with the semantic matches added to its skills (keywords unchanged —
+    ATS keyword matching stays literal)
+    """
+    if not matches:
+        return hits
+    return hits._replace(skills=tuple(sorted(set(hits.skills) | set(matches))))
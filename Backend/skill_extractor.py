@@ -1,24 +1,7 @@
-import json
-import os
-import re
+import numpy as np
 
-# load skills dictionary
-SKILLS_PATH = os.path.join(os.path.dirname(__file__), 'skills.json')
-with open(SKILLS_PATH, 'r') as f:
-    SKILLS_DATA = json.load(f)
-
-# flatten skills into a list of dicts with name + all aliases
-ALL_SKILLS = []
-
-for category, category_data in SKILLS_DATA["technical_skills_taxonomy"].items():
-    for skill_obj in category_data["skills"]:
-        skill_entry = {
-            "name": skill_obj["name"],
-            "patterns": [skill_obj["name"]] + skill_obj.get("aliases", [])
-        }
-        ALL_SKILLS.append(skill_entry)
-
-print(f"[OK] Loaded {len(ALL_SKILLS)} skills from dictionary")
+from matcher import compile_skill_pattern
+from taxonomy import Taxonomy, TaxonomyHits, get_taxonomy, scan_text
 
 
 def match_skill_in_text(skill_entry: dict, text: str) -> bool:
@@ -30,45 +13,78 @@ def match_skill_in_text(skill_entry: dict, text: str) -> bool:
         if not pattern:
             continue
 
-        # escape special regex characters
-        escaped = re.escape(pattern)
-
-        # use word boundary for single word skills
-        # use flexible spacing for multi-word skills
-        if " " in pattern:
-            # multi-word: allow flexible whitespace between words
-            flexible = r'\s+'.join(escaped.split(r'\ '))
-            regex = r'(?i)(?<!\w)' + flexible + r'(?!\w)'
-        else:
-            regex = r'(?i)\b' + escaped + r'\b'
-
-        if re.search(regex, text):
+        # patterns are compiled once and cached
+        # (word boundary for single word skills,
+        # flexible whitespace for multi-word skills)
+        if compile_skill_pattern(pattern).search(text):
             return True
 
     return False
 
 
-def extract_skills(text: str) -> list:
+def extract_skills(text: str, hits: TaxonomyHits = None) -> list:
     """
     Find all skills present in a given text
     Returns list of skill names (canonical names)
+    Pass `hits` from taxonomy.scan_text to reuse an existing scan
+    """
+    if hits is None:
+        hits = scan_text(text)
+    return list(hits.skills)
+
+
+def skill_weights(skills, taxonomy: Taxonomy = None) -> dict:
+    """
+    {canonical skill name: taxonomy category weight}
+    The one skill weighting shared by weighted coverage (job_skill_weights)
+    and candidate ranking (CandidateIndex.rank); unknown names are dropped
     """
-    found_skills = []
+    taxonomy = taxonomy or get_taxonomy()
+    return {skill: taxonomy.by_name[skill].weight for skill in skills if skill in taxonomy.by_name}
 
-    for skill_entry in ALL_SKILLS:
-        if match_skill_in_text(skill_entry, text):
-            found_skills.append(skill_entry["name"])
 
-    return sorted(found_skills)
+def job_skill_weights(job_skills, taxonomy: Taxonomy = None) -> np.ndarray:
+    """
+    The JD's weight vector over the taxonomy — each required skill's
+    skill_weights entry, 0 for every other skill. Compute once per JD.
+    Only valid with presence vectors from the same taxonomy.
+    """
+    taxonomy = taxonomy or get_taxonomy()
+    vector = np.zeros(len(taxonomy), dtype=np.float64)
+    for skill, weight in skill_weights(job_skills, taxonomy).items():
+        vector[taxonomy.index_of[skill]] = weight
+    return vector
 
 
-def get_skill_gap(resume_text: str, job_text: str) -> dict:
+def weighted_coverage(resume_matrix: np.ndarray, job_weights: np.ndarray) -> np.ndarray:
+    """
+    Category-weighted skill coverage (0-100) for each row of a resume
+    presence matrix (taxonomy.matrix) — one matrix-vector product
+    however many resumes are scored against the JD
+    """
+    total = job_weights.sum()
+    if total <= 0:
+        return np.zeros(len(resume_matrix))
+    return np.round(resume_matrix @ job_weights / total * 100, 2)
+
+
+def get_skill_gap(
+    resume_text: str,
+    job_text: str,
+    resume_hits: TaxonomyHits = None,
+    job_hits: TaxonomyHits = None,
+    job_weights: np.ndarray = None,
+    taxonomy: Taxonomy = None
+) -> dict:
     """
     Main function — call this from main.py
     Compares skills in resume vs skills required in job
+    Pass `job_weights` from job_skill_weights to reuse the JD's weight vector,
+    with the `taxonomy` it was computed for (default: the live one)
     """
-    resume_skills = set(extract_skills(resume_text))
-    job_skills = set(extract_skills(job_text))
+    taxonomy = taxonomy or get_taxonomy()
+    resume_skills = set(extract_skills(resume_text, resume_hits))
+    job_skills = set(extract_skills(job_text, job_hits))
 
     matched_skills = resume_skills.intersection(job_skills)
     missing_skills = job_skills - resume_skills
@@ -80,6 +96,17 @@ def get_skill_gap(resume_text: str, job_text: str) -> dict:
     else:
         skill_match_percent = 0.0
 
+    # same ratio, but each skill counts with its category weight
+    if job_weights is None:
+        job_weights = job_skill_weights(job_skills, taxonomy)
+    elif len(job_weights) != len(taxonomy):
+        raise ValueError(
+            f"job_weights cover {len(job_weights)} skills but taxonomy {taxonomy.version} "
+            f"has {len(taxonomy)} — they come from different taxonomy versions"
+        )
+    resume_vector = taxonomy.vector(resume_skills)
+    weighted_skill_match_percent = float(weighted_coverage(resume_vector[None, :], job_weights)[0])
+
     return {
         "resume_skills": sorted(list(resume_skills)),
         "job_skills": sorted(list(job_skills)),
@@ -87,6 +114,7 @@ def get_skill_gap(resume_text: str, job_text: str) -> dict:
         "missing_skills": sorted(list(missing_skills)),
         "extra_skills": sorted(list(extra_skills)),
         "skill_match_percent": skill_match_percent,
+        "weighted_skill_match_percent": weighted_skill_match_percent,
         "total_job_skills": len(job_skills),
         "total_matched": len(matched_skills),
         "total_missing": len(missing_skills)
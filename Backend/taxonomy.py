@@ -0,0 +1,335 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import NamedTuple
+
+import numpy as np
+
+from logs import get_logger
+from matcher import TaxonomyMatcher
+
+logger = get_logger(__name__)
+
+# single source of truth for the skills dictionary
+# (skill_extractor.py and ats_scorer.py both query this index)
+TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), 'skills.json')
+
+# versions kept after a reload, for work prepared against an older one
+RECENT_VERSIONS = 4
+
+
+class SkillRecord(NamedTuple):
+    name: str
+    aliases: tuple
+    category: str
+    weight: float
+
+
+class TaxonomyHits(NamedTuple):
+    # canonical names of every skill found, sorted
+    skills: tuple
+    # skill names / aliases found as JD keywords, in taxonomy order
+    keywords: tuple
+
+
+class Taxonomy:
+    """
+    Immutable, precompiled index over skills.json.
+
+    Holds every skill with its aliases, category and category weight,
+    plus one compiled matcher so a single `scan` of a text yields both the
+    skill hits (skill_extractor) and the keyword hits (ats_scorer).
+    """
+
+    def __init__(self, data: dict, version: str):
+        self.version = version
+
+        skills = []
+        weights = {}
+        for category, category_data in data["technical_skills_taxonomy"].items():
+            weight = float(category_data.get("weight", 1.0))
+            weights[category] = weight
+            for skill_obj in category_data["skills"]:
+                skills.append(SkillRecord(
+                    name=skill_obj["name"],
+                    aliases=tuple(skill_obj.get("aliases", [])),
+                    category=category,
+                    weight=weight,
+                ))
+
+        self.skills = tuple(skills)
+        self.by_name = MappingProxyType({skill.name: skill for skill in skills})
+        self.category_weights = MappingProxyType(weights)
+
+        # fixed skill order for presence vectors: position i is self.skills[i]
+        self.index_of = MappingProxyType({skill.name: i for i, skill in enumerate(skills)})
+        self.weights = np.array([skill.weight for skill in skills], dtype=np.float64)
+        self.weights.setflags(write=False)
+
+        # flat (skill index, name / alias) list, original casing preserved
+        aliases = [
+            (index, pattern)
+            for index, skill in enumerate(skills)
+            for pattern in (skill.name,) + skill.aliases
+        ]
+        self.patterns = tuple(pattern for _, pattern in aliases)
+        self.pattern_skills = tuple(index for index, _ in aliases)  # skill index per pattern
+        self._matcher = TaxonomyMatcher(aliases)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def vector(self, skills) -> np.ndarray:
+        """
+        Presence vector (bool, taxonomy order) for canonical skill names
+        Names the taxonomy doesn't know are ignored
+        """
+        vector = np.zeros(len(self.skills), dtype=bool)
+        vector[[self.index_of[name] for name in skills if name in self.index_of]] = True
+        return vector
+
+    def matrix(self, skill_lists) -> np.ndarray:
+        """
+        One presence vector per document, stacked into an (n, skills) bool matrix
+        """
+        skill_lists = list(skill_lists)
+        rows, columns = [], []
+        for row, skills in enumerate(skill_lists):
+            for name in skills:
+                if name in self.index_of:
+                    rows.append(row)
+                    columns.append(self.index_of[name])
+        matrix = np.zeros((len(skill_lists), len(self.skills)), dtype=bool)
+        matrix[rows, columns] = True
+        return matrix
+
+    def scan(self, text: str) -> TaxonomyHits:
+        """
+        One pass over text — returns skill hits and JD keyword hits together
+        """
+        skill_indices, alias_indices = self._matcher.scan(text)
+        return TaxonomyHits(
+            skills=tuple(sorted(self.skills[i].name for i in skill_indices)),
+            keywords=tuple(self.patterns[i] for i in sorted(alias_indices)),
+        )
+
+
+def load_taxonomy(path: str = TAXONOMY_PATH) -> Taxonomy:
+    """
+    Read and compile a skills.json file
+    The version id is a short hash of the file contents
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    version = hashlib.sha256(raw).hexdigest()[:12]
+    return Taxonomy(json.loads(raw), version)
+
+
+def _deep_size(obj, seen: set = None) -> int:
+    # rough resident size of a compiled taxonomy: containers, strings,
+    # compiled patterns (their bytecode included) and arrays, shared
+    # objects counted once
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) + (obj.nbytes if obj.base is not None else 0)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_size(vars(obj), seen)
+    return size
+
+
+# -----------------------------
+# Hot reload
+# -----------------------------
+class TaxonomyManager:
+    """
+    Owns the live Taxonomy and replaces it when skills.json changes.
+
+    A reload reads and compiles the new file off to the side, then swaps
+    it in with a single reference assignment — requests already holding
+    the old Taxonomy finish with it, later get_taxonomy() calls see the
+    new one. A file that fails to load leaves the current one in place.
+
+    Executor processes have their own copy: `sync` brings a worker up to
+    the version the parent process scored the request with. The last few
+    versions stay reachable through `get`, so a job prepared just before a
+    reload can finish on the taxonomy it was prepared with.
+    """
+
+    def __init__(self, path: str = TAXONOMY_PATH):
+        self.path = path
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+        self.reloads = 0
+        self.last_reload = None
+
+        self._stamp = self._file_stamp()
+        self.current = load_taxonomy(path)
+        self.matcher_bytes = _deep_size(self.current)
+        self._recent = OrderedDict({self.current.version: self.current})
+
+    def _file_stamp(self) -> tuple:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def reload(self) -> dict:
+        """
+        Recompile from disk and swap in if the contents changed
+        Raises ValueError (current taxonomy kept) when the file can't be loaded
+        """
+        with self._reload_lock:
+            stamp = self._file_stamp()
+            previous = self.current
+            start = time.perf_counter()
+            try:
+                taxonomy = load_taxonomy(self.path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                self._stamp = stamp  # don't retry the same broken file on every check
+                logger.error("Taxonomy reload failed, keeping the current one",
+                             extra={"version": previous.version, "error": str(e)})
+                raise ValueError(f"Could not load {os.path.basename(self.path)}: {e}") from e
+            compile_ms = round((time.perf_counter() - start) * 1000, 2)
+            self._stamp = stamp
+
+            changed = taxonomy.version != previous.version
+            if changed:
+                self.current = taxonomy  # the atomic swap
+                self._recent[taxonomy.version] = taxonomy
+                while len(self._recent) > RECENT_VERSIONS:
+                    self._recent.popitem(last=False)
+                self.matcher_bytes = _deep_size(taxonomy)
+                self.reloads += 1
+            self.last_reload = {
+                "changed": changed,
+                "version": self.current.version,
+                "previous_version": previous.version,
+                "skills": len(self.current),
+                "compile_ms": compile_ms,
+                "matcher_bytes": self.matcher_bytes,
+                "at": time.time(),
+            }
+        if changed:
+            logger.info("Reloaded skills dictionary", extra=self.last_reload)
+        return self.last_reload
+
+    def get(self, version: str) -> Taxonomy:
+        """
+        Taxonomy `version` if it is current or one of the recent ones, else None
+        """
+        return self._recent.get(version)
+
+    def changed_on_disk(self) -> bool:
+        return self._file_stamp() != self._stamp
+
+    def sync(self, version: str):
+        """
+        Reload if this process is behind `version` and the file has changed
+        since the last look (a file edited again meanwhile loads its newer
+        contents; the parent catches up on its next reload)
+        """
+        if version != self.current.version and self.changed_on_disk():
+            try:
+                self.reload()
+            except ValueError:
+                pass  # logged; keep serving the current taxonomy
+
+    # -----------------------------
+    # file watcher
+    # -----------------------------
+    def start_watching(self, interval: float):
+        """
+        Poll skills.json every `interval` seconds, reloading on change
+        """
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="taxonomy-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self):
+        if self._watcher is not None:
+            self._stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+    def _watch(self, interval: float):
+        while not self._stop.wait(interval):
+            if self.changed_on_disk():
+                try:
+                    self.reload()
+                except ValueError:
+                    pass  # logged; try again when the file changes again
+
+    def stats(self) -> dict:
+        return {
+            "version": self.current.version,
+            "skills": len(self.current),
+            "matcher_bytes": self.matcher_bytes,
+            "reloads": self.reloads,
+            "watching": self._watcher is not None,
+            "last_reload": self.last_reload,
+        }
+
+
+# load skills dictionary once at import
+_manager = TaxonomyManager()
+
+logger.info("Loaded skills dictionary", extra={"skills": len(_manager.current), "version": _manager.current.version})
+
+
+def get_taxonomy_manager() -> TaxonomyManager:
+    return _manager
+
+
+def get_taxonomy() -> Taxonomy:
+    """
+    The live taxonomy — hold on to the returned object for the rest of a
+    computation so a concurrent reload can't mix two versions
+    """
+    return _manager.current
+
+
+def taxonomy_for(version: str) -> Taxonomy:
+    """
+    Taxonomy `version` while this process still has it, otherwise the
+    live one — compare the returned .version to tell which you got
+    """
+    if version is None:
+        return _manager.current
+    return _manager.get(version) or _manager.current
+
+
+def call_with_taxonomy(version: str, fn, *args):
+    """
+    Executor entry point: run fn(*args) against taxonomy `version`,
+    reloading this worker first if the parent has moved on
+    """
+    _manager.sync(version)
+    return fn(*args)
+
+
+def scan_text(text: str) -> TaxonomyHits:
+    """
+    Scan a document against the taxonomy once
+    Pass the result to get_skill_gap / calculate_ats_score to avoid rescans
+    """
+    return get_taxonomy().scan(text)
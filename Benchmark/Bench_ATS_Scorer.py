@@ -0,0 +1,84 @@
+import sys
+import os
+import random
+import re
+import time
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import corpus
+from ats_scorer import (
+    achievement_score,
+    compile_jd_keywords,
+    keyword_match_score,
+    scan_resume,
+    section_structure_score,
+)
+from taxonomy import get_taxonomy
+
+
+def legacy_components(resume_text: str, jd_keywords: list) -> tuple:
+    # the original components: one regex per keyword, section and action word
+    matched = [keyword for keyword, pattern in jd_keywords if pattern.search(resume_text)]
+
+    text_lower = resume_text.lower()
+    sections = 0
+    for pattern in (r'\b(experience|projects?)\b', r'\beducation\b',
+                    r'\bskills?\b', r'\b(summary|objective|career)\b'):
+        if re.search(pattern, text_lower):
+            sections += 25
+
+    count = len(re.findall(r'\d+\.?\d*\s*%', resume_text))
+    count += len(re.findall(r'\b\d+\s+[a-zA-Z]+', resume_text))
+    for word in ['improved', 'achieved', 'reduced', 'increased',
+                 'built', 'designed', 'developed', 'deployed']:
+        count += len(re.findall(r'\b' + word + r'\b', resume_text, re.IGNORECASE))
+
+    return matched, float(sections), min(count * 10, 100.0)
+
+
+def single_pass_components(resume_text: str, jd_keywords: list) -> tuple:
+    scan = scan_resume(resume_text)
+    return (
+        keyword_match_score(resume_text, "", jd_keywords=jd_keywords, scan=scan)["matched"],
+        section_structure_score(resume_text, scan),
+        achievement_score(resume_text, scan),
+    )
+
+
+def bench(fn, texts: list, jd_keywords: list, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text, jd_keywords)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+rng = random.Random(21)
+skills = [skill.name for skill in get_taxonomy().skills]
+jd_keywords = compile_jd_keywords(corpus.job_description(skills, n_skills=20, rng=rng))
+
+corpora = {
+    "1-page resumes x 200": 1,
+    "5-page resumes x 40": 5,
+    "20-page CVs x 10": 20,
+    "50-page CVs x 4": 50,
+}
+
+print(f"\n{'='*78}")
+print(f"{'corpus':<26}{'chars/doc':>11}{'legacy':>11}{'single pass':>13}{'speedup':>10}")
+for label, pages in corpora.items():
+    count = 200 // pages
+    texts = ["\n".join(corpus.resume_lines(skills, pages * corpus.LINES_PER_PAGE, rng))
+             for _ in range(count)]
+    for text in texts:
+        assert legacy_components(text, jd_keywords) == single_pass_components(text, jd_keywords), "result mismatch"
+
+    legacy = bench(legacy_components, texts, jd_keywords)
+    single = bench(single_pass_components, texts, jd_keywords)
+    chars = sum(len(text) for text in texts) // count
+    print(f"{label:<26}{chars:>11}{legacy * 1000:>9.1f}ms{single * 1000:>11.1f}ms{legacy / single:>9.1f}x")
+print(f"{'='*78}")
@@ -0,0 +1,62 @@
+import sys
+import os
+import io
+import random
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from docx import Document
+
+from analysis import analyze_batch, analyze_document, prepare_job
+from taxonomy import get_taxonomy
+
+JOB_DESCRIPTION = """
+We are looking for a backend engineer with strong Python, FastAPI and
+PostgreSQL experience. Docker, Kubernetes and AWS are required; React and
+TypeScript are a plus. Experience with CI/CD using GitHub Actions preferred.
+"""
+
+FILLER = (
+    "designed and deployed services, improved latency by 35 % and reduced "
+    "costs for 12 teams across projects, education, experience, summary"
+).split()
+
+
+def make_resume(n_words: int) -> bytes:
+    skills = [skill.name for skill in get_taxonomy().skills]
+    doc = Document()
+    words = [random.choice(skills) if random.random() < 0.06 else random.choice(FILLER)
+             for _ in range(n_words)]
+    for i in range(0, len(words), 40):
+        doc.add_paragraph(" ".join(words[i:i + 40]))
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+random.seed(3)
+n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+files = [(f"resume_{i}.docx", make_resume(random.randint(300, 1200))) for i in range(n_files)]
+
+# baseline: what N separate /analyze calls do — re-prepare the JD every time
+start = time.perf_counter()
+for filename, file_bytes in files:
+    analyze_document(file_bytes, filename, prepare_job(JOB_DESCRIPTION))
+sequential = time.perf_counter() - start
+
+print(f"\n{'='*60}")
+print(f"{n_files} resumes, one JD")
+print(f"{'per-resume calls':<24}{sequential:>8.2f}s {n_files / sequential:>8.1f} docs/s")
+
+cores = os.cpu_count() or 1
+worker_counts = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+single = None
+for workers in worker_counts:
+    start = time.perf_counter()
+    analyze_batch(JOB_DESCRIPTION, files, max_workers=workers)
+    elapsed = time.perf_counter() - start
+    single = single or elapsed
+    print(f"{f'batch, {workers} worker(s)':<24}{elapsed:>8.2f}s {n_files / elapsed:>8.1f} docs/s"
+          f"   scaling {single / elapsed:.2f}x")
+print(f"{'='*60}")
@@ -0,0 +1,83 @@
+import sys
+import os
+import random
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from candidate_index import CandidateIndex, parse_query
+from skill_extractor import skill_weights
+from taxonomy import get_taxonomy
+
+QUERIES = [
+    "Python AND Docker",
+    "Kubernetes AND PyTorch AND NOT Java",
+    "(React OR Angular) AND NOT TypeScript",
+    "AWS OR Azure OR GCP",
+]
+
+
+def naive_search(candidates: list, tree: tuple) -> list:
+    # scan every candidate's skill set
+    def matches(skills: set, node: tuple) -> bool:
+        kind, value = node
+        if kind == "skill":
+            return value in skills
+        if kind == "not":
+            return not matches(skills, value)
+        combine = all if kind == "and" else any
+        return combine(matches(skills, child) for child in value)
+    return [i for i, skills in enumerate(candidates) if matches(skills, tree)]
+
+
+def naive_rank(candidates: list, weights: dict, k: int) -> list:
+    scores = [(sum(w for s, w in weights.items() if s in skills), -i) for i, skills in enumerate(candidates)]
+    return sorted(scores, reverse=True)[:k]
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+rng = random.Random(23)
+skills = [skill.name for skill in get_taxonomy().skills]
+popularity = [1 / (rank + 1) for rank in range(len(skills))]  # a few skills are everywhere
+trees = [parse_query(query) for query in QUERIES]
+weights = skill_weights(["Python", "Kubernetes", "PyTorch", "AWS", "Docker", "Machine Learning", "SQL"])
+
+print(f"\n{'='*78}")
+print(f"{'candidates':>10}{'build':>9}{'query':>10}{'naive':>11}{'speedup':>9}"
+      f"{'rank':>9}{'naive':>11}{'speedup':>9}")
+for n in (10_000, 100_000, 1_000_000):
+    candidates = [set(rng.choices(skills, popularity, k=rng.randint(3, 15))) for _ in range(n)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = CandidateIndex(tmp, initial_capacity=n)
+        start = time.perf_counter()
+        for begin in range(0, n, 50_000):
+            index.add_many([(f"c{i}", candidates[i], None) for i in range(begin, min(n, begin + 50_000))])
+        build = time.perf_counter() - start
+
+        for query, tree in zip(QUERIES, trees):
+            assert index.search(query)["total"] == len(naive_search(candidates, tree)), query
+        ranked = index.rank(weights, k=20)["candidates"]
+        total_weight = sum(weights.values())
+        expected = [round(score / total_weight * 100, 2) for score, _ in naive_rank(candidates, weights, 20)]
+        assert [c["coverage"] for c in ranked] == expected, "ranking mismatch"
+
+        repeat = 1 if n >= 1_000_000 else 3
+        query = best_of(lambda: [index.search(q, limit=50) for q in QUERIES]) / len(QUERIES)
+        naive = best_of(lambda: [naive_search(candidates, t) for t in trees], repeat) / len(trees)
+        rank = best_of(lambda: index.rank(weights, k=20))
+        naive_ranking = best_of(lambda: naive_rank(candidates, weights, 20), repeat)
+        del index
+
+    print(f"{n:>10}{build:>8.1f}s{query * 1000:>8.2f}ms{naive * 1000:>9.0f}ms{naive / query:>8.0f}x"
+          f"{rank * 1000:>7.1f}ms{naive_ranking * 1000:>9.0f}ms{naive_ranking / rank:>8.0f}x")
+print(f"{'='*78}")
@@ -0,0 +1,55 @@
+import sys
+import os
+import random
+import statistics
+import time
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import config
+import corpus
+from chunker import chunk_text
+from embedder import load_model
+from taxonomy import get_taxonomy
+
+# Latency and throughput of the embedding backends on resume-sized chunks:
+# torch (SentenceTransformer), ONNX fp32 and ONNX int8.
+#
+#   python Benchmark/Bench_Embedder_Backends.py
+
+BATCH_SIZES = (1, 8, 32)
+ROUNDS = 10
+
+rng = random.Random(5)
+skills = [skill.name for skill in get_taxonomy().skills]
+text = " ".join(corpus.resume_lines(skills, 400, rng)) + "."
+chunks = [chunk.text for chunk in chunk_text(text)]
+
+backends = []
+for name, backend, quantized in (("torch", "torch", False),
+                                 ("onnx fp32", "onnx", False),
+                                 ("onnx int8", "onnx", True)):
+    config.EMBED_ONNX_QUANTIZED = quantized
+    try:
+        backends.append((name, load_model(backend)))
+    except Exception as e:
+        print(f"skipping {name}: {e}")
+
+print(f"\n{'='*70}")
+print(f"{len(chunks)} chunks of ~{config.CHUNK_MAX_WORDS} words")
+print(f"{'backend':<12}{'batch':>7}{'p50':>11}{'p95':>11}{'chunks/s':>12}")
+for name, model in backends:
+    model.encode(chunks[:8], convert_to_numpy=True)  # warm up
+    for batch_size in BATCH_SIZES:
+        latency = []
+        for i in range(ROUNDS):
+            batch = [chunks[(i * batch_size + j) % len(chunks)] for j in range(batch_size)]
+            start = time.perf_counter()
+            model.encode(batch, convert_to_numpy=True)
+            latency.append(time.perf_counter() - start)
+        latency.sort()
+        p95 = latency[min(len(latency) - 1, int(0.95 * len(latency)))]
+        print(f"{name:<12}{batch_size:>7}{statistics.median(latency) * 1000:>9.1f}ms"
+              f"{p95 * 1000:>9.1f}ms{batch_size / statistics.mean(latency):>12.1f}")
+print(f"{'='*70}")
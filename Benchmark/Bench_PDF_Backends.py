@@ -0,0 +1,68 @@
+import sys
+import os
+import random
+import resource
+import time
+import tracemalloc
+from multiprocessing import get_context
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import corpus
+from parser import PDF_BACKENDS, parse_document
+from taxonomy import get_taxonomy
+
+# Per-page latency and peak memory of each PDF extraction backend.
+# Every measurement runs in a fresh process so peak RSS isn't shared.
+
+
+def measure(backend: str, pdf_bytes: bytes, pages: int, repeat: int) -> dict:
+    parse_document(pdf_bytes, "warmup.pdf", pdf_backend=backend)
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse_document(pdf_bytes, "resume.pdf", pdf_backend=backend)
+        best = min(best, time.perf_counter() - start)
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # separate run — tracemalloc slows pure-Python code down a lot
+    tracemalloc.start()
+    parse_document(pdf_bytes, "resume.pdf", pdf_backend=backend)
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ms_per_page": best * 1000 / pages,
+        "python_peak_mb": python_peak / (1024 * 1024),
+        # ru_maxrss is in KB on Linux
+        "rss_growth_mb": (rss_after - rss_before) / 1024,
+        "words": result["word_count"],
+        "extractor": result["extractor"],
+    }
+
+
+def main():
+    rng = random.Random(5)
+    skills = [skill.name for skill in get_taxonomy().skills]
+    backends = list(PDF_BACKENDS) + ["auto"]
+    ctx = get_context("spawn")
+
+    print(f"\n{'='*84}")
+    print(f"{'pages':>6}{'backend':>12}{'ms/page':>10}{'py peak MB':>12}{'RSS growth MB':>15}"
+          f"{'words':>8}  used")
+    for pages in (1, 5, 20, 50):
+        pdf_bytes = corpus.make_resume(skills, pages, rng=rng)
+        repeat = 3
+        for backend in backends:
+            with ctx.Pool(1) as pool:
+                r = pool.apply(measure, (backend, pdf_bytes, pages, repeat))
+            print(f"{pages:>6}{backend:>12}{r['ms_per_page']:>10.2f}{r['python_peak_mb']:>12.2f}"
+                  f"{r['rss_growth_mb']:>15.1f}{r['words']:>8}  {r['extractor']}")
+    print(f"{'='*84}")
+
+
+if __name__ == "__main__":
+    main()
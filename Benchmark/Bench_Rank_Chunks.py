@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from scorer import rank_chunks, rank_chunks_many
+
+
+def legacy_rank_chunks(chunk_embeddings: list, job_embedding: np.ndarray) -> dict:
+    # the original implementation: one sklearn call per chunk, full sort
+    scored_chunks = []
+    for chunk in chunk_embeddings:
+        score = cosine_similarity(
+            chunk["embedding"].reshape(1, -1),
+            job_embedding.reshape(1, -1)
+        )[0][0]
+        scored_chunks.append({
+            "text": chunk["chunk_text"],
+            "score": round(float(score) * 100, 2)
+        })
+    scored_chunks.sort(key=lambda x: x["score"], reverse=True)
+    return {
+        "all_chunks": scored_chunks,
+        "most_relevant": scored_chunks[:2],
+        "least_relevant": scored_chunks[-2:]
+    }
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+rng = np.random.default_rng(0)
+dim = 384
+jobs = rng.normal(size=(50, dim)).astype(np.float32)
+
+print(f"\n{'='*78}")
+print(f"{'chunks':>7}{'legacy':>12}{'vectorized':>13}{'speedup':>9}"
+      f"{'50 JDs, loop':>15}{'50 JDs, matmul':>16}")
+for n in (10, 100, 1000, 10000):
+    matrix = rng.normal(size=(n, dim)).astype(np.float32)
+    texts = [f"chunk {i}" for i in range(n)]
+    dicts = [{"chunk_text": t, "embedding": matrix[i]} for i, t in enumerate(texts)]
+
+    new = rank_chunks(matrix, jobs[0], texts)
+    old = legacy_rank_chunks(dicts, jobs[0])
+    assert new["most_relevant"] == old["most_relevant"]
+    assert new["least_relevant"] == old["least_relevant"]
+
+    repeat = 1 if n >= 10000 else 5
+    legacy = best_of(lambda: legacy_rank_chunks(dicts, jobs[0]), repeat)
+    vectorized = best_of(lambda: rank_chunks(matrix, jobs[0], texts), repeat)
+    loop = best_of(lambda: [rank_chunks(matrix, job, texts) for job in jobs], 1)
+    many = best_of(lambda: rank_chunks_many(matrix, jobs, texts), 1)
+    print(f"{n:>7}{legacy * 1000:>10.2f}ms{vectorized * 1000:>11.2f}ms{legacy / vectorized:>8.0f}x"
+          f"{loop * 1000:>13.2f}ms{many * 1000:>14.2f}ms")
+print(f"{'='*78}")
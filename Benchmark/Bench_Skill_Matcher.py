@@ -0,0 +1,78 @@
+import sys
+import os
+import random
+import re
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from skill_extractor import extract_skills
+from taxonomy import get_taxonomy
+
+ALL_SKILLS = [
+    {"name": skill.name, "patterns": [skill.name] + list(skill.aliases)}
+    for skill in get_taxonomy().skills
+]
+
+
+def legacy_extract_skills(text: str) -> list:
+    # the original implementation: build and run one regex per alias
+    found = []
+    for skill_entry in ALL_SKILLS:
+        for pattern in skill_entry["patterns"]:
+            escaped = re.escape(pattern)
+            if " " in pattern:
+                flexible = r'\s+'.join(escaped.split(r'\ '))
+                regex = r'(?i)(?<!\w)' + flexible + r'(?!\w)'
+            else:
+                regex = r'(?i)\b' + escaped + r'\b'
+            if re.search(regex, text):
+                found.append(skill_entry["name"])
+                break
+    return sorted(found)
+
+
+FILLER = (
+    "developed scalable services for the team and improved performance by 30 % "
+    "while mentoring engineers across multiple projects and stakeholders"
+).split()
+
+
+def make_document(n_words: int, skill_ratio: float) -> str:
+    patterns = [p for skill in ALL_SKILLS for p in skill["patterns"]]
+    words = []
+    while len(words) < n_words:
+        if random.random() < skill_ratio:
+            words.append(random.choice(patterns))
+        else:
+            words.append(random.choice(FILLER))
+    return " ".join(words)
+
+
+def bench(fn, corpus: list, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+random.seed(42)
+corpora = {
+    "job descriptions (300 words x 200)": [make_document(300, 0.08) for _ in range(200)],
+    "resumes (800 words x 200)": [make_document(800, 0.05) for _ in range(200)],
+    "long CVs (15k words x 10)": [make_document(15000, 0.02) for _ in range(10)],
+}
+
+print(f"\n{'='*70}")
+print(f"{'corpus':<38}{'legacy':>10}{'compiled':>10}{'speedup':>10}")
+for label, corpus in corpora.items():
+    for text in corpus:
+        assert legacy_extract_skills(text) == extract_skills(text), "result mismatch"
+
+    legacy = bench(legacy_extract_skills, corpus)
+    compiled = bench(extract_skills, corpus)
+    print(f"{label:<38}{legacy * 1000:>8.1f}ms{compiled * 1000:>8.1f}ms{legacy / compiled:>9.1f}x")
+print(f"{'='*70}")
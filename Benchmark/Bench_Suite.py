@@ -0,0 +1,296 @@
+import sys
+import os
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import httpx
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import config
+import corpus
+from Load_Test import percentile
+from ats_scorer import calculate_ats_score, extract_keywords
+from parser import parse_document
+from scorer import rank_chunks
+from skill_extractor import extract_skills, get_skill_gap
+from taxonomy import get_taxonomy
+
+# Reproducible benchmark suite: synthetic resumes / JDs generated from the
+# skills.json taxonomy (fixed seed), each public pipeline function timed on
+# several document sizes, plus /analyze end to end through the ASGI app
+# in-process. Results are written as JSON so two runs can be compared:
+#
+#   python Benchmark/Bench_Suite.py --output bench.json
+#   python Benchmark/Bench_Suite.py --compare bench.json        # exit 1 on regression
+#   python Benchmark/Bench_Suite.py --quick --only parse_document
+#
+# Peak memory is measured in a separate tracemalloc pass (so it doesn't
+# slow the timed runs) and counts Python / numpy allocations in this
+# process — with the default process executor, /analyze work done inside
+# pool workers is not included.
+
+SCHEMA_VERSION = 1
+EMBEDDING_DIM = 384
+SIZES = {"small": 1, "medium": 5, "large": 20}  # resume pages
+QUICK_SIZES = {"small": 1, "medium": 5}
+
+
+def build_corpus(sizes: dict, seed: int) -> dict:
+    """
+    Documents for every size — generated once, identical for a given seed
+    """
+    rng = random.Random(seed)
+    taxonomy = get_taxonomy()
+    skills = [skill.name for skill in taxonomy.skills]
+    job = corpus.job_description(skills, n_skills=16, rng=rng)
+
+    documents = {}
+    for label, pages in sizes.items():
+        lines = corpus.resume_lines(skills, pages * corpus.LINES_PER_PAGE, rng)
+        documents[label] = {
+            "pages": pages,
+            "pdf": corpus.make_pdf([lines[i:i + corpus.LINES_PER_PAGE]
+                                    for i in range(0, len(lines), corpus.LINES_PER_PAGE)]),
+            "docx": corpus.make_docx(lines),
+            "text": "\n".join(lines),
+        }
+    return {"job": job, "documents": documents, "taxonomy_version": taxonomy.version}
+
+
+def unit_vectors(rng: np.random.Generator, n: int) -> np.ndarray:
+    vectors = rng.standard_normal((n, EMBEDDING_DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def function_cases(data: dict) -> list:
+    """
+    [(benchmark name, case label, zero-argument callable)]
+    """
+    job = data["job"]
+    rng = np.random.default_rng(0)
+
+    cases = []
+    for label, doc in data["documents"].items():
+        text = doc["text"]
+        skill_percent = get_skill_gap(text, job)["skill_match_percent"]
+        chunks = max(4, doc["pages"] * 12)  # ~100-word chunks
+        chunk_matrix = unit_vectors(rng, chunks)
+        job_vector = unit_vectors(rng, 1)[0]
+        chunk_texts = [f"chunk {i}" for i in range(chunks)]
+
+        # the function default (pdfplumber) and the backend /analyze is configured with
+        for backend in dict.fromkeys(["pdfplumber", config.PDF_BACKEND]):
+            cases.append((
+                "parse_document", f"pdf-{backend}-{label}",
+                lambda d=doc, b=backend: parse_document(d["pdf"], "resume.pdf", pdf_backend=b)
+            ))
+        cases += [
+            ("parse_document", f"docx-{label}", lambda d=doc: parse_document(d["docx"], "resume.docx")),
+            ("extract_skills", label, lambda t=text: extract_skills(t)),
+            ("extract_keywords", label, lambda t=text: extract_keywords(t)),
+            ("calculate_ats_score", label,
+             lambda t=text, p=skill_percent: calculate_ats_score(t, job, p)),
+            ("rank_chunks", f"{chunks}-chunks",
+             lambda m=chunk_matrix, v=job_vector, c=chunk_texts: rank_chunks(m, v, c)),
+        ]
+    return cases
+
+
+def measure(fn, iterations: int, warmup: int = 1) -> dict:
+    for _ in range(warmup):
+        fn()
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    return summarize(latencies, elapsed)
+
+
+def summarize(latencies: list, elapsed: float) -> dict:
+    return {
+        "iterations": len(latencies),
+        "p50_ms": round(statistics.median(latencies) * 1000, 4),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 4),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 4),
+        "throughput_per_s": round(len(latencies) / elapsed, 3) if elapsed else 0.0,
+    }
+
+
+def peak_memory(fn) -> int:
+    """
+    Peak bytes allocated (above the starting point) during one call
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - before)
+
+
+# -----------------------------
+# /analyze end to end (in-process ASGI)
+# -----------------------------
+async def _analyze_cases(data: dict, iterations: int) -> list:
+    import main  # imported here so --only can skip starting the app
+
+    results = []
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.app.router.lifespan_context(main.app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+
+            async def analyze(doc: dict, fmt: str):
+                # cold path every time — no parse / result cache hits
+                main.parse_cache.clear()
+                main.result_cache.clear()
+                response = await client.post(
+                    "/analyze",
+                    files={"resume": (f"resume.{fmt}", doc[fmt])},
+                    data={"job_description": data["job"]},
+                )
+                if response.status_code != 200 or not response.json().get("success"):
+                    raise RuntimeError(f"/analyze failed: {response.status_code} {response.text[:200]}")
+
+            for label, doc in data["documents"].items():
+                for fmt in ("pdf", "docx"):
+                    await analyze(doc, fmt)  # warmup (starts pool workers)
+                    latencies = []
+                    start = time.perf_counter()
+                    for _ in range(iterations):
+                        call_start = time.perf_counter()
+                        await analyze(doc, fmt)
+                        latencies.append(time.perf_counter() - call_start)
+                    stats = summarize(latencies, time.perf_counter() - start)
+
+                    tracemalloc.start()
+                    before, _ = tracemalloc.get_traced_memory()
+                    tracemalloc.reset_peak()
+                    await analyze(doc, fmt)
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+
+                    results.append({
+                        "name": "analyze_endpoint", "case": f"{fmt}-{label}",
+                        **stats, "peak_memory_bytes": max(0, peak - before),
+                    })
+    return results
+
+
+# -----------------------------
+# reporting / comparison
+# -----------------------------
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Benchmarks whose p50 latency or peak memory grew by more than `threshold`
+    (a fraction) relative to the baseline run
+    """
+    previous = {(r["name"], r["case"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["name"], result["case"]))
+        if before is None:
+            continue
+        for metric in ("p50_ms", "peak_memory_bytes"):
+            old, new = before.get(metric), result.get(metric)
+            if old and new and new > old * (1 + threshold):
+                regressions.append({
+                    "name": result["name"], "case": result["case"], "metric": metric,
+                    "baseline": old, "current": new, "ratio": round(new / old, 3),
+                })
+    return regressions
+
+
+def print_table(results: list):
+    print(f"\n{'='*100}")
+    print(f"{'benchmark':<22}{'case':<24}{'p50':>11}{'p95':>11}{'ops/s':>11}{'peak mem':>12}")
+    for r in results:
+        print(f"{r['name']:<22}{r['case']:<24}{r['p50_ms']:>9.3f}ms{r['p95_ms']:>9.3f}ms"
+              f"{r['throughput_per_s']:>11.1f}{r['peak_memory_bytes'] / 1024:>10.0f}KB")
+    print(f"{'='*100}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ResumeIQ benchmark suite (JSON output)")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run; exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown / memory growth vs. the baseline (0.25 = 25%%)")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--quick", action="store_true", help="skip the large documents")
+    parser.add_argument("--only", nargs="+", help="benchmark names to run (e.g. parse_document analyze_endpoint)")
+    args = parser.parse_args()
+
+    sizes = QUICK_SIZES if args.quick else SIZES
+    data = build_corpus(sizes, args.seed)
+    wanted = set(args.only) if args.only else None
+
+    results = []
+    for name, case, fn in function_cases(data):
+        if wanted and name not in wanted:
+            continue
+        stats = measure(fn, args.iterations)
+        results.append({"name": name, "case": case, **stats, "peak_memory_bytes": peak_memory(fn)})
+
+    if not wanted or "analyze_endpoint" in wanted:
+        # end-to-end requests are much slower — fewer iterations
+        results += asyncio.run(_analyze_cases(data, max(3, args.iterations // 4)))
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "sizes": sizes,
+        "taxonomy_version": data["taxonomy_version"],
+        "results": results,
+    }
+
+    print_table(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"[OK] Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for r in regressions:
+            print(f"❌ {r['name']} [{r['case']}] {r['metric']}: {r['baseline']} -> {r['current']} ({r['ratio']}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No regressions over {args.threshold:.0%} vs. {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
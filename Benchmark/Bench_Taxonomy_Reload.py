@@ -0,0 +1,86 @@
+import sys
+import os
+import json
+import random
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import corpus
+from Load_Test import percentile
+from taxonomy import TAXONOMY_PATH, TaxonomyManager
+
+
+def scaled_taxonomy(path: str, factor: int, revision: int = 0):
+    # the real skills.json plus (factor - 1) synthetic copies of every skill
+    with open(TAXONOMY_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    for category in data["technical_skills_taxonomy"].values():
+        base = list(category["skills"])
+        for copy in range(1, factor):
+            category["skills"].extend(
+                {"name": f"{skill['name']} v{copy}", "aliases": [f"{a} v{copy}" for a in skill.get("aliases", [])]}
+                for skill in base
+            )
+    data["revision"] = revision  # a new version on every write
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(path + ".tmp", path)
+
+
+def scan_latencies(manager: TaxonomyManager, texts: list, seconds: float) -> list:
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for text in texts:
+            start = time.perf_counter()
+            manager.current.scan(text)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+rng = random.Random(25)
+with open(TAXONOMY_PATH, encoding="utf-8") as f:
+    names = [s["name"] for c in json.load(f)["technical_skills_taxonomy"].values() for s in c["skills"]]
+texts = ["\n".join(corpus.resume_lines(names, corpus.LINES_PER_PAGE, rng)) for _ in range(20)]
+
+print(f"\n{'='*78}")
+# scan p50 / p99 with the taxonomy idle, then while a thread reloads it nonstop
+print(f"{'skills':>8}{'reload p50':>12}{'reload max':>12}{'matcher':>10}{'scan (idle)':>18}{'scan (reloading)':>20}")
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "skills.json")
+    for factor in (1, 10, 50):
+        scaled_taxonomy(path, factor)
+        manager = TaxonomyManager(path)
+
+        reloads = []
+        for revision in range(1, 11):
+            scaled_taxonomy(path, factor, revision)
+            reloads.append(manager.reload()["compile_ms"])
+
+        quiet = scan_latencies(manager, texts, 1.0)
+
+        # reload continuously in the background while scanning
+        stop = threading.Event()
+
+        def reload_loop():
+            revision = 100
+            while not stop.is_set():
+                revision += 1
+                scaled_taxonomy(path, factor, revision)
+                manager.reload()
+
+        reloader = threading.Thread(target=reload_loop)
+        reloader.start()
+        busy = scan_latencies(manager, texts, 1.0)
+        stop.set()
+        reloader.join()
+
+        idle = f"{percentile(quiet, 50) * 1000:.2f} / {percentile(quiet, 99) * 1000:.2f}ms"
+        reloading = f"{percentile(busy, 50) * 1000:.2f} / {percentile(busy, 99) * 1000:.2f}ms"
+        print(f"{len(manager.current):>8}{percentile(reloads, 50):>10.1f}ms{max(reloads):>10.1f}ms"
+              f"{manager.matcher_bytes / 1024:>8.0f}KB{idle:>18}{reloading:>20}")
+print(f"{'='*78}")
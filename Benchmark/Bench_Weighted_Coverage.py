@@ -0,0 +1,48 @@
+import sys
+import os
+import random
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from skill_extractor import job_skill_weights, weighted_coverage
+from taxonomy import get_taxonomy
+
+
+def loop_coverage(resumes: list, job_skills: set, weight: dict) -> list:
+    # per resume: set intersection, then sum the weights skill by skill
+    total = sum(weight[s] for s in job_skills)
+    return [round(sum(weight[s] for s in job_skills & resume) / total * 100, 2) for resume in resumes]
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+taxonomy = get_taxonomy()
+skills = [skill.name for skill in taxonomy.skills]
+weight = {skill.name: skill.weight for skill in taxonomy.skills}
+rng = random.Random(24)
+job = set(rng.sample(skills, 15))
+job_weights = job_skill_weights(job)
+
+print(f"\n{'='*78}")
+# the presence matrix is built once per corpus and reused for every JD
+print(f"{'resumes':>9}{'python loop':>14}{'matrix':>11}{'speedup':>9}{'build matrix':>15}")
+for n in (100, 1_000, 10_000, 100_000):
+    resumes = [set(rng.sample(skills, rng.randint(3, 25))) for _ in range(n)]
+    matrix = taxonomy.matrix(resumes)
+    assert weighted_coverage(matrix, job_weights).tolist() == loop_coverage(resumes, job, weight)
+
+    repeat = 1 if n >= 100_000 else 5
+    loop = best_of(lambda: loop_coverage(resumes, job, weight), repeat)
+    vectorized = best_of(lambda: weighted_coverage(matrix, job_weights), repeat)
+    build = best_of(lambda: taxonomy.matrix(resumes), repeat)
+    print(f"{n:>9}{loop * 1000:>12.2f}ms{vectorized * 1000:>9.2f}ms{loop / vectorized:>8.0f}x"
+          f"{build * 1000:>13.2f}ms")
+print(f"{'='*78}")
@@ -0,0 +1,139 @@
+import sys
+import os
+import argparse
+import asyncio
+import random
+import statistics
+import subprocess
+import time
+
+import httpx
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import corpus
+from taxonomy import get_taxonomy
+
+# Fires concurrent /analyze requests with large PDFs while probing /health,
+# to check that parsing no longer stalls the event loop.
+#
+#   python Benchmark/Load_Test.py                      # spawns its own server
+#   python Benchmark/Load_Test.py --url http://host:8000
+#   RESUMEIQ_EXECUTOR=thread python Benchmark/Load_Test.py
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend'))
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("server did not start")
+
+
+async def run_load(url: str, documents: list, job: str, concurrency: int, total: int) -> dict:
+    analyze_latency = []
+    health_latency = []
+    statuses = {}
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(base_url=url, timeout=120) as client:
+
+        async def probe_health():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_latency.append(time.perf_counter() - start)
+                await asyncio.sleep(0.05)
+
+        queue = asyncio.Queue()
+        for i in range(total):
+            queue.put_nowait(documents[i % len(documents)])
+
+        async def worker():
+            while not queue.empty():
+                pdf = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.post(
+                    "/analyze",
+                    files={"resume": ("resume.pdf", pdf, "application/pdf")},
+                    data={"job_description": job},
+                )
+                analyze_latency.append(time.perf_counter() - start)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        prober = asyncio.create_task(probe_health())
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await prober
+
+    return {
+        "elapsed": elapsed,
+        "analyze": analyze_latency,
+        "health": health_latency,
+        "statuses": statuses,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ResumeIQ /analyze load test")
+    parser.add_argument("--url", help="test an already running server instead of spawning one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=20, help="pages per generated resume")
+    parser.add_argument("--requests", type=int, default=24)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    skills = [skill.name for skill in get_taxonomy().skills]
+    documents = [corpus.make_resume(skills, args.pages, rng=rng) for _ in range(4)]
+    job = corpus.job_description(skills, rng=rng)
+
+    server = None
+    url = args.url
+    if not url:
+        server = start_server(args.port)
+        url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        print(f"\n{'='*78}")
+        print(f"{args.requests} requests, {args.pages}-page PDFs against {url}")
+        print(f"{'concurrency':>11}{'req/s':>8}{'analyze p50':>13}{'p95':>10}"
+              f"{'health p50':>12}{'p95':>10}{'max':>10}  statuses")
+        for concurrency in args.concurrency:
+            result = asyncio.run(run_load(url, documents, job, concurrency, args.requests))
+            analyze = result["analyze"]
+            health = result["health"]
+            print(f"{concurrency:>11}{len(analyze) / result['elapsed']:>8.2f}"
+                  f"{statistics.median(analyze) * 1000:>11.0f}ms{percentile(analyze, 95) * 1000:>8.0f}ms"
+                  f"{statistics.median(health) * 1000:>10.1f}ms{percentile(health, 95) * 1000:>8.1f}ms"
+                  f"{max(health) * 1000:>8.0f}ms  {result['statuses']}")
+        print(f"{'='*78}")
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
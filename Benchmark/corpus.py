@@ -0,0 +1,119 @@
+import io
+import random
+
+from docx import Document
+
+# Synthetic resume / JD documents for benchmarks and load tests.
+# PDFs are written by hand (plain Helvetica text, one content stream per
+# page) so no PDF-writing library is needed.
+
+FILLER = (
+    "designed built and deployed services for customers across teams while "
+    "mentoring engineers improving reliability and reducing costs for the "
+    "platform with clear documentation reviews and planning"
+).split()
+
+ACHIEVEMENTS = [
+    "Improved throughput by {n}% for the ingestion pipeline",
+    "Reduced latency by {n}% across {m} services",
+    "Increased test coverage to {n}% for {m} repositories",
+    "Achieved {n}% cost savings by migrating {m} workloads",
+]
+
+LINES_PER_PAGE = 48
+
+
+def _escape_pdf_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: list) -> bytes:
+    """
+    Build a minimal text PDF — pages is a list of lists of text lines
+    """
+    objects = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")  # filled in once the page tree id is known
+    pages_id = add(b"")
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for lines in pages:
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 760 Td"]
+        for line in lines:
+            ops.append(f"({_escape_pdf_text(line)}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", "replace")
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+            % (pages_id, font, content)
+        ))
+
+    objects[catalog - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id
+    kids = b" ".join(b"%d 0 R" % pid for pid in page_ids)
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+              % (len(objects) + 1, catalog, xref))
+    return out.getvalue()
+
+
+def make_docx(lines: list) -> bytes:
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def resume_lines(skills: list, n_lines: int, rng: random.Random = random) -> list:
+    """
+    Resume-like text: section headers, skill mentions, quantified bullets
+    """
+    sections = ["SUMMARY", "EXPERIENCE", "PROJECTS", "EDUCATION", "SKILLS"]
+    lines = []
+    for i in range(n_lines):
+        if i % 12 == 0:
+            lines.append(sections[(i // 12) % len(sections)])
+        elif rng.random() < 0.25:
+            lines.append(rng.choice(ACHIEVEMENTS).format(n=rng.randint(5, 90), m=rng.randint(2, 40)))
+        else:
+            words = [rng.choice(skills) if rng.random() < 0.12 else rng.choice(FILLER)
+                     for _ in range(rng.randint(8, 14))]
+            lines.append(" ".join(words))
+    return lines
+
+
+def job_description(skills: list, n_skills: int = 12, rng: random.Random = random) -> str:
+    wanted = rng.sample(skills, min(n_skills, len(skills)))
+    return (
+        "We are looking for an engineer to join our platform team. "
+        f"Required skills: {', '.join(wanted[: n_skills // 2])}. "
+        f"Nice to have: {', '.join(wanted[n_skills // 2:])}. "
+        "You will design, build and operate services used by millions of customers."
+    )
+
+
+def make_resume(skills: list, pages: int, fmt: str = "pdf", rng: random.Random = random) -> bytes:
+    lines = resume_lines(skills, pages * LINES_PER_PAGE, rng)
+    if fmt == "docx":
+        return make_docx(lines)
+    return make_pdf([lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)])
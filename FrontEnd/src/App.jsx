@@ -5,20 +5,53 @@ import ResultsDashboard from './components/ResultsDashboard'
 
 const API_BASE = 'http://localhost:8000'
 
+// loading message shown once each /analyze/stream stage has arrived
+const STAGE_MESSAGES = {
+  parse: 'Matching skills against job description...',
+  skills: 'Calculating your ATS score...',
+  ats: 'Generating your report...',
+}
+
+// Read Server-Sent Events from a fetch response, calling onStage(name, data)
+// per event; resolves with the final "result" payload
+async function readAnalysisStream(res, onStage) {
+  const reader = res.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  let result = null
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+
+    let boundary
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+
+      let event = 'message'
+      let data = ''
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7)
+        else if (line.startsWith('data: ')) data += line.slice(6)
+      }
+      const payload = data ? JSON.parse(data) : {}
+
+      if (event === 'error') throw new Error(payload.detail || 'Analysis failed.')
+      if (event === 'result') result = payload
+      onStage(event, payload)
+    }
+  }
+  return result
+}
+
 export default function App() {
   const [view, setView] = useState('landing')
   const [results, setResults] = useState(null)
   const [error, setError] = useState(null)
   const [loadingMsg, setLoadingMsg] = useState('Analyzing your resume...')
 
-  const LOADING_MESSAGES = [
-    'Parsing your resume...',
-    'Extracting skills with AI...',
-    'Matching against job description...',
-    'Calculating relevance scores...',
-    'Generating your report...',
-  ]
-
   const handleAnalyze = async ({ file, jobDescription }) => {
     if (!file) {
       setError('Please upload a resume file (PDF or DOCX).')
@@ -34,40 +67,35 @@ export default function App() {
     setView('loading')
     setError(null)
 
-    let msgIdx = 0
-    setLoadingMsg(LOADING_MESSAGES[0])
-    const msgTimer = setInterval(() => {
-      msgIdx = (msgIdx + 1) % LOADING_MESSAGES.length
-      setLoadingMsg(LOADING_MESSAGES[msgIdx])
-    }, 2200)
+    setLoadingMsg('Parsing your resume...')
 
     try {
       const formData = new FormData()
       formData.append('resume', file)
       formData.append('job_description', jobDescription)
 
-      const res = await fetch(API_BASE + '/analyze', {
+      const res = await fetch(API_BASE + '/analyze/stream', {
         method: 'POST',
         body: formData,
       })
 
-      clearInterval(msgTimer)
-
       if (!res.ok) {
         const errData = await res.json().catch(() => ({}))
         throw new Error(errData?.detail || 'Server error: ' + res.status)
       }
 
-      const data = await res.json()
+      // each pipeline stage moves the loading screen along as it finishes
+      const data = await readAnalysisStream(res, (stage) => {
+        if (STAGE_MESSAGES[stage]) setLoadingMsg(STAGE_MESSAGES[stage])
+      })
 
-      if (!data.success) {
+      if (!data || !data.success) {
         throw new Error('Analysis failed. Please try again.')
       }
 
       setResults(data)
       setView('results')
     } catch (err) {
-      clearInterval(msgTimer)
       setError(err.message || 'An unexpected error occurred.')
       setView('error')
     }
@@ -0,0 +1,173 @@
+import sys
+import os
+import random
+import re
+import string
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from ats_scorer import (
+    achievement_score,
+    calculate_ats_score,
+    compile_jd_keywords,
+    keyword_match_score,
+    scan_resume,
+    section_structure_score,
+)
+from taxonomy import get_taxonomy
+
+
+def legacy_keyword_match(resume_text: str, jd_keywords: list) -> list:
+    # the original per-keyword IGNORECASE search
+    return [keyword for keyword, _ in jd_keywords
+            if re.search(re.escape(keyword), resume_text, re.IGNORECASE)]
+
+
+def legacy_section_structure_score(resume_text: str) -> float:
+    text_lower = resume_text.lower()
+    total = 0
+    if re.search(r'\b(experience|projects?)\b', text_lower):
+        total += 25
+    if re.search(r'\beducation\b', text_lower):
+        total += 25
+    if re.search(r'\bskills?\b', text_lower):
+        total += 25
+    if re.search(r'\b(summary|objective|career)\b', text_lower):
+        total += 25
+    return float(total)
+
+
+def legacy_achievement_score(resume_text: str) -> float:
+    count = 0
+    count += len(re.findall(r'\d+\.?\d*\s*%', resume_text))
+    count += len(re.findall(r'\b\d+\s+[a-zA-Z]+', resume_text))
+    for word in ['improved', 'achieved', 'reduced', 'increased',
+                 'built', 'designed', 'developed', 'deployed']:
+        count += len(re.findall(r'\b' + word + r'\b', resume_text, re.IGNORECASE))
+    return min(count * 10, 100.0)
+
+
+def legacy_counts(resume_text: str) -> tuple:
+    # raw achievement count, uncapped, so the comparison isn't hidden by min(…, 100)
+    metrics = (len(re.findall(r'\d+\.?\d*\s*%', resume_text))
+               + len(re.findall(r'\b\d+\s+[a-zA-Z]+', resume_text)))
+    actions = sum(
+        len(re.findall(r'\b' + word + r'\b', resume_text, re.IGNORECASE))
+        for word in ['improved', 'achieved', 'reduced', 'increased',
+                     'built', 'designed', 'developed', 'deployed']
+    )
+    return metrics, actions
+
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+edge_cases = [
+    "Improved latency by 40% and reduced cost 12.5 % across 3 services",
+    "1.5% 1.5.% 3.% 5 .5% abc40% v2.5% 40 % of 2 x 10%",
+    "Re-built APIs; BUILT_IN tools, built2, prebuilt, Developed/Deployed",
+    "EXPERIENCE\nPROJECTS\nSkill\neducation\nCareer objective",
+    "ſkills İmproved ıncreased EXPERİENCE with KUBERNETES and ıava",
+    "KKLLS 5 Kubernetes ٣٠% ٣ apples 3 apples 3 %",
+    "12345", "%", "", "   ",
+]
+
+# random texts mixing keywords, action / section words, numbers and odd characters
+taxonomy = get_taxonomy()
+vocabulary = [p for skill in taxonomy.skills for p in (skill.name,) + tuple(skill.aliases)]
+words = ["improved", "Achieved", "REDUCED", "increased", "built", "designed", "developed",
+         "deployed", "experience", "projects", "project", "education", "skills", "skill",
+         "summary", "objective", "career", "team", "services", "users"]
+numbers = ["40", "12.5", "3", "1.", "٣", "100", "7x"]
+noise = ["%", " %", ".", "-", "_", "/", "•", "é", "ſ", "İ", "ı", "K", "Σ", "ß", "ﬅ"]
+separators = [" ", "  ", "\n", "\t", "", ", ", ". ", " "]
+
+random.seed(21)
+random_cases = []
+for i in range(3000):
+    odd = i % 5 == 0  # every fifth text may contain İ ı ſ etc.
+    parts = []
+    for _ in range(random.randint(1, 40)):
+        roll = random.random()
+        if roll < 0.3:
+            token = random.choice(vocabulary)
+        elif roll < 0.6:
+            token = random.choice(words)
+        elif roll < 0.85:
+            token = random.choice(numbers)
+        else:
+            token = random.choice(noise if odd else noise[:7])
+        if random.random() < 0.2:
+            token = token.upper() if random.random() < 0.5 else token.lower()
+        parts.append(token)
+        parts.append(random.choice(separators))
+    random_cases.append("".join(parts))
+
+jd = ("Python developer with Go, Java, JavaScript, REST API, FastAPI, Node.js, C++, "
+      "AWS, SQL, Docker and Kubernetes experience; CI/CD pipelines; Björn's tools")
+jd_keywords = compile_jd_keywords(jd)
+
+mismatches = 0
+for text in edge_cases + random_cases:
+    scan = scan_resume(text)
+    expected = (
+        legacy_keyword_match(text, jd_keywords),
+        legacy_section_structure_score(text),
+        legacy_achievement_score(text),
+        legacy_counts(text),
+    )
+    actual = (
+        keyword_match_score(text, jd, jd_keywords=jd_keywords, scan=scan)["matched"],
+        section_structure_score(text, scan),
+        achievement_score(text, scan),
+        (scan.metrics, scan.action_words),
+    )
+    if expected != actual or [type(v) for v in expected] != [type(v) for v in actual]:
+        mismatches += 1
+        if mismatches <= 5:
+            print(f"❌ Mismatch for {text!r}\n   expected: {expected}\n   actual:   {actual}")
+
+total = len(edge_cases) + len(random_cases)
+check(mismatches == 0, f"single-pass scan agrees with the per-component regexes on {total} texts")
+
+check(scan_resume("ſkills").case_safe is False and scan_resume("Skills • é").case_safe,
+      "only İ ı ſ send a text down the regex path")
+
+check(keyword_match_score("Go and java", jd, jd_keywords=jd_keywords)
+      == keyword_match_score("Go and java", jd, jd_keywords=jd_keywords, scan=scan_resume("Go and java")),
+      "keyword_match_score works with or without a scan")
+
+resume = "SUMMARY\nBuilt 3 services, improved latency by 40%.\nSKILLS\nPython, Docker"
+result = calculate_ats_score(resume, jd, 50.0, None, jd_keywords)
+check(result["breakdown"]["section_structure"]["score"] == 50.0
+      and result["breakdown"]["achievements"]["score"] == 40,
+      "calculate_ats_score uses the scan for every component")
+
+# the case-folding guard: every other character folds to an ASCII letter
+# under re.IGNORECASE exactly when str.lower() maps it to that letter
+ascii_letter = re.compile('[a-z]', re.IGNORECASE)
+disagree = []
+for code in range(0x80, 0x110000):
+    if 0xD800 <= code < 0xE000:
+        continue
+    char = chr(code)
+    lowered = char.lower()
+    folds = ascii_letter.fullmatch(char) is not None
+    if folds != (lowered in string.ascii_lowercase) or (
+        len(lowered) > 1 and any(c in string.ascii_lowercase for c in lowered)
+    ):
+        disagree.append(char)
+check(disagree == ["İ", "ı", "ſ"], f"İ ı ſ are the only case-folding exceptions: {disagree}")
+
+if failures:
+    sys.exit(1)
+print("\n✅ ATS single-pass scan working correctly!")
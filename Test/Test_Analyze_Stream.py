@@ -0,0 +1,84 @@
+import sys
+import os
+import json
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Benchmark')))
+
+from fastapi.testclient import TestClient
+
+import main
+from corpus import make_docx
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+def read_events(response) -> list:
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+resume = make_docx([
+    "SUMMARY",
+    "Backend engineer with Python, Docker and PostgreSQL.",
+    "EXPERIENCE",
+    "Improved throughput by 40% for the ingestion pipeline built with Kafka.",
+    "EDUCATION",
+    "BSc Computer Science",
+    "SKILLS",
+    "Python, Docker, Kafka, PostgreSQL, Git",
+])
+job = "Python developer with Docker, Kubernetes and AWS experience for our platform team."
+
+with TestClient(main.app) as client:
+    main.result_cache.clear()
+    streamed = client.post("/analyze/stream",
+                           files={"resume": ("resume.docx", resume)},
+                           data={"job_description": job})
+    check(streamed.headers["content-type"].startswith("text/event-stream"), "served as text/event-stream")
+    events = read_events(streamed)
+    names = [name for name, _ in events]
+    check(names == ["parse", "skills", "ats", "result", "done"], f"stages arrive in order: {names}")
+
+    data = dict(events)
+    check(data["parse"]["word_count"] > 0 and data["parse"]["file_type"] == "docx", "parse stats come first")
+    check("Python" in data["skills"]["matched_skills"], "skill gap is sent on its own")
+    check(data["ats"]["ats_score"] == data["result"]["ats_score"], "ATS breakdown matches the final result")
+
+    main.result_cache.clear()
+    plain = client.post("/analyze",
+                        files={"resume": ("resume.docx", resume)},
+                        data={"job_description": job}).json()
+    check(plain == data["result"], "the final event is exactly the /analyze response")
+
+    cached = read_events(client.post("/analyze/stream",
+                                     files={"resume": ("resume.docx", resume)},
+                                     data={"job_description": job}))
+    check([name for name, _ in cached] == ["result", "done"], "a cached analysis streams the result directly")
+
+    semantic = dict(read_events(client.post("/analyze/stream",
+                                            files={"resume": ("resume.docx", resume)},
+                                            data={"job_description": job, "include_semantic": "true"})))
+    check("semantic" in semantic and "result" in semantic,
+          "semantic sections are sent (or their error reported) without failing the stream")
+
+    rejected = client.post("/analyze/stream",
+                           files={"resume": ("resume.txt", b"plain text")},
+                           data={"job_description": job})
+    check(rejected.status_code == 400, "bad requests are still rejected before the stream starts")
+
+if failures:
+    sys.exit(1)
+print("\n✅ Streaming analysis working correctly!")
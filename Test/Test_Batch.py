@@ -0,0 +1,125 @@
+import sys
+import os
+import io
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from docx import Document
+
+import analysis
+from analysis import analyze_batch, analyze_batch_item, analyze_document, prepare_job
+
+job_description = """
+We are looking for a Python developer with experience in machine learning,
+deep learning, and NLP. Candidates should know PyTorch, scikit-learn,
+and have experience deploying models using FastAPI or Flask.
+Knowledge of Docker and cloud platforms like AWS is a plus.
+"""
+
+resume_texts = [
+    "Summary: Python developer. Experience building FastAPI services, deployed with Docker on AWS.",
+    "Summary: Frontend engineer. Skills: React, TypeScript, CSS. Education: BSc Computer Science.",
+    "Experience: improved model accuracy by 12% using PyTorch and scikit-learn for NLP. "
+    "Deep Learning and Machine Learning projects. Education: MSc. Skills: Python, Flask, Docker, AWS.",
+]
+
+
+def make_docx(text: str) -> bytes:
+    doc = Document()
+    doc.add_paragraph(text)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+files = [(f"resume_{i}.docx", make_docx(text)) for i, text in enumerate(resume_texts)]
+files.append(("broken.pdf", b"not a pdf"))
+
+failures = 0
+for workers in (1, 2):
+    result = analyze_batch(job_description, files, max_workers=workers)
+
+    scores = [r["ats_score"] for r in result["ranked"]]
+    if scores != sorted(scores, reverse=True):
+        failures += 1
+        print(f"❌ [{workers} workers] results not ranked by ats_score: {scores}")
+
+    if [r["filename"] for r in result["failed"]] != ["broken.pdf"]:
+        failures += 1
+        print(f"❌ [{workers} workers] expected broken.pdf to fail: {result['failed']}")
+
+    # batch results must match scoring each resume on its own
+    job = prepare_job(job_description)
+    for ranked in result["ranked"]:
+        single = analyze_document(dict(files)[ranked["filename"]], ranked["filename"], job)
+        batch = {k: v for k, v in ranked.items() if k not in ("filename", "rank")}
+        if single != batch:
+            failures += 1
+            print(f"❌ [{workers} workers] {ranked['filename']} differs from single analysis")
+
+# in-process batches pass the JD explicitly — a module-level JD would let
+# concurrent requests score resumes against each other's job description
+other_description = "Frontend engineer with React, TypeScript, CSS and Node.js, testing with Jest."
+for jd in (job_description, other_description):
+    result = analyze_batch(jd, files[2:3], max_workers=1)
+    expected = analyze_document(files[2][1], files[2][0], prepare_job(jd))["matched_skills"]
+    if result["ranked"][0]["matched_skills"] != expected:
+        failures += 1
+        print("❌ 1-file batch scored against the wrong JD")
+if analysis._worker_job is not None:
+    failures += 1
+    print("❌ in-process batch left a JD in module state")
+
+# /analyze/batch goes through the shared bounded executor
+from fastapi.testclient import TestClient
+
+import main
+from executor import ExecutorSaturated
+
+docx = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+uploads = [("resumes", (name, data, docx)) for name, data in files]
+with TestClient(main.app) as client:
+    response = client.post("/analyze/batch", data={"job_description": job_description}, files=uploads)
+    expected = analyze_batch(job_description, files, max_workers=1)
+    if response.status_code != 200 or response.json()["ranked"] != expected["ranked"]:
+        failures += 1
+        print(f"❌ /analyze/batch differs from analyze_batch: {response.status_code}")
+
+    capacity, main.executor.capacity = main.executor.capacity, 0
+    try:
+        busy = client.post("/analyze/batch", data={"job_description": job_description}, files=uploads)
+    finally:
+        main.executor.capacity = capacity
+    if busy.status_code != 429:
+        failures += 1
+        print(f"❌ a saturated executor should answer 429, got {busy.status_code}")
+
+    # saturation partway through: finished items are kept, the rejected one
+    # is reported per item like a parse error
+    real_run = main.executor.run
+    seen = []
+
+    async def saturate_second_item(fn, *args, **kwargs):
+        # args: taxonomy version, call_with_timings, fn, item, job
+        if args[2] is analyze_batch_item:
+            seen.append(args[3][0])
+            if len(seen) == 2:
+                raise ExecutorSaturated("full")
+        return await real_run(fn, *args, **kwargs)
+
+    main.executor.run = saturate_second_item
+    try:
+        partial = client.post("/analyze/batch", data={"job_description": job_description}, files=uploads)
+    finally:
+        main.executor.run = real_run
+    body = partial.json()
+    busy_items = [f["filename"] for f in body.get("failed", []) if "busy" in f["error"]]
+    if (partial.status_code != 200 or body["total_ranked"] != expected["total_ranked"] - 1
+            or busy_items != seen[1:2]):
+        failures += 1
+        print(f"❌ one rejected item should fail alone, got {partial.status_code}: {body}")
+
+if failures:
+    sys.exit(1)
+
+print("✅ Batch analysis ranks resumes and matches single-resume results")
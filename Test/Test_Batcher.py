@@ -0,0 +1,96 @@
+import sys
+import os
+import threading
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from batcher import EmbeddingBatcher
+
+calls = []
+
+
+def expected(texts: list) -> np.ndarray:
+    # deterministic "embedding": text length and a checksum
+    return np.array([[len(t), sum(map(ord, t))] for t in texts], dtype=np.float32)
+
+
+def fake_encode(texts: list) -> np.ndarray:
+    calls.append(len(texts))
+    time.sleep(0.02)  # model delay
+    return expected(texts)
+
+
+batcher = EmbeddingBatcher(fake_encode, max_batch_size=32, max_wait_ms=20)
+results = {}
+
+
+def client(n: int):
+    texts = [f"request {n} text {i}" for i in range(n % 4 + 1)]
+    results[n] = (texts, batcher.encode(texts))
+
+
+threads = [threading.Thread(target=client, args=(n,)) for n in range(24)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+
+failures = 0
+for n, (texts, embeddings) in results.items():
+    if not np.array_equal(embeddings, expected(texts)):
+        failures += 1
+        print(f"❌ request {n} got rows that belong to another caller")
+
+stats = batcher.stats()
+if stats["batches"] >= 24:
+    failures += 1
+    print(f"❌ concurrent requests were not batched: {stats['batches']} batches")
+else:
+    print(f"✅ 24 concurrent requests shared {stats['batches']} encode calls "
+          f"(mean batch {stats['mean_batch_size']} texts)")
+
+# a request that doesn't fit waits for the next batch instead of overshooting
+if max(calls) > 32:
+    failures += 1
+    print(f"❌ batch grew past max_batch_size: {calls}")
+else:
+    print(f"✅ no batch exceeded max_batch_size (largest {max(calls)})")
+
+if sum(stats["batch_size_histogram"].values()) != stats["batches"]:
+    failures += 1
+    print("❌ batch size histogram does not add up")
+
+calls.clear()
+big_texts = [f"t{i}" for i in range(100)]
+big = batcher.encode(big_texts)
+if not np.array_equal(big, expected(big_texts)) or max(calls) > 32:
+    failures += 1
+    print(f"❌ oversized request was not split into max_batch_size pieces: {calls}")
+else:
+    print(f"✅ an oversized request is split into batches of {calls} and joined back in order")
+
+
+def broken(texts):
+    raise RuntimeError("model failed")
+
+
+try:
+    EmbeddingBatcher(broken).encode(["x"])
+    failures += 1
+    print("❌ encode errors were not propagated")
+except RuntimeError:
+    print("✅ encode errors reach the caller")
+
+try:
+    EmbeddingBatcher(broken, max_batch_size=2).encode(["x", "y", "z"])
+    failures += 1
+    print("❌ encode errors in a split request were not propagated")
+except RuntimeError:
+    print("✅ encode errors reach the caller of a split request")
+
+if failures:
+    sys.exit(1)
+print("✅ every caller received its own embeddings")
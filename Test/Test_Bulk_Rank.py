@@ -0,0 +1,138 @@
+import sys
+import os
+import io
+import random
+import tarfile
+import tempfile
+import zipfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Benchmark')))
+
+import bulk_rank
+import config
+import corpus
+from analysis import analyze_batch
+from taxonomy import get_taxonomy
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+def quiet() -> bulk_rank.Progress:
+    return bulk_rank.Progress(stream=io.StringIO())
+
+
+if __name__ == "__main__":
+    rng = random.Random(5)
+    skills = [skill.name for skill in get_taxonomy().skills]
+    job = corpus.job_description(skills, rng=rng)
+
+    files = {}
+    for i in range(12):
+        fmt = "pdf" if i % 2 else "docx"
+        name = f"{'team/' if i % 4 == 0 else ''}resume_{i}.{fmt}"
+        files[name] = corpus.make_resume(skills, rng.randint(1, 2), fmt, rng)
+    files["broken.pdf"] = b"not really a pdf"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "resumes")
+        for name, data in files.items():
+            path = os.path.join(source, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+        with open(os.path.join(source, "notes.txt"), "w") as f:
+            f.write("not a resume")
+
+        check(sorted(name for name, _, _ in bulk_rank.iter_documents(source)) == sorted(files),
+              "directory input finds every PDF / DOCX recursively")
+
+        # interrupted run, then resume
+        output = os.path.join(tmp, "out", "results.jsonl")
+        first = bulk_rank.rank_documents(source, job, output, workers=2, limit=5, progress=quiet())
+        check(first["processed"] == 5 and len(bulk_rank.load_results(output)) == 5,
+              "--limit stops after 5 files, all written")
+
+        with open(output, "a", encoding="utf-8") as f:
+            f.write('{"filename": "half a rec')  # killed mid-write
+        second = bulk_rank.rank_documents(source, job, output, workers=2, progress=quiet())
+        records = bulk_rank.load_results(output)
+        names = [r["filename"] for r in records]
+        check(second["skipped"] == 5 and second["processed"] == len(files) - 5,
+              "rerun skips finished files and processes the rest")
+        check(sorted(names) == sorted(files), "every file written exactly once (partial line dropped)")
+        check(second["docs_per_sec"] > 0, f"throughput reported: {second['docs_per_sec']} docs/s")
+
+        # same scores as the in-memory batch API
+        batch = analyze_batch(job, list(files.items()), max_workers=1)
+        expected = {r["filename"]: r["ats_score"] for r in batch["ranked"]}
+        actual = {r["filename"]: r["ats_score"] for r in records if r["success"]}
+        check(actual == expected, "scores match analyze_batch")
+        check([r["filename"] for r in records if not r["success"]] == ["broken.pdf"],
+              "unreadable files are recorded as failures")
+
+        other_job = corpus.job_description(skills, rng=random.Random(6))
+        try:
+            bulk_rank.rank_documents(source, other_job, output, workers=2, progress=quiet())
+            refused = False
+        except ValueError:
+            refused = True
+        check(refused and len(bulk_rank.load_results(output)) == len(files),
+              "resuming with a different JD is refused and the output left alone")
+        check(bulk_rank.finished_files(output) == set(files), "finished_files streams just the filenames")
+
+        top = bulk_rank.top_results(output, 3)
+        check([score for score, _, _ in top] == sorted(expected.values(), reverse=True)[:3],
+              "top_results ranks by ats_score")
+
+        # zip in, CSV out
+        archive = os.path.join(tmp, "resumes.zip")
+        with zipfile.ZipFile(archive, "w") as z:
+            for name, data in files.items():
+                z.writestr(name, data)
+        csv_output = os.path.join(tmp, "results.csv")
+        bulk_rank.rank_documents(archive, job, csv_output, workers=2, progress=quiet())
+        rows = bulk_rank.load_results(csv_output)
+        check(len(rows) == len(files) and {float(r["ats_score"]) for r in rows if r["success"] == "True"}
+              == set(expected.values()), "zip input with CSV output")
+        check(bulk_rank.top_results(csv_output, 3) == top, "top_results reads CSV output too")
+
+        # streamed tar.gz, with an oversized file skipped before parsing
+        archive = os.path.join(tmp, "resumes.tar.gz")
+        with tarfile.open(archive, "w:gz") as t:
+            for name, data in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                t.addfile(info, io.BytesIO(data))
+        limit, config.MAX_UPLOAD_BYTES = config.MAX_UPLOAD_BYTES, 20_000
+        try:
+            tar_output = os.path.join(tmp, "tar.jsonl")
+            bulk_rank.rank_documents(archive, job, tar_output, workers=2, progress=quiet())
+        finally:
+            config.MAX_UPLOAD_BYTES = limit
+        tar_records = bulk_rank.load_results(tar_output)
+        oversized = [r for r in tar_records if "larger than" in (r.get("error") or "")]
+        check(len(tar_records) == len(files) and oversized, "tar.gz input; oversized files rejected unparsed")
+
+        restarted = bulk_rank.rank_documents(archive, job, tar_output, workers=2, restart=True,
+                                             limit=2, progress=quiet())
+        check(restarted["skipped"] == 0 and len(bulk_rank.load_results(tar_output)) == 2,
+              "--restart discards the previous output")
+
+        switched = bulk_rank.rank_documents(archive, other_job, tar_output, workers=2, restart=True,
+                                            limit=1, progress=quiet())
+        check(switched["processed"] == 1 and len(bulk_rank.load_results(tar_output)) == 1,
+              "--restart accepts a new JD")
+
+    if failures:
+        sys.exit(1)
+    print("\n✅ Bulk ranking working correctly!")
@@ -0,0 +1,79 @@
+import sys
+import os
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from cache import LRUCache, SQLiteStore, TieredCache
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+# LRU eviction by size budget
+lru = LRUCache(max_size=10, sizeof=len)
+lru.put("a", "xxxx")
+lru.put("b", "xxxx")
+lru.get("a")                      # a is now most recently used
+lru.put("c", "xxxx")              # over budget -> evicts b
+check(lru.get("b") is None and lru.get("a") == "xxxx", "LRU evicts least recently used entry")
+check(lru.stats()["size"] <= 10, "LRU stays within its size budget")
+lru.put("huge", "x" * 50)
+check(lru.get("huge") is None, "values larger than the whole budget are not cached")
+
+# TTL
+ttl_cache = LRUCache(max_size=10, ttl=0.05)
+ttl_cache.put("k", "v")
+check(ttl_cache.get("k") == "v", "entry is served before its TTL")
+time.sleep(0.1)
+check(ttl_cache.get("k") is None, "entry expires after its TTL")
+
+# disk tier survives a restart and is promoted into memory
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "cache.sqlite")
+    first = TieredCache(LRUCache(1000, sizeof=len), SQLiteStore(path, 1_000_000))
+    first.put("doc", {"clean_text": "hello"})
+
+    second = TieredCache(LRUCache(1000, sizeof=len), SQLiteStore(path, 1_000_000))
+    check(second.get("doc") == {"clean_text": "hello"}, "disk tier survives a restart")
+    check(second.memory.get("doc") is not None, "disk hits are promoted into memory")
+
+    small = SQLiteStore(os.path.join(tmp, "small.sqlite"), max_bytes=100)
+    for i in range(10):
+        small.put(f"k{i}", "x" * 30)
+    check(small.stats()["size"] <= 100, "disk tier is trimmed to its byte budget")
+    check(small.get("k9") is not None and small.get("k0") is None, "disk tier drops oldest entries first")
+
+    # reads buffer their access time instead of committing an UPDATE each
+    lazy = SQLiteStore(os.path.join(tmp, "lazy.sqlite"), max_bytes=100, touch_batch=1000)
+    for i in range(3):
+        lazy.put(f"k{i}", "x" * 30)
+    commits = lazy._conn.total_changes
+    for _ in range(50):
+        lazy.get("k0")
+    check(lazy._conn.total_changes == commits, "disk reads don't write")
+    lazy.put("k3", "x" * 30)  # over budget: k0 was read last, so k1 goes
+    check(lazy.get("k0") is not None and lazy.get("k1") is None,
+          "buffered access times still decide what gets trimmed")
+
+    # combined counters: a hit in either tier is one hit
+    tiered = TieredCache(LRUCache(1000, sizeof=len), SQLiteStore(path, 1_000_000))
+    tiered.get("doc")         # disk hit
+    tiered.get("doc")         # memory hit
+    tiered.get("missing")     # miss in both tiers
+    stats = tiered.stats()
+    check(stats["hits"] == 2 and stats["misses"] == 1 and stats["hit_rate"] == 0.6667
+          and stats["memory"]["misses"] == 2 and stats["disk"]["hits"] == 1,
+          "tiered stats combine both tiers and keep the per-tier numbers")
+
+if failures:
+    sys.exit(1)
@@ -0,0 +1,248 @@
+import sys
+import os
+import random
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Benchmark')))
+
+from fastapi.testclient import TestClient
+
+import config
+import main
+from candidate_index import CandidateIndex, parse_query
+from skill_extractor import job_skill_weights, skill_weights
+from corpus import make_docx
+from taxonomy import get_taxonomy
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+def brute_force(candidates: dict, tree: tuple) -> set:
+    # evaluate a parsed query against plain Python sets
+    def matches(skills: set, node: tuple) -> bool:
+        kind, value = node
+        if kind == "skill":
+            return value in skills
+        if kind == "not":
+            return not matches(skills, value)
+        combine = all if kind == "and" else any
+        return combine(matches(skills, child) for child in value)
+    return {cid for cid, skills in candidates.items() if matches(skills, tree)}
+
+
+def brute_force_rank(candidates: dict, weights: dict, k: int) -> list:
+    scored = {cid: sum(w for s, w in weights.items() if s in skills) for cid, skills in candidates.items()}
+    return sorted((round(v / sum(weights.values()) * 100, 2), cid) for cid, v in scored.items() if v > 0)[::-1][:k]
+
+
+# -----------------------------
+# Query parsing
+# -----------------------------
+check(parse_query("kubernetes and PyTorch AND NOT java")
+      == ("and", [("skill", "Kubernetes"), ("skill", "PyTorch"), ("not", ("skill", "Java"))]),
+      "operators and skill names are case-insensitive")
+check(parse_query('(React OR "Vue.js") AND NOT Machine Learning')
+      == ("and", [("or", [("skill", "React"), ("skill", "Vue.js")]), ("not", ("skill", "Machine Learning"))]),
+      "parentheses, quoted names and multi-word names")
+check(parse_query("React OR Vue.js AND Java")
+      == ("or", [("skill", "React"), ("and", [("skill", "Vue.js"), ("skill", "Java")])]),
+      "AND binds tighter than OR")
+
+errors = 0
+for bad in ["", "AND", "Kubernetes AND", "(React", "React)", "Cobol", 'NOT "Py']:
+    try:
+        parse_query(bad)
+    except ValueError:
+        errors += 1
+check(errors == 7, "malformed queries and unknown skills raise ValueError")
+
+# -----------------------------
+# Index vs brute force
+# -----------------------------
+rng = random.Random(23)
+skills = [skill.name for skill in get_taxonomy().skills]
+common = skills[:6]  # so queries have plenty of hits
+
+with tempfile.TemporaryDirectory() as tmp:
+    index = CandidateIndex(tmp, initial_capacity=64, initial_skills=4)
+    candidates = {}
+    batch = []
+    for i in range(600):
+        has = set(rng.sample(common, rng.randint(0, 4))) | set(rng.sample(skills, rng.randint(0, 8)))
+        candidates[f"c{i}"] = has
+        batch.append((f"c{i}", has, {"n": i}))
+    index.add_many(batch[:300])
+    for candidate_id, has, metadata in batch[300:]:
+        index.add(candidate_id, has, metadata)
+    check(len(index) == 600 and index.stats()["capacity"] >= 600, "index grows past its initial capacity")
+
+    def random_query() -> str:
+        terms = [f'"{s}"' if rng.random() < 0.3 else s for s in rng.sample(common, 3)]
+        ops = [rng.choice([" AND ", " OR ", " AND NOT "]) for _ in range(2)]
+        if rng.random() < 0.5:
+            return f"({terms[0]}{ops[0]}{terms[1]}){ops[1]}{terms[2]}"
+        return f"{terms[0]}{ops[0]}{terms[1]}{ops[1]}{terms[2]}"
+
+    def agrees(n: int = 50) -> bool:
+        for _ in range(n):
+            query = random_query()
+            found = index.search(query, limit=10_000)
+            expected = brute_force(candidates, parse_query(query))
+            if found["total"] != len(expected) or {c["candidate_id"] for c in found["candidates"]} != expected:
+                print(f"   mismatch for {query!r}")
+                return False
+        return True
+
+    check(agrees(), "boolean search matches brute force on 50 random queries")
+
+    page = index.search("NOT Kubernetes", limit=10, offset=5)
+    full = index.search("NOT Kubernetes", limit=10_000)
+    check(page["candidates"] == full["candidates"][5:15] and page["total"] == full["total"],
+          "limit / offset page through the results")
+
+    weights = skill_weights(rng.sample(common, 4) + rng.sample(skills, 3))
+    ranked = index.rank(weights, k=15)
+    check([(c["coverage"], c["candidate_id"]) for c in ranked["candidates"]][:1]
+          == brute_force_rank(candidates, weights, 1)
+          and sorted(c["coverage"] for c in ranked["candidates"])
+          == sorted(v for v, _ in brute_force_rank(candidates, weights, 15)),
+          "weighted coverage ranking matches brute force")
+    top = ranked["candidates"][0]
+    check(set(top["matched_skills"]) | set(top["missing_skills"]) == set(weights)
+          and set(top["matched_skills"]) <= candidates[top["candidate_id"]],
+          "ranked candidates list matched and missing skills")
+
+    restricted = index.rank(weights, query=f"NOT {common[0]}", k=1000)
+    check(all(common[0] not in candidates[c["candidate_id"]] for c in restricted["candidates"]),
+          "rank honours a boolean filter")
+
+    # replace, remove, reuse
+    index.add("c1", {"Java"})
+    candidates["c1"] = {"Java"}
+    removed_rows = {row for row, in index._conn.execute(
+        "SELECT row FROM candidates WHERE candidate_id IN ('c2', 'c3', 'c4')")}
+    for cid in ("c2", "c3", "c4"):
+        index.remove(cid)
+        del candidates[cid]
+    check(index.remove("c2") is False and "c2" not in index and index.get("c1")["skills"] == ["Java"],
+          "replaced and removed candidates are reflected")
+    check(agrees(), "search still matches brute force after replace / remove")
+    index.add("fresh", {"Python"})
+    candidates["fresh"] = {"Python"}
+    fresh_row = index._conn.execute("SELECT row FROM candidates WHERE candidate_id = 'fresh'").fetchone()[0]
+    check(fresh_row in removed_rows, "freed rows are reused")
+
+    # the same id twice in one batch: the last entry wins, bits included
+    index.add_many([("dup", set(common[:3]), {"v": 1}), ("other", {"Java"}, None),
+                    ("dup", {common[3]}, {"v": 2})])
+    candidates["dup"], candidates["other"] = {common[3]}, {"Java"}
+    dup = index.get("dup")
+    check(dup["skills"] == [common[3]] and dup["metadata"] == {"v": 2}
+          and "dup" not in {c["candidate_id"] for c in index.search(common[0], limit=10_000)["candidates"]},
+          "a duplicate id in one add_many keeps only its last entry")
+    check(agrees(), "search still matches brute force after a batch with a duplicate id")
+
+    # reopen, and rebuild from SQLite when the bitsets are lost
+    index.flush()
+    del index
+    index = CandidateIndex(tmp)
+    check(len(index) == len(candidates) and agrees(20), "index survives a reopen")
+    index.flush()
+    del index
+    os.remove(os.path.join(tmp, "postings.u64"))
+    index = CandidateIndex(tmp)
+    check(agrees(20), "lost postings are rebuilt from SQLite")
+
+    # changes after the last flush: the stamp is gone, so a reopen after a
+    # crash rebuilds even though the bitsets file looks the right size
+    stamp_path = os.path.join(tmp, "postings.stamp")
+    check(os.path.exists(stamp_path), "flushed bitsets are stamped")
+    index.add("late", set(common[:2]))
+    candidates["late"] = set(common[:2])
+    check(not os.path.exists(stamp_path), "the first change after a flush drops the stamp")
+    del index
+    size = os.path.getsize(os.path.join(tmp, "postings.u64"))
+    with open(os.path.join(tmp, "postings.u64"), "wb") as f:
+        f.write(b"\0" * size)  # bits never written back
+    index = CandidateIndex(tmp)
+    check(agrees(20), "unflushed changes are rebuilt from SQLite on reopen")
+
+    # a stamp left from an older generation doesn't vouch for newer bits
+    index.flush()
+    with open(stamp_path) as f:
+        old_stamp = f.read()
+    index.remove("late")
+    del candidates["late"]
+    index.flush()
+    del index
+    with open(stamp_path, "w") as f:
+        f.write(old_stamp)
+    index = CandidateIndex(tmp)
+    with open(stamp_path) as f:
+        restamped = f.read() != old_stamp
+    check(agrees(20) and restamped, "a stale stamp triggers a rebuild")
+    del index
+
+# one weighting for candidate ranking and weighted coverage
+job = rng.sample(skills, 8)
+weights = skill_weights(job + ["Not A Skill"])
+vector = job_skill_weights(job)
+check(set(weights) == set(job)
+      and all(vector[get_taxonomy().index_of[s]] == w for s, w in weights.items())
+      and np.isclose(vector.sum(), sum(weights.values())),
+      "candidate ranking and weighted coverage share skill_weights")
+
+# -----------------------------
+# API
+# -----------------------------
+resume = make_docx([
+    "SUMMARY", "Platform engineer working with Kubernetes, Docker and Python.",
+    "EXPERIENCE", "Built PyTorch training pipelines on AWS.",
+])
+other = make_docx(["EXPERIENCE", "Java and Spring developer using Docker."])
+docx = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+jd = "Looking for an ML platform engineer: Kubernetes, PyTorch, Python and AWS."
+
+with tempfile.TemporaryDirectory() as tmp:
+    config.CANDIDATE_INDEX_DIR = tmp
+    main._candidate_index = None
+    with TestClient(main.app) as client:
+        added = client.post("/candidates", data={"candidate_id": "ada", "name": "Ada"},
+                            files={"resume": ("ada.docx", resume, docx)})
+        check(added.status_code == 200 and "Kubernetes" in added.json()["skills"], "POST /candidates indexes a resume")
+        client.post("/candidates", data={"candidate_id": "bob"}, files={"resume": ("bob.docx", other, docx)})
+
+        found = client.get("/candidates/search", params={"q": "Kubernetes AND PyTorch AND NOT Java"}).json()
+        check(found["total"] == 1 and found["candidates"][0]["candidate_id"] == "ada"
+              and found["candidates"][0]["metadata"]["name"] == "Ada", "GET /candidates/search")
+        check(client.get("/candidates/search", params={"q": "Kubernetes AND"}).status_code == 400,
+              "bad queries are a 400")
+
+        ranked = client.post("/candidates/rank", data={"job_description": jd}).json()
+        check([c["candidate_id"] for c in ranked["candidates"]] == ["ada"]
+              and ranked["candidates"][0]["missing_skills"] == ["Machine Learning"],
+              "POST /candidates/rank orders by coverage")
+        filtered = client.post("/candidates/rank", data={"job_description": jd, "query": "Java"}).json()
+        check(filtered["total"] == 0, "rank with a query filter")
+
+        check(client.get("/candidates/bob").json()["candidate_id"] == "bob", "GET /candidates/{id}")
+        check(client.delete("/candidates/bob").status_code == 200
+              and client.get("/candidates/bob").status_code == 404, "DELETE /candidates/{id}")
+        check(client.get("/candidates/stats").json()["candidates"] == 1, "GET /candidates/stats")
+    main._candidate_index = None
+
+if failures:
+    sys.exit(1)
+print("\n✅ Candidate index working correctly!")
@@ -0,0 +1,95 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import embedder
+from chunker import chunk_text, find_sections, pool_embeddings
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+# one line, as parser.clean_text produces it
+resume = (
+    "Jane Doe Backend engineer in Berlin. "
+    "PROFESSIONAL SUMMARY Engineer with 8 years of experience with Python and Go. "
+    "Led platform migrations. "
+    "WORK EXPERIENCE Senior Engineer at Acme. Built a streaming pipeline in Kafka. "
+    "Reduced latency by 40% across 12 services. Mentored four engineers. "
+    "Education BSc Computer Science, TU Berlin. "
+    "Skills Python, Go, Kafka, Docker, Kubernetes, PostgreSQL."
+)
+
+sections = [name for name, _ in find_sections(resume)]
+check(sections == ["", "professional summary", "work experience", "education", "skills"],
+      f"sections detected in order: {sections}")
+check("experience with Python" in dict(find_sections(resume))["professional summary"],
+      "'experience with' inside a sentence is not taken as a heading")
+
+chunks = chunk_text(resume, max_words=12)
+check(all(chunk.words <= 12 for chunk in chunks), "no chunk exceeds max_words")
+check(len({chunk.section for chunk in chunks}) == len(sections),
+      "every section produces its own chunks")
+check(all(chunk.text.rstrip().endswith((".", "Acme", "Berlin")) or chunk.section == "skills"
+          for chunk in chunks), "chunks end on sentence boundaries")
+
+words = " ".join(f"w{i}" for i in range(250))
+long_chunks = chunk_text(words, max_words=100)
+check([chunk.words for chunk in long_chunks] == [100, 100, 50],
+      "a run-on 'sentence' falls back to word windows")
+
+sentences = " ".join(f"Sentence number {i} has six words." for i in range(10))
+plain = chunk_text(sentences, max_words=18)
+overlapping = chunk_text(sentences, max_words=18, overlap_sentences=1)
+check(len(overlapping) > len(plain), "overlap repeats sentences across chunks")
+check(overlapping[1].text.startswith(overlapping[0].text.split(". ")[-1]),
+      "the next chunk starts with the previous chunk's last sentence")
+
+vectors = np.array([[1.0, 0.0], [0.0, 2.0]], dtype=np.float32)
+pooled = pool_embeddings(vectors, [3, 1])
+check(np.isclose(np.linalg.norm(pooled), 1.0) and pooled[0] > pooled[1],
+      "pooling is a normalized, length-weighted mean")
+
+# embed_resume_and_job with a stand-in model: count what gets encoded
+encoded = []
+
+
+def fake_encode(texts: list) -> np.ndarray:
+    encoded.extend(texts)
+    rng = np.random.default_rng(len(texts))
+    return rng.normal(size=(len(texts), embedder.EMBEDDING_DIM)).astype(np.float32)
+
+
+embedder.encode_texts = fake_encode
+job = "Python engineer with Kafka and Kubernetes experience."
+result = embedder.embed_resume_and_job(resume, job)
+
+check(resume not in encoded, "the full resume is not encoded a second time")
+check(len(encoded) == 1 + len(result["chunk_texts"]), "one encode input per chunk plus the JD")
+check(result["chunk_embeddings"].shape == (len(result["chunk_texts"]), embedder.EMBEDDING_DIM),
+      "chunk embeddings form one matrix")
+check(np.allclose(result["resume_embedding"],
+                  pool_embeddings(result["chunk_embeddings"],
+                                  [len(t.split()) for t in result["chunk_texts"]]), atol=1e-6),
+      "resume embedding is pooled from the chunk embeddings")
+
+encoded.clear()
+short = embedder.embed_resume_and_job("Python", job)
+check(encoded == [job, "Python"] and short["chunk_texts"] == [],
+      "text too short to chunk is encoded whole")
+
+if failures:
+    print(f"\n❌ {failures} chunker check(s) failed")
+    sys.exit(1)
+print("\n✅ Chunker working correctly!")
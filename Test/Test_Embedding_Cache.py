@@ -0,0 +1,88 @@
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import config
+import embedder
+from embedding_cache import create_embedding_cache, embedding_key
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+# stand-in model: deterministic vector per text, and a log of what got encoded
+encoded = []
+
+
+def fake_encode(texts: list) -> np.ndarray:
+    encoded.extend(texts)
+    return np.array([
+        np.random.default_rng(sum(map(ord, " ".join(t.split())))).normal(size=embedder.EMBEDDING_DIM)
+        for t in texts
+    ], dtype=np.float32)
+
+
+embedder._model_encode = fake_encode
+config.EMBED_BATCHING = False
+
+directory = tempfile.mkdtemp()
+config.EMBED_CACHE_PATH = os.path.join(directory, "embeddings.sqlite")
+
+first = embedder.encode_texts(["python developer", "kafka streams", "python developer"])
+check(encoded == ["python developer", "kafka streams"], "a text repeated within one call is encoded once")
+check(first.dtype == np.float32 and first.shape == (3, embedder.EMBEDDING_DIM),
+      "callers still get a float32 matrix")
+
+encoded.clear()
+second = embedder.encode_texts(["kafka streams", "  python \n developer ", "go"])
+check(encoded == ["go"], "cached texts (whitespace-normalized) are not re-encoded")
+check(np.array_equal(second[1], first[0]), "cache hits return the same vector")
+
+exact = fake_encode(["rust"])[0]
+encoded.clear()
+fresh = embedder.encode_texts(["rust"])[0]
+cosine = exact @ fresh / (np.linalg.norm(exact) * np.linalg.norm(fresh))
+check(np.array_equal(fresh, exact.astype(np.float16).astype(np.float32)),
+      "fresh vectors are float16-rounded too, so results don't depend on the cache")
+check(cosine > 0.99999, f"float16 storage keeps cosine at {cosine:.6f}")
+
+stats = embedder.cache_stats()
+check(stats["memory"]["hits"] == 2 and stats["memory"]["size"] > 0,
+      f"stats report hits and memory use: {stats['memory']}")
+
+# byte budget: float16 vectors are 768 bytes + bookkeeping
+config.EMBED_CACHE_PATH = ""
+config.EMBED_CACHE_MAX_BYTES = 10 * 1024
+small = create_embedding_cache()
+for i in range(50):
+    small.put(embedding_key(f"text {i}", "m"), np.zeros(384, dtype=np.float16))
+check(small.stats()["memory"]["size"] <= 10 * 1024 and small.stats()["memory"]["evictions"] > 0,
+      "memory tier stays within its byte budget")
+
+# disk tier survives a restart
+config.EMBED_CACHE_PATH = os.path.join(directory, "embeddings.sqlite")
+restarted = create_embedding_cache()
+vector = restarted.get(embedding_key("python developer", embedder.model_id()))
+check(vector is not None and vector.dtype == np.float16 and np.array_equal(vector, first[0].astype(np.float16)),
+      "disk tier serves vectors after a restart")
+
+config.EMBED_BACKEND, config.EMBED_ONNX_QUANTIZED = "onnx", True
+check(embedding_key("go", embedder.model_id()) != embedding_key("go", "all-MiniLM-L6-v2:torch"),
+      "vectors from different backends don't share cache entries")
+
+if failures:
+    print(f"\n❌ {failures} embedding cache check(s) failed")
+    sys.exit(1)
+print("\n✅ Embedding cache working correctly!")
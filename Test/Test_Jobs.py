@@ -0,0 +1,166 @@
+import sys
+import os
+import asyncio
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Benchmark')))
+
+from fastapi.testclient import TestClient
+
+import main
+from analysis import analyze_document, prepare_job
+from corpus import make_docx
+from jobs import DONE, FAILED, QUEUED, JobQueue, MemoryJobStore, SQLiteJobStore
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+def wait_for(client, job_id: str, timeout: float = 60) -> dict:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] in (DONE, FAILED):
+            return job
+        time.sleep(0.1)
+    return job
+
+
+resume = make_docx([
+    "SUMMARY", "Backend engineer with Python, Docker and PostgreSQL.",
+    "EXPERIENCE", "Improved throughput by 40% for the ingestion pipeline built with Kafka.",
+    "EDUCATION", "BSc Computer Science", "SKILLS", "Python, Docker, Kafka, PostgreSQL, Git",
+])
+job_description = "Python developer with Docker, Kubernetes and AWS experience for our platform team."
+
+# -----------------------------
+# HTTP round trip (in-memory store)
+# -----------------------------
+main.job_queue.retry_backoff = 0.01
+
+with TestClient(main.app) as client:
+    submitted = client.post("/jobs", files=[("resumes", ("resume.docx", resume))],
+                            data={"job_description": job_description})
+    check(submitted.status_code == 202 and submitted.json()["status"] == QUEUED,
+          "POST /jobs answers 202 with a queued job id")
+
+    job = wait_for(client, submitted.json()["job_id"])
+    direct = client.post("/analyze", files={"resume": ("resume.docx", resume)},
+                         data={"job_description": job_description}).json()
+    check(job["status"] == DONE and job["completed"] == job["total"] == 1, "single-resume job completes")
+    check({k: v for k, v in job["result"].items() if k != "filename"} == direct,
+          "a one-resume job returns the /analyze response")
+
+    batch = client.post("/jobs", data={"job_description": job_description}, files=[
+        ("resumes", ("a.docx", resume)),
+        ("resumes", ("broken.pdf", b"%PDF-1.4 not really a pdf")),
+        ("resumes", ("b.docx", resume)),
+    ]).json()
+    job = wait_for(client, batch["job_id"])
+    result = job["result"]
+    check(job["status"] == DONE and result["total_ranked"] == 2 and result["total_failed"] == 1,
+          "batch job ranks good resumes and reports the broken one")
+    check(job["attempts"] == 3, f"a parse error is not retried ({job['attempts']} attempts for 3 resumes)")
+
+    failed = wait_for(client, client.post("/jobs", files=[("resumes", ("broken.pdf", b"%PDF-1.4 junk"))],
+                                          data={"job_description": job_description}).json()["job_id"])
+    check(failed["status"] == FAILED and failed["error"], "a single resume that never parses fails the job")
+
+    check(client.get("/jobs/unknown").status_code == 404, "unknown job ids are 404")
+    check(client.post("/jobs", files=[("resumes", ("cv.txt", b"text"))],
+                      data={"job_description": job_description}).status_code == 400,
+          "unsupported files are rejected up front")
+
+
+# -----------------------------
+# SQLite store: restart and expiry
+# -----------------------------
+async def run_inline(fn, *args):
+    return fn(*args)
+
+
+async def restart_scenario(path: str) -> tuple:
+    store = SQLiteJobStore(path)
+    job_id = store.create(job_description, [("resume.docx", resume)])  # queued, never run
+
+    restarted = JobQueue(SQLiteJobStore(path), run_inline, retry_backoff=0.01, ttl=3600)
+    await restarted.start()
+    deadline = time.time() + 30
+    while restarted.store.get(job_id)["status"] != DONE and time.time() < deadline:
+        await asyncio.sleep(0.05)
+    await restarted.stop()
+    return job_id, restarted.store
+
+
+async def flaky_scenario() -> dict:
+    # the first two analyses raise, as a crashed worker would
+    calls = []
+
+    async def run_flaky(fn, *args):
+        calls.append(fn.__name__)
+        if fn.__name__ == "analyze_document" and calls.count(fn.__name__) <= 2:
+            raise RuntimeError("worker crashed")
+        return fn(*args)
+
+    queue = JobQueue(MemoryJobStore(), run_flaky, retry_backoff=0.01)
+    await queue.start()
+    job_id = await queue.submit(job_description, [("resume.docx", resume)])
+    deadline = time.time() + 30
+    while queue.store.get(job_id)["status"] not in (DONE, FAILED) and time.time() < deadline:
+        await asyncio.sleep(0.05)
+    await queue.stop()
+    return queue.store.get(job_id)
+
+
+flaky = asyncio.run(flaky_scenario())
+check(flaky["status"] == DONE and flaky["attempts"] == 3, "an analysis that raises is retried with backoff")
+
+
+async def transient_parse_scenario() -> dict:
+    # the first parse hits an I/O error (retryable), the second succeeds
+    calls = []
+
+    async def run_transient(fn, *args):
+        if fn.__name__ == "analyze_document":
+            calls.append(fn.__name__)
+            if len(calls) == 1:
+                return {"success": False, "error": "Failed to parse document: disk read error", "retryable": True}
+        return fn(*args)
+
+    queue = JobQueue(MemoryJobStore(), run_transient, retry_backoff=0.01)
+    await queue.start()
+    job_id = await queue.submit(job_description, [("resume.docx", resume)])
+    deadline = time.time() + 30
+    while queue.store.get(job_id)["status"] not in (DONE, FAILED) and time.time() < deadline:
+        await asyncio.sleep(0.05)
+    await queue.stop()
+    return queue.store.get(job_id)
+
+
+transient = asyncio.run(transient_parse_scenario())
+check(transient["status"] == DONE and transient["attempts"] == 2, "a transient parse failure is retried")
+broken = analyze_document(b"%PDF-1.4 junk", "broken.pdf", prepare_job(job_description))
+check(not broken["success"] and broken["retryable"] is False, "a corrupt file is marked not retryable")
+
+job_id, store = asyncio.run(restart_scenario(os.path.join(tempfile.mkdtemp(), "jobs.sqlite")))
+check(store.get(job_id)["status"] == DONE, "SQLite jobs queued before a restart are picked up again")
+check(store.get_payload(job_id) is None, "uploads are dropped once a job finishes")
+check(store.purge(time.time() + 1) == 1 and store.get(job_id) is None, "finished jobs expire")
+
+memory = MemoryJobStore()
+memory.create(job_description, [])
+check(memory.purge(time.time() + 1) == 0, "unfinished jobs never expire")
+
+if failures:
+    sys.exit(1)
+print("\n✅ Job queue working correctly!")
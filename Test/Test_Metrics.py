@@ -0,0 +1,101 @@
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Benchmark')))
+
+from fastapi.testclient import TestClient
+
+import main
+import metrics
+from corpus import make_docx
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+# Histogram / Prometheus text format
+histogram = metrics.Histogram("test_seconds", "Test histogram", "stage", buckets=(0.01, 0.1))
+histogram.observe("a", 0.005)
+histogram.observe("a", 0.05)
+histogram.observe("a", 5.0)
+lines = histogram.render()
+check('test_seconds_bucket{stage="a",le="0.01"} 1' in lines, "bucket counts are cumulative (le=0.01)")
+check('test_seconds_bucket{stage="a",le="0.1"} 2' in lines, "bucket counts are cumulative (le=0.1)")
+check('test_seconds_bucket{stage="a",le="+Inf"} 3' in lines, "+Inf bucket holds every observation")
+check('test_seconds_count{stage="a"} 3' in lines, "count series rendered")
+check(histogram.snapshot()["a"]["count"] == 3, "snapshot reports the count")
+
+
+# Worker timings come back with the result instead of being recorded
+def work(x):
+    with metrics.timed("unit_stage"):
+        time.sleep(0.002)
+    return x * 2
+
+before = metrics.STAGE_SECONDS.snapshot().get("unit_stage", {}).get("count", 0)
+result, timings = metrics.call_with_timings(work, 21)
+check(result == 42 and [stage for stage, _ in timings] == ["unit_stage"], "call_with_timings returns (result, timings)")
+check(metrics.STAGE_SECONDS.snapshot().get("unit_stage", {}).get("count", 0) == before,
+      "worker timings are not recorded in the worker")
+metrics.record_stages(timings)
+check(metrics.STAGE_SECONDS.snapshot()["unit_stage"]["count"] == before + 1, "record_stages records them")
+
+header = metrics.server_timing_header([("a", 0.001), ("b", 0.002), ("a", 0.003)])
+check(header == "a;dur=4.00, b;dur=2.00", f"Server-Timing sums repeated stages: {header}")
+
+
+# Sampling profiler
+profiler = metrics.SamplingProfiler(interval=0.001)
+profiler.start()
+deadline = time.perf_counter() + 0.05
+while time.perf_counter() < deadline:
+    sum(range(1000))
+profiler.stop()
+check(profiler.samples > 0 and profiler.top(1), "profiler collects stack samples")
+
+
+# End to end through the API
+resume = make_docx([
+    "SUMMARY",
+    "Backend engineer with Python, Docker and PostgreSQL.",
+    "EXPERIENCE",
+    "Improved throughput by 40% for the ingestion pipeline built with Kafka.",
+    "SKILLS",
+    "Python, Docker, Kafka, PostgreSQL, Git",
+])
+job = "Python developer with Docker, Kubernetes and AWS experience for our platform team."
+
+with TestClient(main.app) as client:
+    main.result_cache.clear()
+    response = client.post("/analyze",
+                           files={"resume": ("resume.docx", resume)},
+                           data={"job_description": job})
+    check(response.status_code == 200, "analysis still succeeds")
+    timing = response.headers.get("server-timing", "")
+    for stage in ("upload_read", "parse_document", "taxonomy_scan", "skill_gap", "keyword_match", "total"):
+        check(f"{stage};dur=" in timing, f"Server-Timing includes {stage}")
+
+    exposition = client.get("/metrics")
+    check(exposition.headers["content-type"].startswith("text/plain"), "/metrics is served as text")
+    text = exposition.text
+    check('resumeiq_stage_seconds_bucket{stage="parse_document",le="+Inf"}' in text,
+          "worker stage timings reach the API process histograms")
+    check('resumeiq_request_seconds_count{route="POST /analyze"}' in text, "request latency is labeled by route")
+    check("resumeiq_executor_in_flight" in text and 'resumeiq_cache_hits_total{cache="results"}' in text,
+          "executor and cache gauges are exported")
+
+    check(client.get("/metrics/slow").json() == {"profiles": []}, "no slow profiles unless sampling is enabled")
+
+if failures:
+    sys.exit(1)
+print("\n✅ Metrics working correctly!")
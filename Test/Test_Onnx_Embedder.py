@@ -0,0 +1,71 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import config
+from embedder import load_model
+
+# Accuracy parity of the ONNX backends against the torch (SentenceTransformer)
+# backend. Needs torch, sentence-transformers, onnxruntime and tokenizers,
+# plus an exported model (python Backend/onnx_embedder.py).
+# A run that can't compare anything exits with SKIPPED, not as a pass.
+
+SKIPPED = 77  # the conventional "test skipped" exit status
+
+# minimum cosine between a text's torch and ONNX embeddings
+MIN_COSINE = {"fp32": 0.9999, "int8": 0.98}
+
+texts = [
+    "Python developer with experience in machine learning and NLP.",
+    "Built and deployed REST APIs with FastAPI, Docker and Kubernetes on AWS.",
+    "Reduced latency by 40% across 12 services.",
+    "Education BSc Computer Science",
+    "Managed a team of five engineers delivering a React front end "
+    "and a PostgreSQL-backed reporting service for enterprise customers. " * 20,  # > 256 tokens
+    "Skills: C++, C#, .NET, SQL, Git",
+    "x",
+]
+
+try:
+    reference = load_model("torch").encode(texts, convert_to_numpy=True)
+except ImportError as e:
+    print(f"⚠️ SKIPPED — torch backend unavailable ({e})")
+    sys.exit(SKIPPED)
+
+failures = 0
+skipped = []
+for variant, quantized in (("fp32", False), ("int8", True)):
+    config.EMBED_ONNX_QUANTIZED = quantized
+    try:
+        candidate = load_model("onnx").encode(texts, convert_to_numpy=True)
+    except (RuntimeError, FileNotFoundError) as e:
+        print(f"⚠️ {variant} SKIPPED — {e}")
+        skipped.append(variant)
+        continue
+
+    a = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    b = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+    cosines = (a * b).sum(axis=1)
+
+    # pairwise similarities should also agree (this is what scoring uses)
+    drift = np.abs(a @ a.T - b @ b.T).max() * 100
+
+    if cosines.min() < MIN_COSINE[variant]:
+        failures += 1
+        print(f"❌ {variant}: min cosine vs torch {cosines.min():.5f} < {MIN_COSINE[variant]}")
+    else:
+        print(f"✅ {variant}: min cosine vs torch {cosines.min():.5f}, "
+              f"mean {cosines.mean():.5f}, max score drift {drift:.2f} points")
+
+if failures:
+    sys.exit(1)
+if len(skipped) == len(MIN_COSINE):
+    print("\n⚠️ SKIPPED — no ONNX model to compare")
+    sys.exit(SKIPPED)
+if skipped:
+    print(f"\n✅ ONNX backend matches the torch backend (skipped: {', '.join(skipped)})")
+else:
+    print("\n✅ ONNX backend matches the torch backend!")
@@ -0,0 +1,66 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Benchmark')))
+
+from fastapi.testclient import TestClient
+
+import config
+import main
+from corpus import make_pdf
+from parser import PDF_BACKENDS, extract_pdf_text_auto, parse_document
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+pages = [[f"Page {n} Experience with Python and Docker, improved latency by {n}%"] * 10
+         for n in range(1, 31)]
+pdf_bytes = make_pdf(pages)
+
+full = parse_document(pdf_bytes, "long.pdf")
+check(full["page_count"] == 30 and full["pages_truncated"] == 0, "unbounded parse reads every page")
+
+by_pages = parse_document(pdf_bytes, "long.pdf", max_pages=5)
+check(by_pages["pages_truncated"] == 25, "page budget stops after 5 pages")
+check("Page 5 " in by_pages["raw_text"] and "Page 6 " not in by_pages["raw_text"],
+      "page budget keeps only the first pages")
+
+by_chars = parse_document(pdf_bytes, "long.pdf", max_chars=2000)
+check(len(by_chars["raw_text"]) <= 2000 and by_chars["pages_truncated"] > 0,
+      "character budget caps text and skips remaining pages")
+
+check(by_pages["clean_text"] == parse_document(pdf_bytes, "long.pdf", max_pages=5)["clean_text"],
+      "bounded parses are deterministic")
+
+if "fast" in PDF_BACKENDS:
+    fast = parse_document(pdf_bytes, "long.pdf", max_pages=5, pdf_backend="fast")
+    check(fast["clean_text"] == by_pages["clean_text"], "fast backend extracts the same text as pdfplumber")
+    check(fast["pages_truncated"] == 25, "fast backend honours the page budget")
+
+    auto = parse_document(pdf_bytes, "long.pdf", pdf_backend="auto")
+    check(auto["extractor"] == "fast", "auto mode keeps the fast path when it finds enough text")
+
+    _, used = extract_pdf_text_auto(make_pdf([[""]] * 3))
+    check(used == "pdfplumber", "auto mode falls back to pdfplumber when the fast path finds no text")
+
+client = TestClient(main.app)
+config.MAX_UPLOAD_BYTES = len(pdf_bytes) - 1
+response = client.post(
+    "/analyze",
+    files={"resume": ("long.pdf", pdf_bytes)},
+    data={"job_description": "Python developer with Docker and AWS experience"},
+)
+check(response.status_code == 413, "uploads over the byte limit are rejected with 413")
+
+if failures:
+    sys.exit(1)
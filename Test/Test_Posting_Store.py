@@ -0,0 +1,126 @@
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Benchmark')))
+
+from fastapi.testclient import TestClient
+
+import config
+import embedder
+import main
+from corpus import make_docx
+from posting_store import PostingStore
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+def brute_force(vectors: dict, query: np.ndarray, k: int) -> list:
+    q = query / np.linalg.norm(query)
+    scores = {pid: float(v @ q / np.linalg.norm(v)) for pid, v in vectors.items()}
+    return sorted(scores, key=scores.get, reverse=True)[:k]
+
+
+rng = np.random.default_rng(0)
+dim = 32
+
+with tempfile.TemporaryDirectory() as tmp:
+    store = PostingStore(tmp, dim=dim, initial_capacity=8)
+    vectors = {f"job-{i}": rng.normal(size=dim).astype(np.float32) for i in range(100)}
+    for pid, vector in vectors.items():
+        store.add(pid, vector, {"title": pid})
+    check(len(store) == 100, "store grows past its initial capacity")
+
+    query = rng.normal(size=dim)
+    top = [m["posting_id"] for m in store.search(query, k=5)]
+    check(top == brute_force(vectors, query, 5), "exact top-k matches brute force")
+
+    for pid in list(vectors)[:30]:
+        store.remove(pid)
+        del vectors[pid]
+    top = [m["posting_id"] for m in store.search(query, k=5)]
+    check(top == brute_force(vectors, query, 5), "removed postings never come back")
+
+    store.add("job-new", rng.normal(size=dim))
+    vectors["job-new"] = np.asarray(store._matrix[store._rows["job-new"]])
+    check(store._rows["job-new"] < 100, "freed rows are reused instead of growing")
+
+    store.flush()
+    reopened = PostingStore(tmp)
+    top = [m["posting_id"] for m in reopened.search(query, k=5)]
+    check(len(reopened) == len(vectors) and top == brute_force(vectors, query, 5),
+          "store survives a reopen")
+
+    # approximate index: recall against exact search
+    many = {f"p{i}": rng.normal(size=dim).astype(np.float32) for i in range(2000)}
+    for pid, vector in many.items():
+        reopened.add(pid, vector)
+    reopened.build_index(n_lists=20)
+    extra = rng.normal(size=dim).astype(np.float32)
+    reopened.add("late", extra)  # joins a cluster without a rebuild
+
+    recall = []
+    for _ in range(20):
+        q = rng.normal(size=dim)
+        exact = {m["posting_id"] for m in reopened.search(q, k=10, approximate=False)}
+        approx = {m["posting_id"] for m in reopened.search(q, k=10, approximate=True, nprobe=6)}
+        recall.append(len(exact & approx) / 10)
+    check(np.mean(recall) >= 0.6, f"approximate search recall@10 is {np.mean(recall):.2f}")
+    check(reopened.search(extra, k=1, approximate=True)[0]["posting_id"] == "late",
+          "postings added after build_index are searchable")
+
+    reopened.flush()
+    check(PostingStore(tmp).has_index, "approximate index is persisted")
+
+# API: postings and resumes are embedded by the same procedure
+# (a hashed bag of words stands in for the model, recording what it embeds)
+embedded = []
+
+
+def fake_embed_document(text: str) -> dict:
+    embedded.append(text)
+    vector = np.zeros(384, dtype=np.float32)
+    for word in text.lower().split():
+        vector[hash(word.strip(".,:")) % 384] += 1
+    return {"embedding": vector, "chunks": [], "chunk_embeddings": np.zeros((0, 384), dtype=np.float32)}
+
+
+def no_whole_text_embedding(text: str):
+    raise AssertionError("postings must be embedded like resumes")
+
+
+real_embed_document, real_generate_embedding = embedder.embed_document, embedder.generate_embedding
+embedder.embed_document, embedder.generate_embedding = fake_embed_document, no_whole_text_embedding
+docx = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+try:
+    with tempfile.TemporaryDirectory() as tmp:
+        config.POSTING_STORE_DIR = tmp
+        main._posting_store = None
+        with TestClient(main.app) as client:
+            ml = "Machine learning engineer: Python, PyTorch and Kubernetes on AWS."
+            web = "Front end developer: React, TypeScript and CSS for a design system."
+            added = [client.post("/postings", data={"posting_id": pid, "job_description": text}).status_code
+                     for pid, text in (("ml", ml), ("web", web))]
+            resume = make_docx(["EXPERIENCE", "Trained PyTorch models in Python on Kubernetes and AWS."])
+            matched = client.post("/postings/match", files={"resume": ("r.docx", resume, docx)}).json()
+        check(added == [200, 200] and embedded[:2] == [ml, web] and len(embedded) == 3,
+              "POST /postings and /postings/match both embed through embed_document")
+        check(matched["matches"][0]["posting_id"] == "ml", "the matching posting ranks first")
+        main._posting_store = None
+finally:
+    embedder.embed_document, embedder.generate_embedding = real_embed_document, real_generate_embedding
+
+if failures:
+    sys.exit(1)
@@ -0,0 +1,60 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from scorer import rank_chunks, top_bottom_k
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+def stable_sort_picks(scores: np.ndarray, k: int) -> tuple:
+    # what the original implementation returned: a full stable sort,
+    # highest first, then the first k and the last k
+    order = sorted(range(len(scores)), key=lambda i: -scores[i])
+    return order[:k], order[-k:]
+
+
+# tied scores: selection and order must not depend on argpartition internals
+scores = np.array([50.0, 80.0, 80.0, 10.0, 80.0, 10.0, 10.0, 50.0])
+top, bottom = top_bottom_k(scores, 2)
+check(top.tolist() == [1, 2] and bottom.tolist() == [5, 6],
+      "ties at the cut go to the earliest chunks (top) and the latest (bottom)")
+
+rng = np.random.default_rng(12)
+agree = True
+for _ in range(500):
+    n, k = int(rng.integers(1, 40)), int(rng.integers(1, 5))
+    scores = rng.integers(0, 5, size=n).astype(np.float64)  # lots of ties
+    top, bottom = top_bottom_k(scores, k)
+    expected_top, expected_bottom = stable_sort_picks(scores, k)
+    if top.tolist() != expected_top or bottom.tolist() != expected_bottom:
+        agree = False
+        print(f"   mismatch for {scores.tolist()}, k={k}")
+        break
+check(agree, "top / bottom k match a full stable sort on 500 tie-heavy score lists")
+
+# identical chunks score the same; all_chunks stays in document order
+job = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+chunks = np.array([[1, 1, 0], [1, 0, 0], [1, 0, 0], [0, 1, 0], [0, 1, 0], [1, 1, 0]], dtype=np.float32)
+texts = [f"chunk {i}" for i in range(len(chunks))]
+result = rank_chunks(chunks, job, texts)
+check([c["text"] for c in result["all_chunks"]] == texts, "all_chunks is in document order")
+check([c["text"] for c in result["most_relevant"]] == ["chunk 1", "chunk 2"]
+      and [c["text"] for c in result["least_relevant"]] == ["chunk 3", "chunk 4"],
+      "most / least relevant are deterministic with tied scores")
+
+if failures:
+    sys.exit(1)
+print("\n✅ Chunk ranking working correctly!")
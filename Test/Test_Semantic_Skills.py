@@ -0,0 +1,90 @@
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import config
+import embedder
+import semantic_skills
+from semantic_skills import extract_phrases, semantic_skills as find_semantic
+from taxonomy import get_taxonomy, scan_text
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+# stand-in model: synonyms share a vector, everything else gets its own
+# random direction (near-orthogonal in 384 dims)
+taxonomy = get_taxonomy()
+concepts = {pattern.lower(): taxonomy.skills[index].name
+            for pattern, index in zip(taxonomy.patterns, taxonomy.pattern_skills)}
+concepts.update({"container orchestration": "Kubernetes", "torch lightning": "PyTorch"})
+encoded = []
+
+
+def fake_encode(texts: list) -> np.ndarray:
+    encoded.extend(texts)
+    return np.array([
+        np.random.default_rng(sum(map(ord, concepts.get(t.lower(), t)))).normal(size=384)
+        for t in texts
+    ], dtype=np.float32)
+
+
+embedder.encode_texts = fake_encode
+config.SKILL_EMBEDDINGS_DIR = tempfile.mkdtemp()
+
+phrases = extract_phrases("Worked with the Torch Lightning framework, and deployed it on AWS.")
+check("Torch Lightning framework" in phrases and "AWS" in phrases,
+      f"phrases are split at punctuation and stop words: {phrases}")
+
+text = ("Container orchestration for 40 services. Trained models in Torch Lightning "
+        "and PyTorch Lightning. Deployed with Docker.")
+hits = scan_text(text)
+semantic_skills.get_skill_index()  # taxonomy matrix, encoded once up front
+encoded.clear()
+found = find_semantic(text, hits)
+
+check(set(found) == {"Kubernetes"} and "PyTorch" in hits.skills,
+      f"unaliased phrasing is matched semantically: {found}")
+check("Docker" not in found and "Docker" in hits.skills, "exact hits are not reported again")
+check(not any("Docker" in t or "PyTorch" in t for t in encoded),
+      "phrases with an exact hit are never embedded")
+check(found["Kubernetes"]["phrase"] == "Container orchestration", "each match records its phrase")
+
+encoded.clear()
+check(find_semantic("Docker, Kubernetes.", scan_text("Docker, Kubernetes.")) == {}
+      and encoded == [], "a fully exact-matched text costs no encode call")
+
+check(find_semantic(text, hits, threshold=1.01) == {}, "nothing clears an impossible threshold")
+
+# the taxonomy matrix is encoded once and then loaded from disk
+semantic_skills._index = None
+encoded.clear()
+semantic_skills.get_skill_index()
+check(not any(t in taxonomy.patterns for t in encoded), "taxonomy embeddings are reused from disk")
+
+# end to end through analyze_text
+from analysis import prepare_job, analyze_text, build_response
+
+config.SEMANTIC_SKILLS = True
+job = prepare_job("We need Kubernetes and Docker experience for our platform team.")
+results = analyze_text("Container orchestration with Docker for a platform team.", job)
+check("Kubernetes" in results["skills"]["matched_skills"], "semantic matches count toward the skill gap")
+response = build_response({"word_count": 9, "pages_truncated": 0}, results)
+check("Kubernetes" in response["semantic_skills"]["resume"], "responses report semantic matches")
+
+if failures:
+    print(f"\n❌ {failures} semantic skill check(s) failed")
+    sys.exit(1)
+print("\n✅ Semantic skill matching working correctly!")
@@ -3,6 +3,8 @@ import os
 import glob
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# backend modules import their siblings directly (as main.py does)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
 
 from Backend.parser import parse_document
 from Backend.skill_extractor import get_skill_gap
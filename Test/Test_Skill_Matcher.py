@@ -0,0 +1,95 @@
+import sys
+import os
+import random
+import re
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+from skill_extractor import extract_skills
+from taxonomy import get_taxonomy, scan_text
+
+ALL_SKILLS = [
+    {"name": skill.name, "patterns": [skill.name] + list(skill.aliases)}
+    for skill in get_taxonomy().skills
+]
+
+
+def legacy_extract_skills(text: str) -> list:
+    # the original per-alias regex loop, kept here as the reference
+    found = []
+    for skill_entry in ALL_SKILLS:
+        for pattern in skill_entry["patterns"]:
+            escaped = re.escape(pattern)
+            if " " in pattern:
+                flexible = r'\s+'.join(escaped.split(r'\ '))
+                regex = r'(?i)(?<!\w)' + flexible + r'(?!\w)'
+            else:
+                regex = r'(?i)\b' + escaped + r'\b'
+            if re.search(regex, text):
+                found.append(skill_entry["name"])
+                break
+    return sorted(found)
+
+
+def legacy_keyword_hits(text: str) -> list:
+    # the original ats_scorer Rule 1 loop over every name / alias
+    found = []
+    for skill_entry in ALL_SKILLS:
+        for pattern in skill_entry["patterns"]:
+            if re.search(r'\b' + re.escape(pattern) + r'\b', text, re.IGNORECASE):
+                found.append(pattern)
+    return found
+
+
+edge_cases = [
+    "Expert in C++ and C++17, some C language, CPP",
+    "Built APIs with ASP.NET and .NET Core, Node.js and node.JS",
+    "Styled with Tailwind\n   CSS and tailwindcss, React.js vs ReactNative",
+    "Machine\tLearning, deep-learning, Deep  Learning, MachineLearning",
+    "ſcala, Python3, python_dev, _python, (Python), Go/Golang, GO",
+    "Ruby on\nRails, RESTful API, REST APIs, Amazon Web Services",
+    "",
+]
+
+patterns = [p for skill in ALL_SKILLS for p in skill["patterns"]]
+fillers = ["and", "with", "experience", "-", "/", ".", ",", "(", ")", "+", "#",
+           "x", "2", "_", "years", "built", "teams"]
+separators = [" ", "  ", "\n", "\t", "", "-", ".", ", "]
+
+random.seed(7)
+random_cases = []
+for _ in range(2000):
+    parts = []
+    for _ in range(random.randint(1, 30)):
+        token = random.choice(patterns) if random.random() < 0.5 else random.choice(fillers)
+        if random.random() < 0.3:
+            token = token.upper() if random.random() < 0.5 else token.lower()
+        if " " in token and random.random() < 0.5:
+            token = token.replace(" ", random.choice(["  ", "\n", " \t "]))
+        parts.append(token)
+        parts.append(random.choice(separators))
+    random_cases.append("".join(parts))
+
+failures = 0
+for text in edge_cases + random_cases:
+    expected = legacy_extract_skills(text)
+    actual = extract_skills(text)
+    expected_keywords = legacy_keyword_hits(text)
+    actual_keywords = list(scan_text(text).keywords)
+    if expected_keywords != actual_keywords:
+        failures += 1
+        print(f"❌ Keyword mismatch for {text!r}")
+        print(f"   expected: {expected_keywords}")
+        print(f"   actual:   {actual_keywords}")
+    if expected != actual:
+        failures += 1
+        print(f"❌ Mismatch for {text!r}")
+        print(f"   expected: {expected}")
+        print(f"   actual:   {actual}")
+
+total = len(edge_cases) + len(random_cases)
+if failures:
+    print(f"❌ {failures} of {total} texts differ from the legacy matchers")
+    sys.exit(1)
+
+print(f"✅ Compiled matcher agrees with the legacy skill and keyword matchers on {total} texts")
@@ -0,0 +1,226 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Benchmark')))
+
+from fastapi.testclient import TestClient
+
+import config
+import taxonomy
+from analysis import analyze_skills, prepare_job
+from skill_extractor import get_skill_gap, job_skill_weights
+from taxonomy import RECENT_VERSIONS, TAXONOMY_PATH, TaxonomyManager, call_with_taxonomy, get_taxonomy
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+def write_taxonomy(path: str, extra_skill: str = None, reverse_categories: bool = False):
+    with open(TAXONOMY_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    if reverse_categories:
+        data["technical_skills_taxonomy"] = dict(reversed(data["technical_skills_taxonomy"].items()))
+    if extra_skill:
+        category = next(iter(data["technical_skills_taxonomy"].values()))
+        category["skills"].append({"name": extra_skill, "aliases": []})
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(path + ".tmp", path)  # editors / deploys swap the file in one step
+
+
+def worker_version() -> str:
+    return get_taxonomy().version
+
+
+if __name__ == "__main__":
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "skills.json")
+    shutil.copy(TAXONOMY_PATH, path)
+
+    # -----------------------------
+    # reload / swap
+    # -----------------------------
+    manager = TaxonomyManager(path)
+    original = manager.current
+    report = manager.reload()
+    check(not report["changed"] and manager.current is original, "reloading an unchanged file keeps the same taxonomy")
+
+    write_taxonomy(path, "Zig")
+    report = manager.reload()
+    check(report["changed"] and report["previous_version"] == original.version
+          and manager.current.version == report["version"] != original.version,
+          f"an edited file is swapped in with a new version ({report['compile_ms']} ms)")
+    check(report["matcher_bytes"] > 0 and manager.stats()["reloads"] == 1,
+          f"reload reports the compiled size ({report['matcher_bytes']:,} bytes)")
+    check("Zig" in manager.current.scan("Systems work in Zig").skills
+          and "Zig" not in original.scan("Systems work in Zig").skills,
+          "new skills are found; a held old taxonomy keeps working unchanged")
+
+    current = manager.current
+    with open(path, "w") as f:
+        f.write("{ not json")
+    try:
+        manager.reload()
+        raised = False
+    except ValueError:
+        raised = True
+    check(raised and manager.current is current, "a broken file raises ValueError and keeps the current taxonomy")
+    check(not manager.changed_on_disk(), "a broken file isn't retried until it changes again")
+
+    # the watcher picks up edits by itself
+    manager.start_watching(0.05)
+    write_taxonomy(path, "Elixir")
+    deadline = time.time() + 5
+    while time.time() < deadline and "Elixir" not in manager.current.by_name:
+        time.sleep(0.02)
+    check("Elixir" in manager.current.by_name, "the file watcher reloads an edited file")
+    manager.stop_watching()
+    check(not manager.stats()["watching"], "the watcher stops")
+
+    # scanning never blocks or breaks while reloads swap versions
+    errors = []
+    scans = [0]
+    stop = threading.Event()
+
+    def scan_loop():
+        while not stop.is_set():
+            try:
+                hits = manager.current.scan("Python, Docker, Kubernetes and Zig")
+                assert {"Python", "Docker", "Kubernetes"} <= set(hits.skills)
+                scans[0] += 1
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=scan_loop) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(30):
+        write_taxonomy(path, f"Skill{i}")
+        manager.reload()
+    stop.set()
+    for thread in threads:
+        thread.join()
+    check(not errors and scans[0] > 0 and manager.stats()["reloads"] == 32,
+          f"{scans[0]} scans ran during 30 reloads without errors")
+
+    # -----------------------------
+    # executor processes follow the parent's version
+    # -----------------------------
+    global_manager = taxonomy.get_taxonomy_manager()
+    global_manager.path = path
+    global_manager.reload()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        before = pool.submit(call_with_taxonomy, get_taxonomy().version, worker_version).result()
+        write_taxonomy(path, "Nim")
+        global_manager.reload()
+        after = pool.submit(call_with_taxonomy, get_taxonomy().version, worker_version).result()
+    check(before != after == get_taxonomy().version, "a worker process reloads to the parent's new version")
+
+    # -----------------------------
+    # a job prepared before a reload
+    # -----------------------------
+    write_taxonomy(path)
+    global_manager.reload()
+    resume_text = "Python and Docker services, a React front end, some SQL"
+    job = prepare_job("Hiring: Python, Kubernetes, React, SQL and Machine Learning experience")
+    prepared = analyze_skills(resume_text, job)
+    check(job.taxonomy_version == get_taxonomy().version and 0 < prepared["weighted_skill_match_percent"] < 100,
+          f"prepare_job records its taxonomy version ({prepared['weighted_skill_match_percent']}% weighted)")
+
+    write_taxonomy(path, "Zig")  # one more skill: a longer weight vector
+    global_manager.reload()
+    grown = analyze_skills(resume_text, job)
+    write_taxonomy(path, reverse_categories=True)  # same skills, new vector order
+    global_manager.reload()
+    reordered = analyze_skills(resume_text, job)
+    check(grown == reordered == prepared and reordered["taxonomy_version"] == job.taxonomy_version,
+          "after a reload (skill added / categories reordered) the job finishes on its own version")
+
+    for i in range(RECENT_VERSIONS):
+        write_taxonomy(path, f"Later{i}")
+        global_manager.reload()
+    live = get_taxonomy()
+    fallback = analyze_skills(resume_text, job)
+    expected = get_skill_gap(resume_text, job.text, taxonomy=live)
+    check(fallback["taxonomy_version"] == live.version
+          and fallback["weighted_skill_match_percent"] == expected["weighted_skill_match_percent"],
+          "once its version is gone, the JD's weights are redone for the live taxonomy")
+
+    try:
+        get_skill_gap(resume_text, job.text, job_weights=job.skill_weights, taxonomy=live)
+        raised = False
+    except ValueError:
+        raised = True
+    check(raised and len(job_skill_weights(job.skills, live)) == len(live),
+          "weights from another taxonomy size are refused with a ValueError")
+
+    # -----------------------------
+    # API
+    # -----------------------------
+    import main
+    from corpus import make_docx
+
+    resume = make_docx([
+        "SUMMARY", "Backend engineer building services in Python, Nim and Crystal.",
+        "EXPERIENCE", "Improved deployment time by 40% by moving every service to Docker.",
+        "SKILLS", "Python, Docker, Nim, Crystal, PostgreSQL",
+    ])
+    docx = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    jd = "We need Python, Docker, Nim and Crystal engineers."
+
+    with TestClient(main.app) as client:
+        first = client.post("/analyze", data={"job_description": jd},
+                            files={"resume": ("r.docx", resume, docx)}).json()
+        check(first["taxonomy_version"] == get_taxonomy().version and "Crystal" not in first["matched_skills"],
+              "/analyze reports the taxonomy version")
+
+        write_taxonomy(path, "Crystal")
+        config.ADMIN_TOKEN = "secret"
+        try:
+            denied = client.post("/admin/taxonomy/reload")
+            reloaded = client.post("/admin/taxonomy/reload", headers={"X-Admin-Token": "secret"})
+        finally:
+            config.ADMIN_TOKEN = ""
+        check(denied.status_code == 403 and reloaded.json()["changed"],
+              "POST /admin/taxonomy/reload swaps in the edit (admin token enforced)")
+
+        second = client.post("/analyze", data={"job_description": jd},
+                             files={"resume": ("r.docx", resume, docx)}).json()
+        check(second["taxonomy_version"] == reloaded.json()["version"] != first["taxonomy_version"]
+              and "Crystal" in second["matched_skills"],
+              "the next /analyze misses the old cached result and uses the new skills")
+
+        stats = client.get("/taxonomy").json()
+        check(stats["version"] == second["taxonomy_version"] and stats["last_reload"]["compile_ms"] >= 0,
+              "GET /taxonomy reports version, size and the last reload")
+        check(f'resumeiq_taxonomy_info{{version="{stats["version"]}"}} 1' in client.get("/metrics").text,
+              "/metrics exposes the taxonomy version")
+
+        with open(path, "w") as f:
+            f.write("[]")
+        check(client.post("/admin/taxonomy/reload").status_code == 400
+              and client.get("/taxonomy").json()["version"] == stats["version"],
+              "a bad file is a 400 and the service keeps its taxonomy")
+
+    global_manager.path = TAXONOMY_PATH
+    global_manager.reload()
+    shutil.rmtree(tmp)
+
+    if failures:
+        sys.exit(1)
+    print("\n✅ Taxonomy hot reload working correctly!")
@@ -0,0 +1,89 @@
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
+
+import config
+from analysis import analyze_text, prepare_job, result_key
+from skill_extractor import get_skill_gap, job_skill_weights, weighted_coverage
+from taxonomy import get_taxonomy
+
+failures = 0
+
+
+def check(condition: bool, message: str):
+    global failures
+    if condition:
+        print(f"✅ {message}")
+    else:
+        failures += 1
+        print(f"❌ {message}")
+
+
+def brute_force(resume_skills: set, job_skills: set) -> float:
+    # category weights summed skill by skill
+    weight = {skill.name: skill.weight for skill in get_taxonomy().skills}
+    total = sum(weight[s] for s in job_skills)
+    if not total:
+        return 0.0
+    return round(sum(weight[s] for s in job_skills & resume_skills) / total * 100, 2)
+
+
+taxonomy = get_taxonomy()
+skills = [skill.name for skill in taxonomy.skills]
+rng = random.Random(24)
+
+check(len(set(taxonomy.category_weights.values())) > 1, "skills.json has more than one category weight")
+
+vector = taxonomy.vector(["Python", "Docker", "Not A Skill"])
+check(vector.dtype == bool and vector.sum() == 2 and vector[taxonomy.index_of["Python"]],
+      "presence vectors follow taxonomy order and ignore unknown names")
+check(not taxonomy.weights.flags.writeable, "the shared weight vector is read-only")
+
+# vectorized coverage vs brute force, one resume and a whole batch
+resumes = [set(rng.sample(skills, rng.randint(0, 25))) for _ in range(500)]
+job = set(rng.sample(skills, 12))
+job_weights = job_skill_weights(job)
+expected = [brute_force(r, job) for r in resumes]
+batch = weighted_coverage(taxonomy.matrix(resumes), job_weights)
+check(batch.tolist() == expected, "batch coverage (one matrix product) matches brute force on 500 resumes")
+
+single = [float(weighted_coverage(taxonomy.vector(r)[None, :], job_weights)[0]) for r in resumes]
+check(single == expected, "single-resume coverage matches the batch")
+
+check(weighted_coverage(taxonomy.matrix(resumes[:3]), job_skill_weights([])).tolist() == [0.0] * 3,
+      "a JD without skills has zero coverage")
+
+# get_skill_gap reports both percentages
+resume_text = "Python and Docker on AWS, some React"
+job_text = "Looking for Python, Kubernetes, AWS and React experience"
+gap = get_skill_gap(resume_text, job_text)
+check(gap["weighted_skill_match_percent"] == brute_force(set(gap["resume_skills"]), set(gap["job_skills"])),
+      f"get_skill_gap weighted coverage: {gap['weighted_skill_match_percent']} "
+      f"(flat {gap['skill_match_percent']})")
+
+uniform = np.ones(len(skills)) * taxonomy.vector(gap["job_skills"])
+check(float(weighted_coverage(taxonomy.vector(gap["resume_skills"])[None, :], uniform)[0])
+      == gap["skill_match_percent"], "equal weights reduce to the flat percentage")
+
+# the ATS skill component follows WEIGHTED_SKILL_SCORE
+prepared = prepare_job(job_text)
+flat = analyze_text(resume_text, prepared)
+flat_key = result_key("resume", job_text)
+config.WEIGHTED_SKILL_SCORE = True
+try:
+    weighted = analyze_text(resume_text, prepared)
+    weighted_key = result_key("resume", job_text)
+finally:
+    config.WEIGHTED_SKILL_SCORE = False
+check(flat["ats"]["breakdown"]["skill_coverage"]["score"] == gap["skill_match_percent"]
+      and weighted["ats"]["breakdown"]["skill_coverage"]["score"] == gap["weighted_skill_match_percent"],
+      "WEIGHTED_SKILL_SCORE switches the ATS skill component")
+check(flat_key != weighted_key, "weighted scoring gets its own result cache key")
+
+if failures:
+    sys.exit(1)
+print("\n✅ Weighted skill coverage working correctly!")
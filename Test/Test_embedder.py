@@ -3,6 +3,8 @@ import os
 import glob
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# backend modules import their siblings directly (as main.py does)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend')))
 
 from Backend.parser import parse_document
 from Backend.embedder import embed_resume_and_job
@@ -32,7 +34,7 @@ embeddings = embed_resume_and_job(resume_text, job_description)
 print(f"\n📊 Results:")
 print(f"Resume embedding shape: {embeddings['resume_embedding'].shape}")
 print(f"Job embedding shape: {embeddings['job_embedding'].shape}")
-print(f"Number of chunks: {len(embeddings['chunk_embeddings'])}")
-print(f"First chunk preview: {embeddings['chunk_embeddings'][0]['chunk_text'][:100]}")
-print(f"Chunk embedding shape: {embeddings['chunk_embeddings'][0]['embedding'].shape}")
+print(f"Number of chunks: {len(embeddings['chunk_texts'])}")
+print(f"First chunk preview: {embeddings['chunk_texts'][0][:100]}")
+print(f"Chunk embeddings shape: {embeddings['chunk_embeddings'].shape}")
 print("\n✅ Embedder working correctly!")
\ No newline at end of file